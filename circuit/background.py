@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SimulationWorker:
+    """
+    Runs simulations off the pyglet thread so the interactive scene
+    never blocks on Aer or the statevector engine.
+
+    Each job occupies a named slot (i.e. one displayed distribution).
+    Submitting to a busy slot supersedes the job already there, and a
+    circuit edit supersedes every job in flight. Superseded jobs still
+    queued are cancelled, so stale simulations never run ahead of the
+    latest one; a superseded job already running is left to finish, its
+    stale result dropped and the latest job for that slot re-run against
+    the edited circuit. Results are handed back on the scene thread
+    through `poll`, which the scene calls every frame.
+
+    """
+
+    def __init__(self, max_workers=1):
+        """
+        Args:
+            max_workers (int): Number of simulation threads.
+
+        """
+        self.executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='maniq-simulation',
+        )
+        # Bumped on every circuit edit
+        self.generation = 0
+        # slot -> (future, generation, compute, on_result)
+        self.jobs = {}
+
+    def submit(self, slot, compute, on_result):
+        """
+        Runs `compute()` in the background.
+
+        Args:
+            slot (str): Name of the job slot. Replaces any job in that slot.
+            compute (callable): The simulation, run on a worker thread.
+            on_result (callable): Receives the result on the scene thread.
+                                  Should build/swap in the mobjects.
+
+        Returns:
+            The concurrent.futures.Future of the simulation.
+
+        """
+        replaced = self.jobs.get(slot)
+        if replaced is not None:
+            # Only stops it if still queued; a running job finishes unseen
+            replaced[0].cancel()
+
+        future = self.executor.submit(compute)
+        self.jobs[slot] = (future, self.generation, compute, on_result)
+        return future
+
+    def supersede(self):
+        """
+        Marks every in-flight result as stale, i.e. after a circuit edit,
+        and cancels the jobs not started yet. `poll` re-runs them.
+
+        """
+        self.generation += 1
+        for future, _, _, _ in self.jobs.values():
+            future.cancel()
+        return
+
+    def poll(self):
+        """
+        Hands finished results to their callbacks. Must run on the
+        scene thread; intended as a scene updater.
+
+        """
+        for slot, (future, generation, compute, on_result) in list(self.jobs.items()):
+            if not future.done():
+                continue
+            del self.jobs[slot]
+
+            # Circuit was edited while simulating -- recompute instead
+            if generation != self.generation:
+                self.submit(slot, compute, on_result)
+                continue
+            if future.cancelled():
+                continue
+
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f'Simulation {slot} failed -- {e}')
+                continue
+            on_result(result)
+        return
+
+    @property
+    def busy(self):
+        return bool(self.jobs)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.jobs.clear()
+        return
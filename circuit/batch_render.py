@@ -0,0 +1,151 @@
+"""
+Batch renderer for directories of circuits.
+
+Renders every OpenQASM 2 file (.qasm) or pickled QuantumCircuit
+(.pkl/.pickle) in a directory to a still image or a video with the
+Cairo renderer, across a pool of worker processes. Each worker imports
+manim and qiskit once and keeps its glyph cache warm across circuits.
+
+    python batch_render.py circuits/ --output renders/ --format png --workers 32
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import argparse
+import os
+import pickle
+import sys
+import time
+
+from manim import DrawBorderThenFill, config, tempconfig
+
+from main import ManiQCircuit
+from gates import GLYPH_CACHE
+
+
+CIRCUIT_SUFFIXES = ('.qasm', '.pkl', '.pickle')
+
+
+class BatchCircuitScene(ManiQCircuit):
+    """
+    Non-interactive ManiQCircuit scene: assembles `self.qc` and either
+    draws it in (video) or simply adds it (still).
+
+    """
+
+    draw_in = False
+    verbose = False
+
+    def construct(self):
+        self.assemble()
+        if self.draw_in:
+            self.play(DrawBorderThenFill(self.circuit))
+        else:
+            self.add(self.circuit)
+        return
+
+
+def load_circuit(path):
+    """
+    Loads a QuantumCircuit from an OpenQASM 2 file or a pickle.
+
+    """
+    if path.endswith('.qasm'):
+        from qiskit import QuantumCircuit
+        return QuantumCircuit.from_qasm_file(path)
+
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def init_worker():
+    """
+    Runs once per worker process: headless Cairo config.
+
+    """
+    config.renderer = 'cairo'
+    config.preview = False
+    return
+
+
+def render_circuit(path, output_dir, fmt):
+    """
+    Renders a single circuit file.
+
+    Args:
+        path (str): Absolute path of the circuit file.
+        output_dir (str): Absolute media directory for the renders.
+        fmt (str): 'png' for a still of the assembled circuit,
+                   'mp4' for a video of it being drawn.
+
+    Returns:
+        (path, seconds, glyph cache stats) for progress reporting.
+
+    """
+    start = time.perf_counter()
+    name = os.path.splitext(os.path.basename(path))[0]
+
+    scene_config = {
+        'media_dir': output_dir,
+        'output_file': name,
+        'write_to_movie': fmt == 'mp4',
+        'save_last_frame': fmt == 'png',
+    }
+    with tempconfig(scene_config):
+        scene = BatchCircuitScene()
+        scene.qc = load_circuit(path)
+        scene.draw_in = fmt == 'mp4'
+        scene.render()
+
+    return path, time.perf_counter() - start, GLYPH_CACHE.stats()
+
+
+def find_circuits(directory):
+    return sorted(
+        os.path.abspath(os.path.join(directory, file))
+        for file in os.listdir(directory)
+        if file.endswith(CIRCUIT_SUFFIXES)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('directory', help='Directory of .qasm/.pkl circuit files.')
+    parser.add_argument('--output', default='media', help='Media directory for renders.')
+    parser.add_argument('--format', choices=('png', 'mp4'), default='png')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    paths = find_circuits(args.directory)
+    output_dir = os.path.abspath(args.output)
+
+    start = time.perf_counter()
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as pool:
+        futures = {
+            pool.submit(render_circuit, path, output_dir, args.format): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                path, seconds, glyph_stats = future.result()
+            except Exception as e:
+                failures += 1
+                print(f'FAILED {futures[future]}: {e}', file=sys.stderr)
+                continue
+            print(
+                f"{os.path.basename(path)}: {seconds:.2f}s "
+                f"(glyph hit rate {glyph_stats['hit_rate']:.0%})"
+            )
+
+    elapsed = time.perf_counter() - start
+    print(
+        f'Rendered {len(paths) - failures}/{len(paths)} circuits in {elapsed:.1f}s '
+        f'with {args.workers} workers.'
+    )
+    return
+
+
+if __name__ == '__main__':
+    main()
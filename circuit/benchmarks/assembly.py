@@ -0,0 +1,194 @@
+"""
+Headless benchmark suite for ManiQCircuit assembly.
+
+Times sort_instructions, decompose, build_circuit and the scaling step
+on seeded random circuits with the Cairo renderer, so no pyglet window
+is opened. Reports time and peak memory per phase as JSON, together with
+a summary of `python -X importtime -c "import main"` run in a fresh
+interpreter.
+
+Run from the `circuit` directory:
+
+    python -m benchmarks.assembly --qubits 2 5 10 20 30 --depths 10 100 1000
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from manim import config
+
+# Importing main applies its interactive OpenGL preview config,
+# which is overridden below before any scene is created
+from main import ManiQCircuit
+from random_circuit import random_circuit
+
+
+PHASES = ('sort_instructions', 'decompose', 'build_circuit', 'scale_circuit')
+
+# Directory main.py is imported from
+CIRCUIT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def headless_config():
+    """
+    Renders offscreen: Cairo renderer, no preview window, no movie files.
+
+    """
+    config.renderer = 'cairo'
+    config.preview = False
+    config.write_to_movie = False
+    config.save_last_frame = False
+    return
+
+
+def run_phases(qc, measure_memory=False, cull_columns=False):
+    """
+    Runs each assembly phase once on a fresh ManiQCircuit.
+
+    Args:
+        qc (qiskit QuantumCircuit): Circuit to assemble.
+        measure_memory (bool): Record the peak traced memory of each phase
+                               instead of wall-clock time. Tracing slows
+                               the phases down, so the two are measured
+                               in separate runs.
+        cull_columns (bool): Only build the columns in the camera frame.
+
+    Returns:
+        Dictionary mapping phase name to seconds, or peak bytes.
+
+    """
+    scene = ManiQCircuit()
+    scene.qc = qc
+    scene.cull_columns = cull_columns
+
+    results = {}
+    for phase in PHASES:
+        method = getattr(scene, phase)
+        if measure_memory:
+            tracemalloc.start()
+            method()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results[phase] = peak
+        else:
+            start = time.perf_counter()
+            method()
+            results[phase] = time.perf_counter() - start
+    return results
+
+
+def import_time_report(module='main', top=15):
+    """
+    Imports `module` in a fresh interpreter under `-X importtime` and
+    summarises the per-module import times it prints to stderr.
+
+    Args:
+        module (str): Module to import, relative to the circuit directory.
+        top (int): Number of top-level packages to report.
+
+    Returns:
+        Dictionary with the wall-clock and total import time, and the
+        slowest top-level packages by the summed self time of their modules.
+
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=CIRCUIT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    wall_time = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f'import {module} failed:\n{result.stderr}')
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    packages = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        'module': module,
+        'wall_time_s': wall_time,
+        'total_import_s': total_us / 1e6,
+        'packages': {package: self_us / 1e6 for package, self_us in slowest},
+    }
+
+
+def bench_assembly(num_qubits, depth, seed=0, cull_columns=False):
+    qc = random_circuit(num_qubits, depth, measure=True, seed=seed)
+
+    timings = run_phases(qc, cull_columns=cull_columns)
+    peaks = run_phases(qc, measure_memory=True, cull_columns=cull_columns)
+
+    return {
+        'num_qubits': num_qubits,
+        'depth': depth,
+        'seed': seed,
+        'cull_columns': cull_columns,
+        'instructions': len(qc.data),
+        'phases': {
+            phase: {'time_s': timings[phase], 'peak_bytes': peaks[phase]}
+            for phase in PHASES
+        },
+        'total_time_s': sum(timings.values()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--qubits', type=int, nargs='+', default=[2, 5, 10, 20, 30])
+    parser.add_argument('--depths', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cull', action='store_true',
+                        help='Only build the columns in view (ManiQCircuit.cull_columns).')
+    parser.add_argument('--skip-import-time', action='store_true',
+                        help='Do not report the import time of main.')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Write the JSON report here instead of stdout.')
+    args = parser.parse_args()
+
+    headless_config()
+
+    report = {'import_time': None, 'assembly': []}
+    if not args.skip_import_time:
+        report['import_time'] = import_time_report()
+        print(
+            f"import main: {report['import_time']['wall_time_s']:.3f}s",
+            file=sys.stderr,
+        )
+
+    for num_qubits in args.qubits:
+        for depth in args.depths:
+            result = bench_assembly(num_qubits, depth, seed=args.seed, cull_columns=args.cull)
+            report['assembly'].append(result)
+            print(
+                f"{num_qubits:>3} qubits, depth {depth:>5}: "
+                f"{result['total_time_s']:.3f}s",
+                file=sys.stderr,
+            )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return
+
+
+if __name__ == '__main__':
+    main()
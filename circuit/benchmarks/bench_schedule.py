@@ -0,0 +1,66 @@
+"""
+Benchmark for scheduler.schedule_instructions on large random circuits.
+
+Run from the `circuit` directory:
+
+    python -m benchmarks.bench_schedule --instructions 100000
+
+"""
+
+import argparse
+import json
+import time
+
+from random_circuit import random_circuit
+from scheduler import schedule_instructions
+
+
+def random_circuit_with_instructions(num_qubits, num_instructions, seed=0):
+    """
+    Generates a seeded random circuit with at least `num_instructions`.
+    Each random_circuit layer holds between num_qubits/3 and num_qubits gates.
+
+    """
+    depth = 1
+    while True:
+        qc = random_circuit(num_qubits, depth, measure=True, seed=seed)
+        if len(qc.data) >= num_instructions:
+            return qc
+        # Grow depth proportionally to the instructions still missing
+        per_layer = max(len(qc.data) / depth, 1)
+        depth += max(int((num_instructions - len(qc.data)) / per_layer) + 1, 1)
+
+
+def bench_schedule(num_qubits, num_instructions, repeats=5, seed=0):
+    qc = random_circuit_with_instructions(num_qubits, num_instructions, seed=seed)
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        sorted_instructions = schedule_instructions(qc)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'num_qubits': num_qubits,
+        'instructions': len(qc.data),
+        'columns': sorted_instructions[-1][0] + 1 if sorted_instructions else 0,
+        'best_s': min(timings),
+        'mean_s': sum(timings) / len(timings),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--qubits', type=int, default=20)
+    parser.add_argument('--instructions', type=int, default=100_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = bench_schedule(args.qubits, args.instructions, args.repeats, args.seed)
+    print(json.dumps(result, indent=2))
+    return
+
+
+if __name__ == '__main__':
+    main()
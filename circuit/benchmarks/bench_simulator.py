@@ -0,0 +1,89 @@
+"""
+Benchmark of the numpy statevector simulator against Aer.
+
+Both simulate the same seeded random circuits (measurements removed)
+end to end, as QiskitCalculations does: Aer timings include getting the
+backend, transpiling and running the job. Each result is checked to
+match Aer's statevector.
+
+Run from the `circuit` directory:
+
+    python -m benchmarks.bench_simulator --qubits 1 20 --depth 20
+
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from random_circuit import random_circuit
+from qiskit_functions.numpy_simulator import simulate_statevector
+
+
+def simulate_aer(qc):
+    from qiskit import transpile
+    from qiskit_aer import Aer
+
+    simulator = Aer.get_backend('statevector_simulator')
+    # Same settings as QiskitCalculations.simulate_aer
+    transpiled_qc = transpile(qc, simulator, optimization_level=0)
+    return np.asarray(simulator.run(transpiled_qc).result().get_statevector(transpiled_qc))
+
+
+def best_time(simulate, qc, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = simulate(qc)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def bench_simulator(num_qubits, depth, repeats=3, seed=0):
+    qc = random_circuit(num_qubits, depth, seed=seed)
+
+    numpy_s, numpy_sv = best_time(simulate_statevector, qc, repeats)
+    aer_s, aer_sv = best_time(simulate_aer, qc, repeats)
+
+    return {
+        'num_qubits': num_qubits,
+        'depth': depth,
+        'instructions': len(qc.data),
+        'numpy_s': numpy_s,
+        'aer_s': aer_s,
+        'speedup': aer_s / numpy_s,
+        'fidelity': float(abs(np.vdot(aer_sv, numpy_sv))**2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--qubits', type=int, nargs=2, default=[1, 20],
+                        metavar=('MIN', 'MAX'), help='Inclusive qubit range.')
+    parser.add_argument('--depth', type=int, default=20)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Import and backend start-up are not counted against either simulator
+    simulate_aer(random_circuit(1, 1, seed=args.seed))
+
+    report = []
+    for num_qubits in range(args.qubits[0], args.qubits[1]+1):
+        result = bench_simulator(num_qubits, args.depth, args.repeats, args.seed)
+        report.append(result)
+        print(
+            f"{num_qubits:>3} qubits: numpy {result['numpy_s']*1e3:8.2f}ms, "
+            f"aer {result['aer_s']*1e3:8.2f}ms ({result['speedup']:.1f}x)",
+            file=sys.stderr,
+        )
+
+    print(json.dumps(report, indent=2))
+    return
+
+
+if __name__ == '__main__':
+    main()
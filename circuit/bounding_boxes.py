@@ -0,0 +1,153 @@
+import numpy as np
+
+
+def measure_bbox(mobject):
+    """
+    Bounding box of a mobject and its family, np.array([lower_left, upper_right]).
+    Reduces each family member's points in turn instead of stacking them.
+
+    Returns:
+        The bounding box, or None if the mobject has no points.
+
+    """
+    lower, upper = None, None
+    for sub in mobject.family_members_with_points():
+        points = sub.points
+        if lower is None:
+            lower, upper = points.min(axis=0), points.max(axis=0)
+        else:
+            lower = np.minimum(lower, points.min(axis=0))
+            upper = np.maximum(upper, points.max(axis=0))
+
+    if lower is None:
+        return None
+    return np.array([lower, upper])
+
+
+class BoundingBoxes:
+    """
+    Cached bounding boxes of the gate mobjects, plus the circuit's as
+    their union.
+
+    Each gate is measured once, when it is placed. Transforms applied to
+    the whole circuit (shifts and uniform scales) are mirrored on the
+    cached corners, so no gate points are walked again. Gates that moved
+    on their own are invalidated and re-measured lazily on next access.
+
+    """
+
+    def __init__(self, mobjects):
+        """
+        Args:
+            mobjects (dict): gate_id -> gate mobject, i.e. the scene's
+                             gate_references.
+
+        """
+        self.mobjects = mobjects
+
+        # gate_id -> np.array([lower_left, upper_right])
+        self.boxes = {}
+        # gate_ids whose mobjects moved since they were measured
+        self.stale = set()
+        # Union of every box, recomputed on first use after a change
+        self._union = None
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def __contains__(self, gate_id):
+        return gate_id in self.boxes
+
+    def __getitem__(self, gate_id):
+        if gate_id in self.stale:
+            self.stale.discard(gate_id)
+            self.add(gate_id)
+        return self.boxes[gate_id]
+
+    def add(self, gate_id):
+        """
+        Measures and caches the bounding box of a placed gate.
+
+        """
+        self.boxes[gate_id] = measure_bbox(self.mobjects[gate_id])
+        self._union = None
+        return
+
+    def remove(self, gate_id):
+        """
+        Drops a gate. Unknown gate_ids are ignored.
+
+        """
+        self.boxes.pop(gate_id, None)
+        self.stale.discard(gate_id)
+        self._union = None
+        return
+
+    def invalidate(self, *gate_ids):
+        """
+        Marks gates whose mobjects moved on their own.
+
+        """
+        self.stale.update(gate_id for gate_id in gate_ids if gate_id in self.boxes)
+        if self.stale:
+            self._union = None
+        return
+
+    def union(self, gate_ids=None):
+        """
+        Bounding box around the gates in `gate_ids`, or around every gate
+        (cached until a gate is added, removed or invalidated).
+
+        Returns:
+            np.array([lower_left, upper_right]), or None if there are no gates.
+
+        """
+        if gate_ids is None:
+            if self._union is None:
+                self._union = self._bound(self.boxes)
+            return self._union
+        return self._bound([gate_id for gate_id in gate_ids if gate_id in self.boxes])
+
+    def _bound(self, gate_ids):
+        if not gate_ids:
+            return None
+        boxes = np.stack([self[gate_id] for gate_id in gate_ids])
+        return np.array([boxes[:, 0].min(axis=0), boxes[:, 1].max(axis=0)])
+
+    def center(self):
+        return self.union().mean(axis=0)
+
+    def width(self):
+        union = self.union()
+        return union[1][0]-union[0][0]
+
+    def height(self):
+        union = self.union()
+        return union[1][1]-union[0][1]
+
+    def shift(self, vector):
+        """
+        Mirrors `Mobject.shift(vector)` applied to every gate.
+
+        """
+        vector = np.asarray(vector, dtype=float)
+        for box in self.boxes.values():
+            box += vector
+        if self._union is not None:
+            self._union = self._union+vector
+        return
+
+    def scale(self, factor, about_point):
+        """
+        Mirrors `Mobject.scale(factor, about_point=about_point)` applied
+        to every gate, for a positive `factor`.
+
+        """
+        about_point = np.asarray(about_point, dtype=float)
+        for box in self.boxes.values():
+            box -= about_point
+            box *= factor
+            box += about_point
+        if self._union is not None:
+            self._union = (self._union-about_point)*factor+about_point
+        return
@@ -0,0 +1,286 @@
+import numpy as np
+
+
+# Gate categories from gates.yaml, stored per gate as an int8 code
+CATEGORIES = (
+    'single_qubit_gate',
+    'cx_like_gate',
+    'cphase_gate',
+    'general_controlled_gate',
+    'multi_qubit_gate',
+    'multi_controlled_gate',
+    'measure',
+)
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+# Code for operations missing from gates.yaml
+UNKNOWN_CATEGORY = -1
+
+
+def _ragged(rows, dtype):
+    """
+    Packs a list of lists into CSR-style (offsets, values) arrays.
+
+    """
+    counts = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    offsets = np.zeros(len(rows)+1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    values = np.fromiter(
+        (value for row in rows for value in row),
+        dtype=dtype,
+        count=int(offsets[-1]),
+    )
+    return offsets, values
+
+
+def _take_ragged(offsets, values, keep):
+    """
+    Filters CSR-style (offsets, values) arrays with a boolean row mask.
+
+    """
+    counts = np.diff(offsets)
+    new_offsets = np.zeros(int(keep.sum())+1, dtype=np.int64)
+    np.cumsum(counts[keep], out=new_offsets[1:])
+    return new_offsets, values[np.repeat(keep, counts)]
+
+
+class CircuitTable:
+    """
+    Compact struct-of-arrays representation of a decomposed circuit.
+
+    One entry per gate, sorted by layout column. Fixed-width columns are
+    numpy arrays; the variable-length qubits, clbits and params of each
+    gate are stored CSR-style as a flat value array plus an offset array,
+    so gate i acts on `qbits[qbit_offsets[i]:qbit_offsets[i+1]]`.
+
+    Per-gate-type information (qiskit name, latex label, color) is stored
+    once per distinct operation and referenced through `name_idxs`.
+
+    """
+
+    def __init__(self, start_times, category_codes, name_idxs, gate_types,
+                 qbit_offsets, qbits, cbit_offsets, cbits, param_offsets, params):
+        """
+        Args:
+            start_times (np.ndarray): Layout column of each gate.
+            category_codes (np.ndarray): Index into CATEGORIES for each gate.
+            name_idxs (np.ndarray): Index into `gate_types` for each gate.
+            gate_types (list): Distinct (qiskit_name, latex, color) tuples.
+            qbit_offsets, qbits (np.ndarray): CSR qubit idxs of each gate.
+            cbit_offsets, cbits (np.ndarray): CSR clbit idxs of each gate.
+            param_offsets, params (np.ndarray): CSR float params of each gate.
+
+        """
+        self.start_times = start_times
+        self.category_codes = category_codes
+        self.name_idxs = name_idxs
+        self.gate_types = gate_types
+        self.qbit_offsets, self.qbits = qbit_offsets, qbits
+        self.cbit_offsets, self.cbits = cbit_offsets, cbits
+        self.param_offsets, self.params = param_offsets, params
+
+        # gate_id -> row, built on first lookup
+        self._gate_rows = None
+
+    @classmethod
+    def from_sorted_instructions(cls, qc, sorted_instructions, registry):
+        """
+        Decomposes (start_time, instruction) pairs from
+        ManiQCircuit.sort_instructions into a CircuitTable.
+
+        Args:
+            qc (qiskit QuantumCircuit): Circuit the instructions belong to.
+            sorted_instructions (list): (start_time, instruction) pairs sorted by start time.
+            registry (GateRegistry): Compiled gate information from gates.yaml.
+
+        """
+        qubit_idxs = {qubit: idx for idx, qubit in enumerate(qc.qubits)}
+        clbit_idxs = {clbit: idx for idx, clbit in enumerate(qc.clbits)}
+
+        # qiskit_name -> idx into gate_types
+        type_idxs = {}
+        gate_types = []
+        type_categories = []
+
+        name_idxs = np.empty(len(sorted_instructions), dtype=np.int32)
+        start_times = np.empty(len(sorted_instructions), dtype=np.int32)
+        qbits, cbits, params = [], [], []
+
+        for row, (start_time, instruction) in enumerate(sorted_instructions):
+            operation_name = instruction.operation.name
+
+            type_idx = type_idxs.get(operation_name)
+            if type_idx is None:
+                spec = registry[operation_name]
+                type_idx = type_idxs[operation_name] = len(gate_types)
+                gate_types.append((operation_name, spec.latex, spec.color_name))
+                type_categories.append(CATEGORY_CODES.get(spec.category, UNKNOWN_CATEGORY))
+
+            name_idxs[row] = type_idx
+            start_times[row] = start_time
+            params.append([
+                param for param in instruction.operation.params
+                if isinstance(param, (float, np.floating))
+            ])
+            qbits.append([qubit_idxs[qubit] for qubit in instruction.qubits])
+            cbits.append([clbit_idxs[clbit] for clbit in instruction.clbits])
+
+        category_codes = np.array(type_categories, dtype=np.int8)[name_idxs] \
+            if gate_types else np.empty(0, dtype=np.int8)
+
+        return cls(
+            start_times,
+            category_codes,
+            name_idxs,
+            gate_types,
+            *_ragged(qbits, np.int32),
+            *_ragged(cbits, np.int32),
+            *_ragged(params, np.float64),
+        )
+
+    def __len__(self):
+        return len(self.start_times)
+
+    def gate_qbits(self, row):
+        return self.qbits[self.qbit_offsets[row]:self.qbit_offsets[row+1]]
+
+    def gate_cbits(self, row):
+        return self.cbits[self.cbit_offsets[row]:self.cbit_offsets[row+1]]
+
+    def gate_params(self, row):
+        return self.params[self.param_offsets[row]:self.param_offsets[row+1]]
+
+    def gate_id(self, row):
+        """
+        Unique identification of a gate: `{qiskit_name}_{qubit_idxs}_{start_time}`.
+
+        """
+        qiskit_name = self.gate_types[self.name_idxs[row]][0]
+        qubit_idxs = ''.join(map(str, self.gate_qbits(row)))
+        return f'{qiskit_name}_{qubit_idxs}_{self.start_times[row]}'
+
+    @property
+    def gate_ids(self):
+        return [self.gate_id(row) for row in range(len(self))]
+
+    def row_of(self, gate_id):
+        """
+        Row of the gate with `gate_id`, or None if it is not in the table.
+
+        """
+        if self._gate_rows is None:
+            self._gate_rows = {gate_id: row for row, gate_id in enumerate(self.gate_ids)}
+        return self._gate_rows.get(gate_id)
+
+    def record(self, row):
+        """
+        All information for a single gate as a dictionary.
+
+        """
+        qiskit_name, latex, color = self.gate_types[self.name_idxs[row]]
+        code = self.category_codes[row]
+        return {
+            'categories': CATEGORIES[code] if code != UNKNOWN_CATEGORY else None,
+            'start_times': int(self.start_times[row]),
+            'names': latex,
+            'qiskit_names': qiskit_name,
+            'colors': color,
+            'params': self.gate_params(row).tolist(),
+            'qbits': self.gate_qbits(row).tolist(),
+            'cbits': self.gate_cbits(row).tolist(),
+            'gate_id': self.gate_id(row),
+        }
+
+    def records(self, start=0, stop=None):
+        """
+        Iterates over gate records in rows [start, stop).
+
+        """
+        stop = len(self) if stop is None else stop
+        for row in range(start, stop):
+            yield self.record(row)
+
+    def column_offsets(self):
+        """
+        Row offsets where each layout column begins, plus a final
+        end offset. Column c spans rows offsets[c]:offsets[c+1].
+
+        """
+        return np.concatenate((
+            [0],
+            np.flatnonzero(np.diff(self.start_times)) + 1,
+            [len(self)],
+        )).astype(np.int64)
+
+    def take(self, keep):
+        """
+        Returns a new CircuitTable containing only the rows where the
+        boolean mask `keep` is True.
+
+        """
+        keep = np.asarray(keep, dtype=bool)
+        return CircuitTable(
+            self.start_times[keep],
+            self.category_codes[keep],
+            self.name_idxs[keep],
+            self.gate_types,
+            *_take_ragged(self.qbit_offsets, self.qbits, keep),
+            *_take_ragged(self.cbit_offsets, self.cbits, keep),
+            *_take_ragged(self.param_offsets, self.params, keep),
+        )
+
+    def concat(self, other):
+        """
+        Returns a new CircuitTable with the rows of `other` appended,
+        i.e. columns finished while a circuit is streamed in.
+
+        """
+        # Re-index the gate types of `other` into this table's
+        type_idxs = {gate_type[0]: idx for idx, gate_type in enumerate(self.gate_types)}
+        gate_types = list(self.gate_types)
+        remap = np.empty(len(other.gate_types), dtype=np.int32)
+        for idx, gate_type in enumerate(other.gate_types):
+            if gate_type[0] not in type_idxs:
+                type_idxs[gate_type[0]] = len(gate_types)
+                gate_types.append(gate_type)
+            remap[idx] = type_idxs[gate_type[0]]
+
+        def ragged(offsets, values, other_offsets, other_values):
+            return (
+                np.concatenate((offsets, other_offsets[1:] + offsets[-1])),
+                np.concatenate((values, other_values)),
+            )
+
+        return CircuitTable(
+            np.concatenate((self.start_times, other.start_times)),
+            np.concatenate((self.category_codes, other.category_codes)),
+            np.concatenate((self.name_idxs, remap[other.name_idxs])),
+            gate_types,
+            *ragged(self.qbit_offsets, self.qbits, other.qbit_offsets, other.qbits),
+            *ragged(self.cbit_offsets, self.cbits, other.cbit_offsets, other.cbits),
+            *ragged(self.param_offsets, self.params, other.param_offsets, other.params),
+        )
+
+    def drop(self, gate_ids):
+        """
+        Returns a new CircuitTable without the gates in `gate_ids`.
+
+        """
+        keep = np.ones(len(self), dtype=bool)
+        for gate_id in gate_ids:
+            row = self.row_of(gate_id)
+            if row is not None:
+                keep[row] = False
+        return self.take(keep)
+
+    def to_dataframe(self):
+        """
+        Exports the table as a pandas DataFrame, one row per gate.
+
+        """
+        import pandas as pd
+        return pd.DataFrame(list(self.records()))
+
+    def __repr__(self):
+        import pandas as pd
+        with pd.option_context('display.expand_frame_repr', True, 'display.max_columns', 8):
+            return repr(self.to_dataframe())
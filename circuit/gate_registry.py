@@ -0,0 +1,263 @@
+"""
+Compiled gate registry.
+
+gates.yaml is read and validated once per process. Each Qiskit
+operation name is compiled into a GateSpec holding its LaTeX label,
+color, category and a builder already bound to the Gates method that
+draws it, so building a gate is a single dictionary lookup. Operations
+missing from gates.yaml fall back to a labelled box.
+
+"""
+
+import os
+import re
+
+import manim
+
+from circuit_table import CATEGORIES
+from gates import Gates
+from instrumentation import timed
+
+
+# gates.yaml ships next to this module
+GATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gates.yaml')
+
+DEFAULT_COLOR = 'MAROON_C'
+
+# Every digit has the same advance width in the LaTeX font
+_DIGITS = re.compile(r'\d')
+
+
+class GateSpec:
+    """
+    Everything needed to draw one kind of Qiskit operation.
+
+    `build(gates, y, qbits, params, clwire_y)` returns the gate mobject
+    at x=0, where `gates` is the Gates instance (i.e. the scene), `y` the
+    y-coordinates of the qubits acted on and `clwire_y` the y-coordinate
+    of the classical wire.
+
+    """
+
+    __slots__ = ('name', 'latex', 'color_name', 'color', 'category', 'build', 'widths')
+
+    def __init__(self, name, latex, color_name, category, build):
+        self.name = name
+        self.latex = latex
+        self.color_name = color_name
+        self.color = getattr(manim, color_name)
+        self.category = category
+        self.build = build
+        # shape key -> width of the built mobject
+        self.widths = {}
+
+    def width(self, gates, y, qbits, params, clwire_y):
+        """
+        Width of the mobject `build` returns, without building it again
+        for gates of a shape already measured. Shapes only differ by the
+        qubit order and the formatted params with their digits masked.
+
+        """
+        key = (
+            tuple(sorted(range(len(qbits)), key=lambda x: qbits[x])),
+            _DIGITS.sub('0', ', '.join(f'{param:.2f}' for param in params)),
+        )
+        width = self.widths.get(key)
+        if width is None:
+            width = self.widths[key] = self.build(gates, y, qbits, params, clwire_y).width
+        return width
+
+    def __repr__(self):
+        return f'GateSpec({self.name!r}, {self.latex!r}, {self.color_name}, {self.category})'
+
+
+# Builders per category. Each closes over the spec it is compiled for.
+
+def _single(spec):
+    def build(gates, y, qbits, params, clwire_y):
+        return gates.single(spec.latex, x=0, y=y[0], color=spec.color, params=params)
+    return build
+
+
+def _two_qubit(method):
+    def build(gates, y, qbits, params, clwire_y):
+        return method(gates, x=0, y1=y[0], y2=y[1])
+    return build
+
+
+def _barrier(gates, y, qbits, params, clwire_y):
+    return gates.barrier(x=0, y1=min(y), y2=max(y))
+
+
+def _cphase(spec):
+    def build(gates, y, qbits, params, clwire_y):
+        return gates.ctext(x=0, y1=y[0], y2=y[1], params=[spec.latex, params])
+    return build
+
+
+def _controlled(spec):
+    def build(gates, y, qbits, params, clwire_y):
+        return gates.cgate(name=spec.latex, x=0, y1=y[0], y2=y[1], params=params)
+    return build
+
+
+def _multiqubit(spec):
+    def build(gates, y, qbits, params, clwire_y):
+        # Logic to sort idx labels properly
+        sorted_idxs = sorted(range(len(qbits)), key=lambda x: qbits[x])
+        return gates.multiqubit(
+                name=spec.latex,
+                x=0,
+                y=y,
+                color=spec.color,
+                params=params,
+                idxs=sorted_idxs,
+        )
+    return build
+
+
+def _three_qubit(method):
+    def build(gates, y, qbits, params, clwire_y):
+        return method(gates, x=0, y1=y[0], y2=y[1], y3=y[2])
+    return build
+
+
+def _multi_controlled(spec):
+    # No dedicated visual -- controls drawn as dots, target as a box
+    def build(gates, y, qbits, params, clwire_y):
+        if len(y) == 3:
+            return gates.ccgate(spec.latex, x=0, y1=y[0], y2=y[1], y3=y[2], params=params)
+        return gates.cccgate(spec.latex, x=0, y1=y[0], y2=y[1], y3=y[2], y4=y[3], params=params)
+    return build
+
+
+def _measure(gates, y, qbits, params, clwire_y):
+    return gates.measure(x=0, y1=y[0], y2=clwire_y)
+
+
+def _fallback(spec):
+    single, multiqubit = _single(spec), _multiqubit(spec)
+
+    def build(gates, y, qbits, params, clwire_y):
+        # np.mean of no wires is NaN; LayerScheduler leaves these out of the layout
+        if not len(y):
+            raise ValueError(f"Zero-qubit operation '{spec.name}' has no gate visual")
+        if len(y) == 1:
+            return single(gates, y, qbits, params, clwire_y)
+        return multiqubit(gates, y, qbits, params, clwire_y)
+    return build
+
+
+def _compile_builder(spec):
+    """
+    Picks the builder for a spec from its category, resolving dedicated
+    Gates methods (i.e. Gates.cx) by operation name.
+
+    """
+    category, method = spec.category, getattr(Gates, spec.name, None)
+
+    if category == 'single_qubit_gate':
+        return _single(spec)
+    if category == 'cx_like_gate':
+        if spec.name == 'barrier':
+            return _barrier
+        if method is None:
+            raise ValueError(f"gates.yaml: no Gates.{spec.name} method for cx_like_gate '{spec.name}'")
+        return _two_qubit(method)
+    if category == 'cphase_gate':
+        return _cphase(spec)
+    if category == 'general_controlled_gate':
+        return _controlled(spec)
+    if category == 'multi_qubit_gate':
+        return _multiqubit(spec)
+    if category == 'multi_controlled_gate':
+        return _three_qubit(method) if method is not None else _multi_controlled(spec)
+    if category == 'measure':
+        return _measure
+    return _fallback(spec)
+
+
+class GateRegistry:
+    """
+    Maps Qiskit operation names to compiled GateSpecs.
+
+    Lookups of unknown operations compile (and remember) a fallback
+    spec drawn as a single or multi-qubit box labelled with the name.
+
+    """
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries (dict): Parsed gates.yaml, {qiskit_name: {latex, color, category}}.
+
+        Raises:
+            ValueError: If an entry is malformed, has an unknown category
+                        or color, or names a missing Gates method.
+
+        """
+        self.specs = {}
+        for name, entry in entries.items():
+            if not isinstance(entry, dict):
+                raise ValueError(f"gates.yaml: entry '{name}' must be a mapping.")
+            unknown_keys = set(entry) - {'latex', 'color', 'category'}
+            if unknown_keys:
+                raise ValueError(f"gates.yaml: unknown keys {sorted(unknown_keys)} in '{name}'.")
+            if not isinstance(entry.get('latex'), str):
+                raise ValueError(f"gates.yaml: '{name}' is missing a latex label.")
+            if entry.get('category') not in CATEGORIES:
+                raise ValueError(f"gates.yaml: '{name}' has unknown category '{entry.get('category')}'.")
+
+            color_name = entry.get('color', DEFAULT_COLOR)
+            if not hasattr(manim, color_name):
+                raise ValueError(f"gates.yaml: '{name}' has unknown color '{color_name}'.")
+
+            self.specs[name] = self._compile(name, entry['latex'], color_name, entry['category'])
+
+    @staticmethod
+    def _compile(name, latex, color_name, category):
+        spec = GateSpec(name, latex, color_name, category, None)
+        # Builds are timed per gate category, i.e. 'gates.cx_like_gate'
+        spec.build = timed(f'gates.{category or "fallback"}', name)(_compile_builder(spec))
+        return spec
+
+    @classmethod
+    def load(cls, path=GATES_PATH):
+        """
+        Reads and validates a gates.yaml file.
+
+        """
+        import ruamel.yaml as yaml
+
+        try:
+            with open(path, 'r') as f:
+                entries = yaml.YAML(typ='safe', pure=True).load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The gate registry '{path}' was not found.")
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing '{path}': {e}")
+        return cls(entries or {})
+
+    def __getitem__(self, name):
+        spec = self.specs.get(name)
+        if spec is None:
+            latex = r'\text{' + name.replace('_', r'\_') + '}'
+            spec = self.specs[name] = self._compile(name, latex, DEFAULT_COLOR, None)
+        return spec
+
+    def __len__(self):
+        return len(self.specs)
+
+
+_REGISTRY = None
+
+
+def gate_registry():
+    """
+    The process-wide GateRegistry, loaded from GATES_PATH on first use.
+
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = GateRegistry.load()
+    return _REGISTRY
@@ -1,13 +1,118 @@
 from manim import * 
+from mobject_cache import MobjectCache
 import numpy as np 
 import math 
 
 
+# Gate labels repeat across a circuit -- each distinct glyph is built once
+GLYPH_CACHE = MobjectCache('glyphs')
+# So do gate shapes (dots, targets, boxes) -- each is built once at the origin
+SHAPE_CACHE = MobjectCache('shapes')
+
+
 class Gates: 
     """
         Generates Manim-space visuals for each type of generic quantum gate.
     """
 
+    def glyph(self, latex, font_size, opacity=1, **kwargs): 
+        """ 
+        Returns a copy of a cached MathTex label. 
+
+        Args: 
+            latex (str): LaTeX source, including any formatted parameters. 
+            font_size (float): Font size of the label. 
+            opacity (float): Opacity of the label. 
+            kwargs: Extra MathTex styling (i.e. fill_color). 
+
+        Returns: 
+            The MathTex Mobject, centered at the origin.
+
+        """
+        key = (
+            latex, 
+            font_size, 
+            opacity, 
+            tuple(sorted((k, str(v)) for k, v in kwargs.items())), 
+        )
+
+        def build(): 
+            label = MathTex(latex, font_size=font_size, **kwargs)
+            if opacity != 1: 
+                label.set_opacity(opacity)
+            return label
+
+        return GLYPH_CACHE.get(key, build)
+
+    def prototype(self, key, build, point=ORIGIN): 
+        """ 
+        Returns a copy of a cached shape, shifted to `point`. 
+
+        Args: 
+            key (hashable): Uniquely identifies the shape's appearance. 
+            build (callable): Builds the shape centered at the origin. 
+            point (array-like): Manim-space position of the copy. 
+
+        Returns: 
+            The shape Mobject, safe to move/modify.
+
+        """
+        return SHAPE_CACHE.get(key, build).shift(point)
+
+    def dot(self, x, y, color, radius=0.3): 
+        """ 
+        Returns a control-qubit style Dot at (x, y). 
+
+        """
+        return self.prototype(
+                ('dot', radius, str(color)), 
+                lambda: Dot(radius=radius, color=color), 
+                [x, y, 0], 
+        )
+
+    def vline(self, x, y1, y2, **kwargs): 
+        """ 
+        Returns a vertical Line from (x, y1) to (x, y2): a cached unit 
+        line stretched to the span, so only its points are copied. 
+
+        Args: 
+            kwargs: Line styling (i.e. color, stroke_width). 
+
+        """
+        key = ('vline', tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+        line = self.prototype(key, lambda: Line(DOWN*0.5, UP*0.5, **kwargs))
+        return line.stretch(y2-y1, 1, about_point=ORIGIN).shift([x, (y1+y2)/2, 0])
+
+    def cross(self, x, y): 
+        """ 
+        Returns a SWAP cross centered at (x, y). 
+
+        """
+        return self.prototype(
+                'cross', 
+                lambda: Cross(stroke_color=BLUE_E, scale_factor=0.4, stroke_width=4).move_to(ORIGIN), 
+                [x, y, 0], 
+        )
+
+    def x_target(self, x, y): 
+        """ 
+        Returns the circled-plus target of CX/CCX gates centered at (x, y). 
+
+        """
+        def build(): 
+            circle = Circle(
+                    radius=0.5, 
+                    color=BLUE_E, 
+                    fill_opacity=1,
+            ).move_to(ORIGIN) 
+            plus = VGroup(
+                Line(start=LEFT*0.3, end=RIGHT*0.3, stroke_width=2), 
+                Line(start=DOWN*0.3, end=UP*0.3, stroke_width=2), 
+            )
+            return VGroup(circle, plus) 
+
+        return self.prototype('x_target', build, [x, y, 0])
+
     def single(self, name, x, y, color=MAROON_D, params=[]): 
         """ 
         Builds a Generic Single-Qubit Gate in Manim-space.
@@ -21,39 +126,47 @@ class Gates:
 
         """
 
-        # Gate Label (i.e. X, Y, Z, H) 
-        label = MathTex(rf"{name}", font_size = 55)
-
-        # Provided parameters, display them below the gate label
         if params:
             param_str = ", ".join([f"{param:.2f}" for param in params])
-            param_label = MathTex(
-                rf"{param_str}", 
-                font_size=30 
-            ).next_to(label, DOWN * 0.1)
-            label.shift(UP * 0.1)
-        else:
-            param_label = MathTex(
-                rf"0.00", 
-                font_size=30
-            ).set_opacity(0)
-
-        label_group = VGroup(label, param_label)
-
-        # Quantum Gate Visual 
-        border = Rectangle(
-            width=label_group.width + 0.4,
-            height=1,
-            fill_color=color,
-            fill_opacity=1,
-            color=color,
-        ).move_to([x, y, 0])
-
-
-        label_group.move_to(border.get_center())
+        else: 
+            param_str = None
+
+        def build(): 
+            # Gate Label (i.e. X, Y, Z, H) 
+            label = self.glyph(rf"{name}", font_size=55)
+
+            # Provided parameters, display them below the gate label
+            if param_str is not None:
+                param_label = self.glyph(
+                    rf"{param_str}", 
+                    font_size=30 
+                ).next_to(label, DOWN * 0.1)
+                label.shift(UP * 0.1)
+            else:
+                # Invisible placeholder keeps parameterless gates a uniform width
+                param_label = self.glyph(
+                    rf"0.00", 
+                    font_size=30, 
+                    opacity=0, 
+                )
+
+            label_group = VGroup(label, param_label)
+
+            # Quantum Gate Visual 
+            border = Rectangle(
+                width=label_group.width + 0.4,
+                height=1,
+                fill_color=color,
+                fill_opacity=1,
+                color=color,
+            )
 
-        # Final Gate Mobject
-        gate = VGroup(border, label_group).move_to([x, y, 0])
+            label_group.move_to(border.get_center())
+
+            return VGroup(border, label_group).move_to(ORIGIN)
+
+        # Final Gate Mobject, built once per label/color/parameters
+        gate = self.prototype(('single', name, str(color), param_str), build, [x, y, 0])
 
         return gate 
 
@@ -71,53 +184,55 @@ class Gates:
             The Manim Gate Mobject
         """
 
-        # Mimicking the Standard Measurement Gate Visual
-        dot = Dot(
-            radius=0.05, 
-            color=GRAY_D
-        ).move_to([x, y1 - 0.1, 0])
-        semicirc = (
-            Arc(
-                fill_opacity=0,
-                angle=PI,
+        def build(): 
+            # Mimicking the Standard Measurement Gate Visual
+            dot = Dot(
+                radius=0.05, 
+                color=GRAY_D
+            ).move_to([0, -0.1, 0])
+            semicirc = (
+                Arc(
+                    fill_opacity=0,
+                    angle=PI,
+                    stroke_width=2,
+                    color=GRAY_D,
+                )
+                .scale(0.35)
+                .move_to(dot.get_center() + np.array([0, 0.1, 0]))
+            )
+            line = Line(
+                dot.get_center(),
+                np.array([0.3, 0.3, 0]),
                 stroke_width=2,
                 color=GRAY_D,
             )
-            .scale(0.35)
-            .move_to(dot.get_center() + np.array([0, 0.1, 0]))
-        )
-        line = Line(
-            dot.get_center(),
-            np.array([x + 0.3, y1 + 0.3, 0]),
-            stroke_width=2,
-            color=GRAY_D,
-        )
-        square = Square(
-            side_length=1,
-            color=YELLOW_A,
-            fill_color=YELLOW_A,
-            fill_opacity=1,
-        ).move_to([x, y1, 0])
-        group = VGroup(square, dot, line, semicirc)
-
-        # Vertical measurement lines to classical register(s)
-        line_measure_1 = Line(
-            np.array([x - 0.07, y1, 0]),
-            np.array([x - 0.07, y2 + 0.4, 0]),
-            stroke_width=2,
-            color=YELLOW_A,
-        )
-        line_measure_2 = line_measure_1.copy().shift(RIGHT * 0.14)
-        measure_tip = (
-            Triangle(
+            square = Square(
+                side_length=1,
                 color=YELLOW_A,
                 fill_color=YELLOW_A,
                 fill_opacity=1,
             )
-            .scale(0.3)
-            .rotate(60 * DEGREES)
-            .move_to([x, y2 + 0.4, 0])
-        )
+            return VGroup(square, dot, line, semicirc)
+
+        def build_tip(): 
+            return (
+                Triangle(
+                    color=YELLOW_A,
+                    fill_color=YELLOW_A,
+                    fill_opacity=1,
+                )
+                .scale(0.3)
+                .rotate(60 * DEGREES)
+                .move_to(ORIGIN)
+            )
+
+        # Measurement box, built once 
+        group = self.prototype('measure', build, [x, y1, 0])
+
+        # Vertical measurement lines to classical register(s)
+        line_measure_1 = self.vline(x - 0.07, y1, y2 + 0.4, stroke_width=2, color=YELLOW_A)
+        line_measure_2 = self.vline(x + 0.07, y1, y2 + 0.4, stroke_width=2, color=YELLOW_A)
+        measure_tip = self.prototype('measure_tip', build_tip, [x, y2 + 0.4, 0])
 
         # Final Gate Mobject
         gate = VGroup(line_measure_1, line_measure_2, measure_tip, group)
@@ -173,38 +288,12 @@ class Gates:
             The Manim Gate Mobject.
         """
         # The Control Qubit 
-        control = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3, 
-                color=BLUE_E,
-        )
+        control = self.dot(x, y1, BLUE_E)
         # The Target Qubit 
-        circle = Circle(
-                radius=0.5, 
-                color=BLUE_E, 
-                fill_opacity=1,
-        ).move_to([x, y2, 0]) 
-        plus = VGroup(
-            Line(
-                start=np.array([x-0.3, y2, 0]), 
-                end=np.array([x+0.3, y2, 0]), 
-                stroke_width=2,
-            ), 
-            Line(
-                start=np.array([x, y2-0.3, 0]), 
-                end=np.array([x, y2+0.3, 0]), 
-                stroke_width=2, 
-            )
-        )
-        target = VGroup(circle, plus) 
+        target = self.x_target(x, y2)
 
         # Line connecting control & target qubits 
-        line = Line(
-                start=np.array([x, min(y1, y2), 0]), 
-                end=np.array([x, max(y1, y2), 0]), 
-                color=BLUE_E, 
-                stroke_width=5,
-        )
+        line = self.vline(x, min(y1, y2), max(y1, y2), color=BLUE_E, stroke_width=5)
         
         # Final Gate Mobject
         gate = VGroup(line, control, target) 
@@ -213,21 +302,12 @@ class Gates:
 
     def cy(self, x, y1, y2): 
         # The Control Qubit
-        control = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3, 
-                color=MAROON_C,
-        )
+        control = self.dot(x, y1, MAROON_C)
         # THe Target Qubit 
         target = self.single("Y", x, y2, color=MAROON_C)
         
         # Line connecting control & target qubits 
-        line = Line(
-                start=np.array([x, min(y1, y2), 0]),
-                end=np.array([x, max(y1, y2), 0]), 
-                color=MAROON_C, 
-                stroke_width=5
-        )
+        line = self.vline(x, min(y1, y2), max(y1, y2), color=MAROON_C, stroke_width=5)
 
         # Final Gate Mobject
         gate = VGroup(line, control, target) 
@@ -250,38 +330,24 @@ class Gates:
             The Manim Gate Mobject.
         """
         # Control Qubit 
-        control = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3, 
-                color=BLUE_C
-        ) 
+        control = self.dot(x, y1, BLUE_C) 
         # Target Qubit 
-        target = Dot(
-                point=np.array([x, y2, 0]), 
-                radius=0.3,
-                color=BLUE_C
-        )
+        target = self.dot(x, y2, BLUE_C)
         # Line connecting control & target qubits 
-        line = Line(
-                start=np.array([x, y1, 0]), 
-                end=np.array([x, y2, 0]), 
-                color=BLUE_C
-        )
+        line = self.vline(x, y1, y2, color=BLUE_C)
 
         # Parameter label beside gate 
         if params:
             y_param = min(y1,y2)-0.7 
             if params[1]: 
-                param_text = MathTex(rf"{params[0]} \; ({params[1][0]:.2f})", 
-                                     font_size=40, 
-                                     fill_color=WHITE,
-                                     fill_opacity=1, 
+                param_text = self.glyph(rf"{params[0]} \; ({params[1][0]:.2f})", 
+                                        font_size=40, 
+                                        fill_color=WHITE,
                 ).move_to([x, y_param, 0])
             else: 
-                param_text = MathTex(rf"{params[0]}", 
-                                     font_size=40, 
-                                     fill_color=WHITE, 
-                                     fill_opacity=1,
+                param_text = self.glyph(rf"{params[0]}", 
+                                        font_size=40, 
+                                        fill_color=WHITE, 
                 ).move_to([x, y_param, 0])
             # Final Gate Mobject
             gate = VGroup(control, target, line, param_text)
@@ -306,24 +372,11 @@ class Gates:
         """
 
         # SWAP Gate Visual 
-        cross1 = Cross(
-                stroke_color=BLUE_E, 
-                scale_factor=0.4, 
-                stroke_width=4,
-        ).move_to([x, y1, 0])
-        cross2 = Cross(
-                stroke_color=BLUE_E, 
-                scale_factor=0.4, 
-                stroke_width=4,
-        ).move_to([x, y2, 0])
+        cross1 = self.cross(x, y1)
+        cross2 = self.cross(x, y2)
 
         # Line connecting two qubits 
-        line = Line(
-                start=np.array([x, y1, 0]), 
-                end=np.array([x, y2, 0]), 
-                color=BLUE_E, 
-                stroke_width=5,
-        )
+        line = self.vline(x, y1, y2, color=BLUE_E, stroke_width=5)
 
         # Final Gate Mobject
         gate = VGroup(cross1, cross2, line) 
@@ -349,26 +402,17 @@ class Gates:
 
         """    
         # Control Qubit 
-        control = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3, 
-                color=color,
-        )
+        control = self.dot(x, y1, color)
         # Target Qubit 
         target = self.single(name, x, y2, color=color, params=params) 
 
         # Line connecting control & target qubits 
         if y2 < y1:
-            end = np.array([x, y2+0.5, 0]) 
+            end = y2+0.5 
         else: 
-            end = np.array([x, y2-0.5, 0]) 
+            end = y2-0.5 
 
-        line = Line(
-                start=np.array([x, y1, 0]), 
-                end=end, 
-                stroke_width=5, 
-                color=color, 
-        )
+        line = self.vline(x, y1, end, stroke_width=5, color=color)
 
         # Final Gate Mobject
         gate = VGroup(control, target, line) 
@@ -391,29 +435,13 @@ class Gates:
         """
 
         # Control Qubit 
-        control = Dot(
-                point=np.array([x, y1, 0]),
-                radius=0.3, 
-                color=BLUE_E,
-        )
+        control = self.dot(x, y1, BLUE_E)
         # Target SWAP Qubits
-        cross1 = Cross(
-                stroke_color=BLUE_E, 
-                scale_factor=0.4, 
-                stroke_width=4,
-        ).move_to([x, y2, 0])
-        cross2 = Cross(
-                stroke_color=BLUE_E, 
-                scale_factor=0.4, 
-                stroke_width=4,
-        ).move_to([x, y3, 0])
+        cross1 = self.cross(x, y2)
+        cross2 = self.cross(x, y3)
 
         # Line in between 
-        line = Line(
-                start=np.array([x, min(y1,y2,y3), 0]), 
-                end=np.array([x, max(y1,y2,y3), 0]), 
-                color=BLUE_E, 
-        )
+        line = self.vline(x, min(y1,y2,y3), max(y1,y2,y3), color=BLUE_E)
 
         # Final Gate Mobject
         gate = VGroup(control, cross1, cross2, line) 
@@ -436,43 +464,13 @@ class Gates:
         """   
         # Toffoli Gate 
         # Control Qubits 
-        control1 = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3, 
-                color=BLUE_E,
-        )
-        control2 = Dot(
-                point=np.array([x, y2, 0]), 
-                radius=0.3, 
-                color=BLUE_E, 
-        )
+        control1 = self.dot(x, y1, BLUE_E)
+        control2 = self.dot(x, y2, BLUE_E)
         # Target Qubit
-        circle = Circle(
-                radius=0.5, 
-                color=BLUE_E, 
-                fill_opacity=1,
-        ).move_to([x, y3, 0])
-        plus = VGroup( 
-            Line(
-                start=np.array([x-0.3, y3, 0]), 
-                end=np.array([x+0.3, y3, 0]), 
-                stroke_width=2,
-            ),
-            Line(
-                start=np.array([x, y3-0.3, 0]), 
-                end=np.array([x, y3+0.3, 0]), 
-                stroke_width=2, 
-            )
-        )
-        target = VGroup(circle, plus) 
+        target = self.x_target(x, y3)
 
         # Line in between 
-        line = Line(
-                start=np.array([x, min(y1, y2, y3), 0]), 
-                end=np.array([x, max(y1, y2, y3), 0]),
-                color=BLUE_E, 
-                stroke_width=5, 
-        )
+        line = self.vline(x, min(y1, y2, y3), max(y1, y2, y3), color=BLUE_E, stroke_width=5)
 
         # Final Gate Mobject
         gate = VGroup(line, control1, control2, target) 
@@ -494,29 +492,12 @@ class Gates:
 
         """
         # Three Qubits
-        dot1 = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3, 
-                color=BLUE_C, 
-        )
-        dot2 = Dot(
-                  point=np.array([x, y2, 0]),
-                  radius=0.3,
-                  color=BLUE_C,
-        )
-        dot3 = Dot(
-                  point=np.array([x, y3, 0]),
-                  radius=0.3,
-                  color=BLUE_C,
-        )
+        dot1 = self.dot(x, y1, BLUE_C)
+        dot2 = self.dot(x, y2, BLUE_C)
+        dot3 = self.dot(x, y3, BLUE_C)
 
         # Line in between 
-        line = Line( 
-                start=np.array([x, min(y1, y2, y3), 0]), 
-                end=np.array([x, max(y1, y2, y3), 0]), 
-                color=BLUE_C, 
-                stroke_width=5,
-        )
+        line = self.vline(x, min(y1, y2, y3), max(y1, y2, y3), color=BLUE_C, stroke_width=5)
 
         # Final Gate Mobject
         gate = VGroup(line, dot1, dot2, dot3) 
@@ -540,27 +521,14 @@ class Gates:
 
         """    
         # Control Qubits 
-        control1 = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3,
-                color=MAROON_C, 
-        )
-        control2 = Dot(
-                point=np.array([x, y2, 0]), 
-                radius=0.3, 
-                color=MAROON_C, 
-        )
+        control1 = self.dot(x, y1, MAROON_C)
+        control2 = self.dot(x, y2, MAROON_C)
 
         # Target Qubit 
         target = self.single(name, x, y3, params=params, color=MAROON_C) 
 
         # Line in between 
-        line = Line(
-                start=np.array([x, min(y1, y2, y3), 0]), 
-                end=np.array([x, max(y1, y2, y3), 0]), 
-                stroke_width=5, 
-                color=MAROON_C, 
-        )
+        line = self.vline(x, min(y1, y2, y3), max(y1, y2, y3), stroke_width=5, color=MAROON_C)
 
         # Final Gate Mobject
         gate = VGroup(line, control1, control2, target) 
@@ -586,30 +554,15 @@ class Gates:
         """
 
         # Control Qubits
-        control1 = Dot(
-                point=np.array([x, y1, 0]), 
-                radius=0.3, 
-                color=MAROON_C, 
-        )
-        control2 = Dot(
-                  point=np.array([x, y2, 0]),
-                  radius=0.3,
-                  color=MAROON_C,
-        )
-        control3 = Dot(
-                  point=np.array([x, y3, 0]),
-                  radius=0.3,
-                  color=MAROON_C,
-        )
+        control1 = self.dot(x, y1, MAROON_C)
+        control2 = self.dot(x, y2, MAROON_C)
+        control3 = self.dot(x, y3, MAROON_C)
 
         # Target Qubit
         target = self.single(name, x, y4, params=params, color=MAROON_C) 
 
         # Line in between 
-        line = Line(start=np.array([x, min(y1, y2, y3, y4), 0]), 
-                    end=np.array([x, max(y1, y2, y3, y4), 0]), 
-                    stroke_width=5, 
-                    color=MAROON_C)
+        line = self.vline(x, min(y1, y2, y3, y4), max(y1, y2, y3, y4), stroke_width=5, color=MAROON_C)
 
         # Final Gate Mobject
         gate = VGroup(line, control1, control2, control3, target)
@@ -636,14 +589,14 @@ class Gates:
         """
 
         # Gate Label
-        label = MathTex(rf"{name}", font_size=60).move_to([x+0.5, np.mean(y), 0])
+        label = self.glyph(rf"{name}", font_size=60).move_to([x+0.5, np.mean(y), 0])
         group = VGroup(label) 
 
         # Gate Parameters 
         # Placed below Gate Label
         if params:
             param_str = ", ".join([f"{param:.2f}" for param in params])
-            param_str = MathTex(param_str, font_size=40).next_to(label, DOWN*1)
+            param_str = self.glyph(param_str, font_size=40).next_to(label, DOWN*1)
             group = VGroup(label, param_str) 
 
         rect = Rectangle(
@@ -655,7 +608,7 @@ class Gates:
         idxs_, y_ = VGroup(), list(y.copy())
         if idxs: 
             for i in range(len(idxs)): 
-                idx = MathTex(
+                idx = self.glyph(
                         rf"{idxs[i]}", 
                         font_size=60, 
                 ).move_to([x-0.3, max(y_), 0])
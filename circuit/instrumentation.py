@@ -0,0 +1,144 @@
+"""
+Opt-in timing instrumentation for production ManiQ sessions.
+
+Enable it with the environment variable
+
+    MANIQ_PROFILE=1          # phase timings only
+    MANIQ_PROFILE=cprofile   # phase timings plus a session-wide cProfile
+
+or by calling `enable()` at any point of the session. Timings go into an in-memory ring buffer
+(size set by MANIQ_PROFILE_BUFFER, default 10000) which can be dumped as
+JSON; cProfile stats can be dumped with `dump_stats`. Setting
+MANIQ_PROFILE_OUTPUT dumps the JSON report there when the session exits.
+
+The flag is checked on every call, so `enable()` also turns on timing of
+functions decorated earlier. When disabled, a timed call costs one global
+lookup on top of the call itself.
+
+"""
+
+from collections import deque
+
+import atexit
+import cProfile
+import functools
+import json
+import os
+import time
+
+
+_mode = os.environ.get('MANIQ_PROFILE', '').lower()
+
+ENABLED = _mode not in ('', '0', 'false')
+# (category, name, start time, duration) of every instrumented call
+TIMINGS = deque(maxlen=int(os.environ.get('MANIQ_PROFILE_BUFFER', 10000)))
+PROFILER = cProfile.Profile() if _mode == 'cprofile' else None
+
+if PROFILER is not None:
+    PROFILER.enable()
+
+
+def enable(cprofile=False):
+    """
+    Turns instrumentation on for every timed function, including the
+    ones decorated at import. A session-wide cProfile only covers calls
+    made after this one.
+
+    """
+    global ENABLED, PROFILER
+    if not ENABLED and os.environ.get('MANIQ_PROFILE_OUTPUT'):
+        atexit.register(dump_json, os.environ['MANIQ_PROFILE_OUTPUT'])
+    ENABLED = True
+    if cprofile and PROFILER is None:
+        PROFILER = cProfile.Profile()
+        PROFILER.enable()
+    return
+
+
+def timed(category, name=None):
+    """
+    Decorator recording the duration of every call into TIMINGS.
+
+    Args:
+        category (str): Group the call is reported under (i.e. 'assemble').
+        name (str): Name of the call. Defaults to the function name.
+
+    """
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Checked per call so enable() reaches functions decorated earlier
+            if not ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                TIMINGS.append((category, label, start, time.perf_counter() - start))
+        return wrapper
+
+    return decorator
+
+
+def summary():
+    """
+    Aggregates the buffered timings per category and call name.
+
+    Returns:
+        {category: {name: {'calls', 'total_s', 'mean_s', 'max_s'}}}
+
+    """
+    totals = {}
+    for category, name, _, duration in TIMINGS:
+        stats = totals.setdefault(category, {}).setdefault(
+            name, {'calls': 0, 'total_s': 0.0, 'max_s': 0.0}
+        )
+        stats['calls'] += 1
+        stats['total_s'] += duration
+        stats['max_s'] = max(stats['max_s'], duration)
+
+    for calls in totals.values():
+        for stats in calls.values():
+            stats['mean_s'] = stats['total_s'] / stats['calls']
+    return totals
+
+
+def dump_json(path=None):
+    """
+    Dumps the ring buffer and its summary as JSON.
+
+    Args:
+        path (str): File to write to. Returns the JSON string if None.
+
+    """
+    report = json.dumps({
+        'summary': summary(),
+        'timings': [
+            {'category': category, 'name': name, 'start': start, 'duration_s': duration}
+            for category, name, start, duration in TIMINGS
+        ],
+    }, indent=2)
+
+    if path is None:
+        return report
+    with open(path, 'w') as f:
+        f.write(report)
+    return
+
+
+def dump_stats(path):
+    """
+    Writes the session cProfile stats (MANIQ_PROFILE=cprofile) to `path`,
+    readable with `python -m pstats` or snakeviz.
+
+    """
+    if PROFILER is None:
+        raise RuntimeError('cProfile is not running; set MANIQ_PROFILE=cprofile.')
+    PROFILER.dump_stats(path)
+    return
+
+
+if ENABLED and os.environ.get('MANIQ_PROFILE_OUTPUT'):
+    atexit.register(dump_json, os.environ['MANIQ_PROFILE_OUTPUT'])
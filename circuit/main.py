@@ -1,25 +1,28 @@
 from manim import * 
 from manim.opengl import *
-from random_circuit import random_circuit
-from qiskit import QuantumCircuit
-
-from gates import Gates
-from updaters import global_cursor_to_manim
+from pyglet.window import key
+
+from gates import Gates, GLYPH_CACHE, SHAPE_CACHE
+from gate_registry import gate_registry
+from spatial_index import GateGrid
+from bounding_boxes import BoundingBoxes
+from scheduler import LayerScheduler, schedule_instructions
+from viewport import ColumnViewport, camera_frame, event_to_manim
 from qiskit_functions.convert_to_manim import ConvertToManim
-from update_qc import CircuitUpdate
+from qiskit_functions.statevector_engine import StatevectorEngine
+from update_qc import InstructionIndex
+from circuit_table import CircuitTable
+from instrumentation import timed
+from background import SimulationWorker
 
-import ruamel.yaml as yaml 
 import numpy as np 
-import pandas as pd 
+import time 
 
 config.preview = True
 config.write_to_movie = False 
 config.renderer = 'opengl'
 config.fullscreen = False
 
-pd.set_option("display.expand_frame_repr", True)
-pd.set_option("display.max_columns", 8)
-
 
 class ManiQCircuit(Scene, Gates): 
     """ 
@@ -28,121 +31,186 @@ class ManiQCircuit(Scene, Gates):
 
     """
 
+    # Print the circuit and its decomposition after assembly. Off by 
+    # default: the table printout imports pandas before the first frame
+    verbose = False
+    # Only build the gates of columns near the camera (for very wide circuits)
+    cull_columns = False
+    # Extra frame widths either side of the camera kept built when culling
+    cull_margin = 0.5
+    # Iterable of CircuitInstructions to stream into an empty self.qc
+    # (i.e. streaming.QasmStream) instead of assembling a complete circuit
+    instruction_stream = None
+
+    @timed('assemble')
     def sort_instructions(self):
-
-        qc = QuantumCircuit(2)
-        qc.h([0, 1])
-        qc.cz(0,1)
-        qc.ry(np.pi/3 , 0)
-        qc.rx(np.pi/5, 1)
-        qc.measure_all()
-        self.qc = qc
-        
-
-
-
         """ 
         Logic to sort qiskit circuit to ensure no manim gate overlap. 
 
         Returns: 
             The sorted instruction array as self attribute.
         """
-        
-        # Sorting instructions based on their avilable start time
-        qubit_times = {i: 0 for i in range(self.qc.num_qubits)}
-
-        # Initialize list to store sorted QuantumCircuit instructions 
-        sorted_instructions = [] 
-
-        for instruction in self.qc.data: 
-            # Qubit idxs being acted on by instruction 
-            instruction_qubits = [self.qc.find_bit(qubit).index for qubit in instruction.qubits]
-            min_qubit, max_qubit = min(instruction_qubits), max(instruction_qubits) 
-
-            # Define instruction start time as maximum available start time 
-            # across all instruction qubits
-            start_time = max(qubit_times[q] for q in range(min_qubit, max_qubit+1))
-            sorted_instructions.append((start_time, instruction)) 
-
-            # Increases possible start time for all instruction qubits by 1
-            if instruction.operation.name == 'measure': 
-                for q in range(0, self.qc.num_qubits+1): 
-                    qubit_times[q] = start_time + 1
-            else: 
-                for q in range(min_qubit, max_qubit+1): 
-                    qubit_times[q] = start_time + 1
 
-        sorted_instructions.sort(key=lambda q: q[0])
-
-        self.sorted_instructions = sorted_instructions 
+        # Layers assigned with a running per-wire frontier, no final sort
+        self.sorted_instructions, self.instruction_idxs = schedule_instructions(
+                self.qc, 
+                return_idxs=True, 
+        )
         return 
 
+    @timed('assemble')
     def decompose(self): 
         """
-        Decomposes qiskit QuantumCircuit into sorted DataFrame object 
+        Decomposes qiskit QuantumCircuit into a sorted CircuitTable 
         containing general information for each QuantumCircuit gate. 
 
         Returns: 
-            DataFrame object as self attribute. 
-
-        """
-
-        # Load yaml file containing gate information
-        try: 
-            with open('gates.yaml', 'r') as f: 
-                gate_params = yaml.safe_load(f) 
-        except FileNotFoundError:
-            raise FileNotFoundError("The 'gates.yaml' file was not found.")
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error parsing 'gates.yaml': {e}")
-
-        # Initialize list to store all instruction information 
-        data_records = [] 
-
-        for start_time, instruction in self.sorted_instructions: 
-            operation_name = instruction.operation.name 
-            instruction_params = gate_params.get(operation_name, {})
-
-            # Extract gate parameters 
-            category = instruction_params.get('category')
-            latex = instruction_params.get('latex', operation_name) 
-            color = instruction_params.get('color', 'MAROON_C') 
-
-            params = [
-                param for param in instruction.operation.params 
-                if isinstance(param, (float, np.floating)) 
-            ]
-
-            # Qubit and Clbit indxs instruction acts on 
-            qbits = [self.qc.find_bit(qubit).index for qubit in instruction.qubits] 
-            cbits = [self.qc.find_bit(clbit).index for clbit in instruction.clbits] 
-
-            data_records.append({
-                'categories': category, 
-                'start_times': start_time, 
-                'names': latex, 
-                'qiskit_names': operation_name,
-                'colors': color, 
-                'params': params, 
-                'qbits': qbits, 
-                'cbits': cbits, 
-                'gate_id': f'{operation_name}_{''.join(map(str, qbits))}_{start_time}'
-            })
-
-        # Generate DataFrame
-        self.circuit_data = pd.DataFrame(data_records) 
-
-        # Sort based on start_time for better organization 
-        self.circuit_data.sort_values(by='start_times', inplace=True)
-        self.circuit_data.reset_index(drop=True, inplace=True)
+            CircuitTable object as self attribute. 
+
+        """
+
+        # Struct-of-arrays table, already sorted by start time
+        self.circuit_data = CircuitTable.from_sorted_instructions(
+                self.qc, 
+                self.sorted_instructions, 
+                gate_registry(), 
+        )
+
+        # gate_id -> (column, instruction) for updating the statevector engine
+        self.gate_instructions = {
+            gate_id: sorted_instruction for gate_id, sorted_instruction 
+            in zip(self.circuit_data.gate_ids, self.sorted_instructions)
+        }
+        # gate_id -> current position in self.qc.data for in-place removal
+        self.instruction_index = InstructionIndex(
+                self.circuit_data.gate_ids, 
+                self.instruction_idxs, 
+                len(self.qc.data), 
+        )
+        return
+
+    def wire_positions(self): 
+        """ 
+        Manim-space y coordinates of the qubit wires and the classical wire. 
+
+        """
+        wire_y_pos = np.arange(self.qc.num_qubits-1, -self.qc.num_qubits, -2)
+        # Only one classical register currently 
+        clwire_y_pos = min(wire_y_pos)-3 
+        return wire_y_pos, clwire_y_pos
+
+    def column_widths(self, circuit_data): 
+        """ 
+        Width of every layout column of `circuit_data`, from gate widths 
+        measured once per distinct gate shape. 
+
+        """
+        registry = gate_registry()
+        wire_y_pos, clwire_y_pos = self.wire_positions()
+
+        column_offsets = circuit_data.column_offsets()
+        widths = np.zeros(len(column_offsets)-1)
+
+        for column, (col_start, col_end) in enumerate(zip(column_offsets[:-1], column_offsets[1:])): 
+            for row in range(col_start, col_end): 
+                spec = registry[circuit_data.gate_types[circuit_data.name_idxs[row]][0]]
+                qbits = circuit_data.gate_qbits(row).tolist()
+                width = spec.width(
+                        self, 
+                        wire_y_pos[qbits], 
+                        qbits, 
+                        circuit_data.gate_params(row).tolist(), 
+                        clwire_y_pos, 
+                )
+                widths[column] = max(widths[column], width)
+        return widths
+
+    @timed('assemble')
+    def layout_columns(self, gap=0.5): 
+        """
+        Computes the horizontal extent of every layout column without 
+        building the gate mobjects. 
+
+        Args: 
+            gap (float): Manim-space horizontal gap between columns of gates. 
+
+        Returns: 
+            Start time and [left, right] x of each column as self attributes. 
+
+        """
+        self.gap = gap 
+        self.column_times = np.empty(0, dtype=np.int32)
+        self.column_bounds = np.empty((0, 2))
+        self.extend_layout(self.circuit_data)
+        return
+
+    def extend_layout(self, circuit_data): 
+        """ 
+        Appends the columns of `circuit_data` to the right of the layout. 
+
+        """
+        widths = self.column_widths(circuit_data)
+        if not len(widths): 
+            return
+        start = self.column_bounds[-1, 1]+self.gap if len(self.column_bounds) else 0
+
+        # Columns are packed left to right, `gap` apart 
+        lefts = start+np.concatenate(([0], np.cumsum(widths+self.gap)[:-1]))
+        self.column_times = np.concatenate((
+            self.column_times, 
+            np.unique(circuit_data.start_times), 
+        ))
+        self.column_bounds = np.concatenate((
+            self.column_bounds, 
+            np.stack((lefts, lefts+widths), axis=1), 
+        ))
         return
 
+    def build_column(self, column): 
+        """ 
+        Builds the gates of a single layout column at its layout position. 
+        Gates removed since the layout was computed are skipped. 
+
+        Returns: 
+            (gate_ids, gate mobjects) of the column. 
+
+        """
+        circuit_data = self.circuit_data 
+        registry = gate_registry()
+        wire_y_pos, clwire_y_pos = self.wire_positions()
+
+        # circuit_data is sorted by start time, so the column is a contiguous run of rows 
+        start_time = self.column_times[column]
+        col_start, col_end = np.searchsorted(circuit_data.start_times, [start_time, start_time+1])
+        x = self.column_bounds[column].mean()
+
+        column_ids, column_gates = [], []
+        for elements in circuit_data.records(col_start, col_end): 
+            qbits = elements['qbits'] 
+
+            # Gates are built at x=0, then shifted to the column center 
+            gate = registry[elements['qiskit_names']].build(
+                    self, 
+                    wire_y_pos[qbits], 
+                    qbits, 
+                    elements['params'], 
+                    clwire_y_pos, 
+            ).shift(RIGHT*x)
+
+            column_ids.append(elements['gate_id'])
+            column_gates.append(gate)
+        return column_ids, column_gates
+
+    @timed('assemble')
     def build_circuit(self, gap=0.5): 
         """
         Builds the ManiQ circuit before rendering takes place. 
         Currently does not include qubit wires because manim 
         has some z_index issues currently. 
 
+        With `cull_columns` set, only the layout is computed here; gate 
+        mobjects are built per column as they come into view. 
+
         Args: 
             gap (float): Manim-space horizontal gap between columns of gates. 
         
@@ -150,169 +218,61 @@ class ManiQCircuit(Scene, Gates):
             The Manim circuit mobject. 
 
         """
-
-        circuit_data = self.circuit_data 
-        num_qubits = self.qc.num_qubits 
-        num_clbits = self.qc.num_clbits 
-
-        # y coordinates for qubit and clbit wires 
-        wire_y_pos = np.arange(num_qubits-1, -num_qubits, -2)
-        # Only one classical register currently 
-        clwire_y_pos = min(wire_y_pos)-3 
-
+        self.layout_columns(gap)
 
         # Will attach every gate with a unique ID 
         # Allowing user to remove individual gates
-        gate_references = {}
-        # List to store gates of same column in subarrays
-        grouped_ids = []
-        grouped_gates = [] 
-
-        for time in range(max(circuit_data['start_times'])+1): 
-            filtered_df = circuit_data[circuit_data['start_times'] == time] 
-
-            # Gates with identical start times are grouped in same column 
-            column_group = []
-            column_ids = []
-            for _, elements in filtered_df.iterrows(): 
-                category = elements['categories'] 
-                name = elements['names'] 
-                qiskit_name = elements['qiskit_names']
-                color = elements['colors'] 
-                params = elements['params'] 
-                qbits = elements['qbits'] 
-
-                y_value = wire_y_pos[qbits]
-
-                # Building circuit, initially placing all circuit gates 
-                # at x=0 position. Shifting appropriately afterwards
-
-                if category == 'single_qubit_gate': 
-                    gate = self.single(
-                            name, 
-                            x=0, 
-                            y=y_value[0], 
-                            color=color, 
-                            params=params, 
-                    ) 
-                elif category == 'cx_like_gate': 
-                    if hasattr(self, name.lower()):
-                        method = getattr(self, name.lower())
-                        if callable(method): 
-                            if name.lower() != 'barrier': 
-                                try: 
-                                    gate = method(
-                                            x=0, 
-                                            y1=y_value[0], 
-                                            y2=y_value[1], 
-                                    )
-                                except TypeError as e: 
-                                    print(f"Error calling method {name.lower()} -- {e}")
-                            else: 
-                                try:
-                                    gate = method( 
-                                            x=0, 
-                                            y1=min(y_value), 
-                                            y2=max(y_value), 
-                                    )
-                                except TypeError as e: 
-                                    print(f"Error calling barrier method -- {e}")
-                elif category == 'cphase_gate': 
-                    gate = self.ctext(
-                            x=0, 
-                            y1=y_value[0], 
-                            y2=y_value[1], 
-                            params=[name, params], 
-                    )
-                elif category == 'general_controlled_gate': 
-                    gate = self.cgate(
-                            name=name,
-                            x=0, 
-                            y1=y_value[0], 
-                            y2=y_value[1], 
-                            params=params, 
-                    )
-                elif category == 'multi_qubit_gate': 
-                    # Logic to sort idx labels properly 
-                    sorted_idxs = sorted(range(len(qbits)), key=lambda x: qbits[x]) 
-                    gate = self.multiqubit(
-                            name=name, 
-                            x=0, 
-                            y=y_value, 
-                            color=color, 
-                            params=params,
-                            idxs=sorted_idxs, 
-                    )
-                elif category == 'multi_controlled_gate': 
-                    if name.lower() in ['ccx', 'ccy', 'ccz', 'cswap']: 
-                        if hasattr(self, name.lower()): 
-                            method = getattr(self, name.lower())
-                            if callable(method): 
-                                try: 
-                                    gate = method(
-                                            x=0, 
-                                            y1=y_value[0], 
-                                            y2=y_value[1], 
-                                            y3=y_value[2], 
-                                    )
-                                except TypeError as e: 
-                                    print(f"Error calling method {name.lower()} -- {e}") 
-                    else: 
-                        gate = self.cccgate(
-                                name=name, 
-                                x=0, 
-                                y1=y_value[0], 
-                                y2=y_value[1], 
-                                y3=y_value[2], 
-                                y4=y_value[3], 
-                                params=params,
-                        )
-                elif category == 'measure': 
-                    gate = self.measure(
-                            x=0, 
-                            y1=y_value[0], 
-                            y2=clwire_y_pos, 
-                    )
-                else: 
-                    raise UnboundLocalError(f'Unable to find gate category; gate {name} unbound.')
-
-                # Unique identification to individual gate
-                qubit_idxs = ''.join(map(str, qbits))
-                gate_id = f'{qiskit_name}_{qubit_idxs}_{time}' 
-                # Gate_id refers to mobject and its bounding box
-                gate_references[gate_id] = gate 
-
-                # Append gate to column 
-                column_group.append(gate)
-                column_ids.append(gate_id)
-
-            # Adds entire column of gates as sublist 
-            grouped_gates.append(column_group) 
-            grouped_ids.append(column_ids)
+        self.gate_references = {}
+        # Gate bounding boxes, measured once as each gate is placed
+        self.bboxes = BoundingBoxes(self.gate_references)
+        # Spatial index for hit-testing is built once the layout is final
+        self.gate_index = None
+
+        if self.cull_columns: 
+            self.gate_ids = self.circuit_data.gate_ids
+            self.circuit = VGroup()
+            self.viewport = ColumnViewport(
+                    self.column_bounds[:, 0], 
+                    self.column_bounds[:, 1], 
+                    self.materialize_column, 
+                    self.evict_column, 
+            )
+            return
 
-        # Aligns all circuits in column and adds them to universal gate list
-        start_pos = 0 
         gates = []
         gate_ids = []
-
-        for col_idx in range(len(grouped_gates)): 
-            column_gates = grouped_gates[col_idx]
-            column_ids = grouped_ids[col_idx]
-            # Aligns columns based on maximum column gate width 
-            max_gate_width = max([gate.width for gate in column_gates])
-            for gate_idx in range(len(column_gates)): 
-                gate = column_gates[gate_idx]
-                gate_id = column_ids[gate_idx]
-
-                gate = gate.shift(RIGHT*(start_pos+max_gate_width/2))
-
-                gates.append(gate)
-                gate_ids.append(gate_id)
-
-            start_pos += max_gate_width + gap
+        for column in range(len(self.column_times)): 
+            column_ids, column_gates = self.build_column(column)
+            gates.extend(column_gates)
+            gate_ids.extend(column_ids)
+            # Gate_id refers to mobject and its bounding box
+            self.gate_references.update(zip(column_ids, column_gates))
+            for gate_id in column_ids: 
+                self.bboxes.add(gate_id)
             
         # Universal gate mobject
         circuit = VGroup(*gates) 
+        self.build_wires(self.bboxes.union())
+
+        # Final circuit mobject, centered on the origin 
+        self.gate_ids = gate_ids
+        self.circuit = VGroup(circuit)
+        if len(self.bboxes): 
+            center = self.bboxes.center()
+            self.circuit.shift(-center)
+            self.bboxes.shift(-center)
+        return
+
+    def build_wires(self, bbox): 
+        """ 
+        Generates qubit and clbit wires spanning the bounding box `bbox` 
+        of the gates, np.array([lower_left, upper_right]) or None. 
+
+        """
+        num_clbits = self.qc.num_clbits 
+        wire_y_pos, clwire_y_pos = self.wire_positions()
+        # Wires and labels are placed relative to the circuit's left/right edges 
+        left, right = (bbox[0][0], bbox[1][0]) if bbox is not None else (0, 0)
 
         # Generating qubit and clbit wires 
         qwires = [] 
@@ -320,8 +280,8 @@ class ManiQCircuit(Scene, Gates):
         for wire in wire_y_pos: 
             qwires.append(
                 Line(
-                    start=np.array([circuit.get_center()[0]-circuit.width/2-0.3, wire, 0]),
-                    end=np.array([circuit.get_center()[0]+circuit.width/2+0.3, wire, 0]), 
+                    start=np.array([left-0.3, wire, 0]),
+                    end=np.array([right+0.3, wire, 0]), 
                     stroke_width=5,
                 )
             )
@@ -329,7 +289,7 @@ class ManiQCircuit(Scene, Gates):
                 MathTex(
                     rf"q_{idx}", 
                     fontsize=55, 
-                ).move_to([circuit.get_center()[0]-circuit.width/2-1, wire, 0])
+                ).move_to([left-1, wire, 0])
             )
             idx += 1
         qwires = VGroup(*qwires)
@@ -338,24 +298,24 @@ class ManiQCircuit(Scene, Gates):
         if num_clbits != 0: 
             cwires.append(
                 Line(
-                    start=np.array([circuit.get_center()[0]-circuit.width/2-0.3, clwire_y_pos+0.1, 0]), 
-                    end=np.array([circuit.get_center()[0]+circuit.width/2+0.3, clwire_y_pos+0.1, 0]), 
+                    start=np.array([left-0.3, clwire_y_pos+0.1, 0]), 
+                    end=np.array([right+0.3, clwire_y_pos+0.1, 0]), 
                     stroke_width=2, 
                     color=YELLOW_A,
                     )
             )
             cwires.append(
                 Line(
-                    start=np.array([circuit.get_center()[0]-circuit.width/2-0.3, clwire_y_pos-0.1, 0]), 
-                    end=np.array([circuit.get_center()[0]+circuit.width/2+0.3, clwire_y_pos-0.1, 0]),
+                    start=np.array([left-0.3, clwire_y_pos-0.1, 0]), 
+                    end=np.array([right+0.3, clwire_y_pos-0.1, 0]),
                     stroke_widith=2, 
                     color=YELLOW_A
                 )
             )
             cwires.append(
                 Line(
-                    start=np.array([circuit.get_center()[0]-circuit.width/2-0.05, clwire_y_pos-0.2, 0]), 
-                    end=np.array([circuit.get_center()[0]-circuit.width/2+0.05, clwire_y_pos, 0]), 
+                    start=np.array([left-0.05, clwire_y_pos-0.2, 0]), 
+                    end=np.array([left+0.05, clwire_y_pos, 0]), 
                     stroke_width=2, 
                     color=YELLOW_A
                 )
@@ -364,21 +324,103 @@ class ManiQCircuit(Scene, Gates):
                 Text(
                     "meas", 
                     font_size=55
-                ).move_to([circuit.get_center()[0]-circuit.width/2-1.5, clwire_y_pos, 0]))
+                ).move_to([left-1.5, clwire_y_pos, 0]))
             cwires.append(
                 MathTex(
                     rf"{num_clbits}", 
                     font_size=35
-                ).move_to([circuit.get_center()[0]-circuit.width/2-0.15, clwire_y_pos+0.3, 0]))
+                ).move_to([left-0.15, clwire_y_pos+0.3, 0]))
             idx += 1 
         cwires = VGroup(*cwires) 
 
-        # Final circuit mobject 
-        self.gate_ids = gate_ids
-        self.gate_references = gate_references
-        self.circuit = VGroup(circuit).move_to([0, 0, 0])
+        self.qwires, self.cwires = qwires, cwires
         return
 
+    @timed('assemble')
+    def scale_circuit(self): 
+        """ 
+        Default scaling of main circuit relative to pyglet window. 
+
+        With `cull_columns` set the circuit is scaled to the window height 
+        and left as wide as it is; the camera pans along it. 
+
+        """
+        if self.cull_columns: 
+            wire_y_pos, clwire_y_pos = self.wire_positions()
+            bottom = clwire_y_pos if self.qc.num_clbits else min(wire_y_pos)
+            self.scaling_factor = config.frame_height/(max(wire_y_pos)-bottom+1)*0.8
+
+            # Layout-space point placed at the scene origin, chosen so the 
+            # first column starts at the left edge of the window 
+            self.layout_center = np.array([
+                config.frame_width*0.45/self.scaling_factor, 
+                (max(wire_y_pos)+bottom)/2, 
+                0, 
+            ])
+            self.update_viewport()
+            return
+
+        self.scaling_factor = min(
+                config.frame_width/self.bboxes.width(), 
+                config.frame_height/self.bboxes.height(), 
+        )*0.8
+
+        # Scaled about the cached center, the gate boxes follow without re-measuring 
+        center = self.bboxes.center()
+        self.circuit.scale(self.scaling_factor, about_point=center)
+        self.bboxes.scale(self.scaling_factor, center)
+        return 
+
+    def update_viewport(self): 
+        """ 
+        Materialises the columns within the camera frame, plus 
+        `cull_margin` frame widths either side, and evicts the rest. 
+
+        """
+        center, width, _ = camera_frame(self.camera)
+        half_width = width*(0.5+self.cull_margin)
+
+        # Scene-space window back into layout-space 
+        x_min = (center[0]-half_width)/self.scaling_factor+self.layout_center[0]
+        x_max = (center[0]+half_width)/self.scaling_factor+self.layout_center[0]
+        self.viewport.update(x_min, x_max)
+        return
+
+    def materialize_column(self, column): 
+        """ 
+        Builds a column that came into view and places it in the scene. 
+
+        """
+        column_ids, column_gates = self.build_column(column)
+        for gate in column_gates: 
+            gate.shift(-self.layout_center).scale(self.scaling_factor, about_point=ORIGIN)
+
+        self.gate_references.update(zip(column_ids, column_gates))
+        for gate_id in column_ids: 
+            self.bboxes.add(gate_id)
+            if self.gate_index is not None: 
+                self.gate_index.insert(gate_id, self.gate_bbox(gate_id))
+
+        self.circuit.add(*column_gates)
+        return column_ids
+
+    def evict_column(self, column, column_ids): 
+        """ 
+        Drops the mobjects of a column that left the view. 
+
+        """
+        for gate_id in column_ids: 
+            gate = self.gate_references.pop(gate_id, None)
+            if gate is None: 
+                # Removed while on screen 
+                continue
+            self.circuit.remove(gate)
+            self.bboxes.remove(gate_id)
+            if self.gate_index is not None: 
+                self.gate_index.remove(gate_id)
+        return
+
+    @timed('assemble')
     def assemble(self):
         """ 
         Performs Manim circuit assembly instructions in correct order. 
@@ -387,20 +429,143 @@ class ManiQCircuit(Scene, Gates):
 
         self.sort_instructions()
         self.decompose() 
-        self.build_circuit() 
 
-        # Default scaling of main circuit relative to pyglet window
-        self.scaling_factor = min(
-                config.frame_width/self.circuit.width, 
-                config.frame_height/self.circuit.height, 
-        )*0.8
-
-        self.circuit.scale(self.scaling_factor)
+        # Keeps the statevector after every column for incremental updates
+        self.sv_engine = StatevectorEngine.from_sorted_instructions(
+                self.qc, 
+                self.sorted_instructions, 
+        )
+        self.build_circuit() 
+        self.scale_circuit()
         
-        print(self.qc)
-        print(self.circuit_data)
+        if self.verbose: 
+            print(self.qc)
+            print(self.circuit_data)
+            print(GLYPH_CACHE)
+            print(SHAPE_CACHE)
         return 
 
+    @timed('assemble')
+    def begin_stream(self, instructions, gap=0.5): 
+        """ 
+        Prepares the scene to stream in `instructions` instead of 
+        assembling a complete circuit. `self.qc` only provides the 
+        registers; instructions are appended to it as they are read. 
+
+        Columns are built in view only (`cull_columns`), so the gate 
+        mobjects stay bounded by the window however long the stream. 
+
+        Args: 
+            instructions (iterable): qiskit CircuitInstructions on the bits 
+                                     of self.qc, i.e. a streaming.QasmStream. 
+            gap (float): Manim-space horizontal gap between columns of gates. 
+
+        """
+        if len(self.qc.data): 
+            raise ValueError('Streamed circuits must start out empty.')
+
+        self.cull_columns = True
+        self.instruction_stream = iter(instructions)
+        self.qubit_idxs = {qubit: idx for idx, qubit in enumerate(self.qc.qubits)}
+        self.scheduler = LayerScheduler(self.qc.num_qubits)
+        # Instructions read so far, i.e. the original qc.data idx of the next one 
+        self.instructions_read = 0
+
+        # Empty circuit state, grown by add_columns 
+        self.sorted_instructions, self.instruction_idxs = [], []
+        self.decompose()
+        self.sv_engine = StatevectorEngine(
+                self.qc.num_qubits, 
+                [], 
+                self.qubit_idxs, 
+                self.qc.global_phase, 
+        )
+        self.build_circuit(gap)
+        self.scale_circuit()
+        return
+
+    def ingest(self, budget=0.008): 
+        """ 
+        Reads streamed instructions for up to `budget` seconds, then adds 
+        the columns they finished. Intended as a scene updater; once the 
+        stream is finished it returns at once, without being timed, so it 
+        adds no 'assemble' entry per frame. 
+
+        """
+        if self.instruction_stream is None: 
+            return
+        self.read_stream(budget)
+        return
+
+    @timed('assemble')
+    def read_stream(self, budget): 
+        """ 
+        Reads streamed instructions for `budget` seconds (see `ingest`). 
+
+        """
+        deadline = time.perf_counter()+budget
+        push = self.scheduler.push
+        finished = True
+        for instruction in self.instruction_stream: 
+            self.qc.append(instruction, copy=False)
+            start_time = push(
+                    self.instructions_read, 
+                    instruction, 
+                    [self.qubit_idxs[qubit] for qubit in instruction.qubits], 
+            )
+            # Zero-qubit operations have no column; only their phase counts
+            if start_time is None and instruction.operation.name == 'global_phase': 
+                self.sv_engine.add_phase(instruction.operation.params[0])
+            self.instructions_read += 1
+            if time.perf_counter() > deadline: 
+                finished = False
+                break
+
+        if finished: 
+            self.instruction_stream = None
+        self.add_columns(self.scheduler.pop_settled(flush=finished))
+        return
+
+    def add_columns(self, columns): 
+        """ 
+        Adds finished columns from LayerScheduler.pop_settled to the 
+        circuit table, simulation engine and layout. 
+
+        """
+        if not columns: 
+            return
+
+        sorted_instructions = [
+            (start_time, instruction) 
+            for start_time, layer in columns 
+            for _, instruction in layer
+        ]
+        data_idxs = [data_idx for _, layer in columns for data_idx, _ in layer]
+
+        circuit_data = CircuitTable.from_sorted_instructions(
+                self.qc, 
+                sorted_instructions, 
+                gate_registry(), 
+        )
+        gate_ids = circuit_data.gate_ids
+        self.circuit_data = self.circuit_data.concat(circuit_data)
+        self.gate_ids.extend(gate_ids)
+
+        self.gate_instructions.update(zip(gate_ids, sorted_instructions))
+        self.instruction_index.extend(gate_ids, data_idxs, self.instructions_read)
+        self.sv_engine.extend([
+            [instruction for _, instruction in layer] for _, layer in columns
+        ])
+
+        num_columns = len(self.column_bounds)
+        self.extend_layout(circuit_data)
+        self.viewport.extend(
+                self.column_bounds[num_columns:, 0], 
+                self.column_bounds[num_columns:, 1], 
+        )
+        self.update_viewport()
+        return
+
     def construct(self): 
         """
         Rendering Method. 
@@ -408,32 +573,68 @@ class ManiQCircuit(Scene, Gates):
         """ 
 
         def show_circuit(): 
-            self.play(self.camera.animate.move_to(self.circuit.get_center()))
+            # A culled circuit only spans the columns in view; show its start 
+            center = ORIGIN if self.cull_columns else self.bboxes.center()
+            self.play(self.camera.animate.move_to(center))
             return 
         self.show_circuit = show_circuit
 
-        self.assemble() 
-        self.play(DrawBorderThenFill(self.circuit))
+        # Demo circuit, unless a circuit was provided 
+        if not hasattr(self, 'qc'): 
+            from qiskit import QuantumCircuit
+            qc = QuantumCircuit(2)
+            qc.h([0, 1])
+            qc.cz(0,1)
+            qc.ry(np.pi/3 , 0)
+            qc.rx(np.pi/5, 1)
+            qc.measure_all()
+            self.qc = qc
+
+        if self.instruction_stream is not None: 
+            self.begin_stream(self.instruction_stream)
+        else: 
+            self.assemble() 
+
+        # Simulations run off the pyglet thread; results are swapped in every frame
+        self.simulations = SimulationWorker()
+        self.add_updater(lambda dt: self.simulations.poll())
+        if self.cull_columns: 
+            self.add_updater(lambda dt: self.update_viewport())
+
+        if self.instruction_stream is not None: 
+            # Columns appear as they are read 
+            self.add(self.circuit)
+            self.add_updater(lambda dt: self.ingest())
+        else: 
+            self.play(DrawBorderThenFill(self.circuit))
         self.interactive_embed() 
         return
 
-    def update_gate_pos(self): 
+    def gate_bbox(self, gate_id): 
         """
-        Update the Bounding Boxes for each Gate.
+        Current bounding box of a gate, np.array([lower_left, upper_right]).
 
         """
-        for gate_id in self.gate_ids:
-            # Checking if dictionary contains lists
-            # i.e. if this method has already been called
-            if not isinstance(self.gate_references[gate_id], list): 
-                gate = self.gate_references[gate_id]
-            else: 
-                gate = self.gate_references[gate_id][0]
+        return self.bboxes[gate_id].copy()
+
+    def update_gate_pos(self, *gate_ids): 
+        """
+        Update the Bounding Boxes used for hit-testing gates. 
 
-            # Update dictionary to contain mobject bbox
-            self.gate_references[gate_id] = [
-                gate, np.array([gate.get_corner(DL), gate.get_corner(UR)])
-            ]
+        With no arguments the spatial index is (re)built for every gate 
+        from the cached bounding boxes. Otherwise only the given gates -- 
+        i.e. gates that moved -- are re-measured and re-located on the 
+        next mouse press.
+
+        """
+        self.bboxes.invalidate(*gate_ids)
+        if gate_ids and self.gate_index is not None: 
+            self.gate_index.invalidate(*gate_ids)
+        else: 
+            self.gate_index = GateGrid.from_gate_ids(
+                    self.gate_references.keys(), 
+                    self.gate_bbox, 
+            )
         return
 
     def render_gate_label(self):
@@ -456,83 +657,227 @@ class ManiQCircuit(Scene, Gates):
             Is called upon a mouse press and updates the gate id 
 
             """
-            for gate_id, gate_data in self.gate_references.items():
-                gate_bbox = np.array(gate_data[1])
-
-                if (gate_bbox[0, 0] <= self.x_manim <= gate_bbox[1, 0] and 
-                    gate_bbox[0, 1] <= self.y_manim <= gate_bbox[1, 1]):
-        
-                    # Update current gate_label with selected gate's gate_id
-                    gate_label = Text(gate_id, color=GRAY_C, font_size=30).to_edge(DL)
-                    self.remove(self.gate_label)
-                    self.add(gate_label)
-                    self.gate_label = gate_label # Explicitly replacing -- embed finnicky
+            hits = self.gate_index.query(self.x_manim, self.y_manim)
+
+            if hits: 
+                # Smallest gate under the cursor, i.e. not the measure box over it
+                # Update current gate_label with selected gate's gate_id
+                gate_label = Text(hits[0], color=GRAY_C, font_size=30).to_edge(DL)
+                self.remove(self.gate_label)
+                self.add(gate_label)
+                self.gate_label = gate_label # Explicitly replacing -- embed finnicky
             return
         
         # Allow child function to be called explicitly outside parent 
-        self.update_gate_label = update_gate_label 
+        self.update_gate_label = timed('events')(update_gate_label)
         return
 
-    def render_distribution(self, shots=None, normalize=False, show_labels=False): 
+    def render_multi_select(self): 
+        """ 
+        Multi-select mode: shift-click toggles the gate under the cursor 
+        and shift-dragging from empty space selects every gate inside the 
+        rubber-band rectangle. Delete/Backspace removes the selection as 
+        a single edit through `remove_gates`. 
+
+        """
+        # gate_id -> highlight mobject of every selected gate 
+        self.selection = {}
+        # (anchor point, selection before the drag, rectangle) while dragging 
+        self.rubber_band = None
+
+        # Let ManiQ know multi-select is active 
+        self.multi_select_active = True 
+
+        def select(gate_ids): 
+            marks = []
+            for gate_id in gate_ids: 
+                if gate_id in self.selection or gate_id not in self.gate_references: 
+                    continue
+                # Drawn from the cached bounding box, no gate traversal 
+                bbox = self.gate_bbox(gate_id)
+                mark = Rectangle(
+                        width=bbox[1][0]-bbox[0][0]+0.1, 
+                        height=bbox[1][1]-bbox[0][1]+0.1, 
+                        color=BLUE_B, 
+                        stroke_width=3, 
+                ).move_to(bbox.mean(axis=0))
+                self.selection[gate_id] = mark
+                marks.append(mark)
+            if marks: 
+                self.add(*marks)
+            return
+
+        def deselect(gate_ids): 
+            marks = [self.selection.pop(gate_id, None) for gate_id in gate_ids]
+            marks = [mark for mark in marks if mark is not None]
+            if marks: 
+                self.remove(*marks)
+            return
+
+        def clear_selection(): 
+            deselect(list(self.selection))
+            return
+
+        def toggle_selection(x, y): 
+            """ 
+            Toggles the gate under (x, y). 
+
+            Returns: 
+                False if there is no gate there. 
+
+            """
+            hits = self.gate_index.query(x, y)
+            if not hits: 
+                return False
+            if hits[0] in self.selection: 
+                deselect(hits[:1])
+            else: 
+                select(hits[:1])
+            return True
+
+        def begin_rubber_band(x, y): 
+            anchor = np.array([x, y, 0])
+            band = Rectangle(width=0.01, height=0.01, color=BLUE_B, stroke_width=2).move_to(anchor)
+            self.rubber_band = (anchor, set(self.selection), band)
+            self.add(band)
+            return
+
+        def drag_rubber_band(x, y): 
+            """ 
+            Stretches the band to (x, y); the selection follows it live. 
+
+            """
+            anchor, initial, band = self.rubber_band
+            corner = np.array([x, y, 0])
+            band.stretch_to_fit_width(max(abs(x-anchor[0]), 0.01))
+            band.stretch_to_fit_height(max(abs(y-anchor[1]), 0.01))
+            band.move_to((anchor+corner)/2)
+
+            inside = self.gate_index.query_rect(anchor, corner, contained=True)
+            keep = initial.union(inside)
+            deselect([gate_id for gate_id in self.selection if gate_id not in keep])
+            select(inside)
+            return
+
+        def end_rubber_band(): 
+            if self.rubber_band is not None: 
+                self.remove(self.rubber_band[2])
+                self.rubber_band = None
+            return
+
+        def remove_selected(): 
+            self.remove_gates(list(self.selection))
+            return
+
+        # Allow child functions to be called explicitly outside parent 
+        self.select = select
+        self.deselect = deselect
+        self.clear_selection = clear_selection
+        self.toggle_selection = toggle_selection
+        self.begin_rubber_band = begin_rubber_band
+        self.drag_rubber_band = timed('events')(drag_rubber_band)
+        self.end_rubber_band = end_rubber_band
+        self.remove_selected = remove_selected
+        return
+
+    def simulation_placeholder(self, location): 
+        """ 
+        Placeholder mobject shown while a background simulation runs. 
+
+        """
+        return Text('Simulating...', color=GRAY_C, font_size=40).move_to(location)
+
+    def render_distribution(self, shots=None, normalize=False, show_labels=False, top_k=None, bucket=None): 
         """ 
         Render calculated statevector from executing displayed circuit on 
         trivial statevector |000...>. 
 
-        """ 
-        # Calculate measurement distribution mobject
-        self.meas_dist = [ConvertToManim(self.qc).meas_dist(
-                shots=shots, 
-                normalize=normalize, 
-                show_labels=show_labels, 
-        )] 
+        The distribution is simulated in the background; a placeholder is 
+        shown until the result lands. Wide registers are shown as the 
+        `top_k` outcomes plus "other", or bucketed by Hamming weight or a 
+        qubit subset (see QiskitCalculations.histogram_bars). 
 
+        """ 
         # Measurement Distribution location in scene
         self.distribution_location = np.array([config.frame_width, 0, 0])
-        self.meas_dist[0].move_to(self.distribution_location)
+
+        # Placeholder until the measurement distribution is calculated
+        self.meas_dist = [self.simulation_placeholder(self.distribution_location)]
 
         # Add distribution to scene
         self.add(self.meas_dist[0])
         # Number of displaying distributions 
         self.number_distributions = 1 
+        # Simulation settings of each distribution 
+        self.distribution_settings = [None]
+
+        def place_distribution(idx, meas_dist): 
+            """ 
+            Swaps `meas_dist` into the scene as the distribution at idx. 
 
-        def update_distribution(idx, shots=None, normalize=False, show_labels=False): 
             """
-            Recalculates the measurement count/distribution and updates the 
-            distribution mobject at the chosen idx.  
+            if hasattr(self, 'dist_locations'): 
+                meas_dist.scale_to_fit_width(self.dist_width*0.8)
+                meas_dist.move_to([self.dist_locations[idx],0,0])
+            else: 
+                meas_dist.move_to(self.distribution_location)
 
+            # Replace old measurement distribution with new one.
+            self.remove(self.meas_dist[idx]) 
+            self.add(meas_dist) 
+            self.meas_dist[idx] = meas_dist 
+            return
+
+        def request_distribution(idx, shots=None, normalize=False, show_labels=False, top_k=None, bucket=None): 
             """ 
-            # Updated distribution mobject
-            meas_dist_update = ConvertToManim(self.qc).meas_dist(
+            Simulates and reduces the distribution at idx in the background. 
+            Only the chart mobject is built on the scene thread, from at most 
+            max_bars bars, once they land. 
+
+            """
+            # Kept so edits can re-request the same distribution 
+            self.distribution_settings[idx] = dict(
                     shots=shots, 
                     normalize=normalize, 
                     show_labels=show_labels, 
-            ).move_to(self.distribution_location)
-            meas_dist_update.scale_to_fit_width(self.dist_width*0.8)
-            meas_dist_update.move_to([self.dist_locations[idx],0,0])
+                    top_k=top_k, 
+                    bucket=bucket, 
+            )
+            converter = ConvertToManim(self.qc, engine=self.sv_engine)
+            self.simulations.submit(
+                    f'distribution_{idx}', 
+                    lambda: converter.distribution(shots=shots, top_k=top_k, bucket=bucket), 
+                    lambda bars: place_distribution(idx, converter.meas_dist(
+                        normalize=normalize, 
+                        show_labels=show_labels, 
+                        bars=bars, 
+                    )), 
+            )
+            return
 
-            # Replace old measurement distribution with new one.
-            self.remove(self.meas_dist[idx]) 
-            self.add(meas_dist_update) 
-            self.meas_dist[idx] = meas_dist_update 
+        def update_distribution(idx, shots=None, normalize=False, show_labels=False, top_k=None, bucket=None): 
+            """
+            Recalculates the measurement count/distribution and updates the 
+            distribution mobject at the chosen idx.  
+
+            """ 
+            # Current distribution stays displayed until the update lands
+            request_distribution(idx, shots, normalize, show_labels, top_k, bucket)
             return
 
         def show_distribution(): 
             self.play(self.camera.animate.move_to(self.distribution_location))
             return 
 
-        def add_distribution(shots=None, normalize=False, show_labels=False): 
+        def add_distribution(shots=None, normalize=False, show_labels=False, top_k=None, bucket=None): 
             """
             Adds another distribution to the scene and scales all 
             current distributions to fit within the config frame window. 
 
             """ 
-            # New distribution mobject
-            new_dist = ConvertToManim(self.qc).meas_dist(
-                shots=shots, 
-                normalize=normalize, 
-                show_labels=show_labels, 
-            )
-            self.meas_dist.append(new_dist)
+            # Placeholder for the new distribution mobject
+            self.meas_dist.append(self.simulation_placeholder(self.distribution_location))
+            self.distribution_settings.append(None)
 
             # Number of displaying distributions 
             num_dists = len(self.meas_dist)
@@ -550,8 +895,12 @@ class ManiQCircuit(Scene, Gates):
                 self.meas_dist[loc_idx].scale_to_fit_width(self.dist_width*0.8)
                 self.meas_dist[loc_idx].move_to([self.dist_locations[loc_idx],0,0])
                 self.add(self.meas_dist[loc_idx]) 
+
+            request_distribution(num_dists-1, shots, normalize, show_labels, top_k, bucket)
             return 
 
+        request_distribution(0, shots, normalize, show_labels, top_k, bucket)
+
         # Allow update method to be called outside parent 
         self.update_distribution = update_distribution
         self.show_distribution = show_distribution
@@ -563,63 +912,351 @@ class ManiQCircuit(Scene, Gates):
         Render density matrix hinton plots calculated from evolving trival 
         statevector through circuit. 
 
-        """ 
-        # Real and Imaginary Density Plots
-        real_hinton_plot, imag_hinton_plot = ConvertToManim(self.qc).density_matrix_hinton() 
+        The density matrix is simulated in the background; a placeholder 
+        is shown until the result lands. 
 
-        real_hinton_plot.scale_to_fit_height(config.frame_height * 0.5) 
-        imag_hinton_plot.scale_to_fit_height(config.frame_height * 0.5) 
-        real_hinton_plot.shift(LEFT*config.frame_width/4).shift(UP*config.frame_height)
-        imag_hinton_plot.shift(RIGHT*config.frame_width/4).shift(UP*config.frame_height)
+        """ 
+        density_location = np.array([0, config.frame_height, 0])
+        placeholder = self.simulation_placeholder(density_location)
+        self.density_plots = [placeholder]
+        self.add(placeholder)
+
+        def place_density_plot(rho): 
+            # Real and Imaginary Density Plots
+            real_hinton_plot, imag_hinton_plot = ConvertToManim(
+                    self.qc, 
+                    engine=self.sv_engine, 
+            ).density_matrix_hinton(rho=rho)
+
+            real_hinton_plot.scale_to_fit_height(config.frame_height * 0.5) 
+            imag_hinton_plot.scale_to_fit_height(config.frame_height * 0.5) 
+            real_hinton_plot.shift(LEFT*config.frame_width/4).shift(UP*config.frame_height)
+            imag_hinton_plot.shift(RIGHT*config.frame_width/4).shift(UP*config.frame_height)
+
+            self.remove(*self.density_plots)
+            self.density_plots = [real_hinton_plot, imag_hinton_plot]
+            self.add(real_hinton_plot, imag_hinton_plot)
+            return
 
-        self.add(real_hinton_plot, imag_hinton_plot)
+        converter = ConvertToManim(self.qc, engine=self.sv_engine)
+        self.simulations.submit('density_plot', converter.density_matrix, place_density_plot)
 
         def show_density_plot(): 
-            self.play(self.camera.animate.move_to([0, config.frame_height, 0]))
+            self.play(self.camera.animate.move_to(density_location))
 
         def update_density_plot(): 
-            self.remove(real_hinton_plot, imag_hinton_plot) 
-            self.render_density_plot()
+            # Current plots stay displayed until the update lands
+            self.simulations.submit('density_plot', converter.density_matrix, place_density_plot)
             return 
 
         self.update_density_plot = update_density_plot
         self.show_density_plot = show_density_plot
         return
 
+    def column_highlight_bounds(self, start_time): 
+        """ 
+        Manim-space [left, right] x of the layout column at `start_time`,
+        or None if it holds no gates.
+
+        """ 
+        if self.cull_columns: 
+            column = np.searchsorted(self.column_times, start_time)
+            if column == len(self.column_times) or self.column_times[column] != start_time: 
+                return None
+            return (self.column_bounds[column]-self.layout_center[0])*self.scaling_factor
+
+        col_start, col_end = np.searchsorted(self.circuit_data.start_times, [start_time, start_time+1])
+        bbox = self.bboxes.union(
+            self.circuit_data.gate_id(row) for row in range(col_start, col_end)
+        )
+        if bbox is None: 
+            return None
+        return np.array([bbox[0][0], bbox[1][0]])
+
+    def render_step_through(self, show_labels=False, run_time=0.5): 
+        """ 
+        Step-through mode: highlights each layout column in turn and
+        animates the state probabilities from before to after it.
+
+        The state after every column is evolved once, in a single pass of
+        the statevector engine on the simulation worker, and kept;
+        stepping or scrubbing to any column afterwards is instant.
+
+        Args: 
+            show_labels (bool): Label bars with their basis state.
+            run_time (float): Duration of each step animation.
+
+        """ 
+        # Chart sits below the circuit
+        step_location = np.array([0, -config.frame_height*0.75, 0])
+        placeholder = self.simulation_placeholder(step_location)
+        self.step_chart = [placeholder]
+        self.add(placeholder)
+
+        # Column highlight, hidden on step 0 (the initial state |000...>)
+        # A culled circuit is laid out around the origin
+        if self.cull_columns: 
+            highlight_height, highlight_center = config.frame_height*0.8, ORIGIN
+        else: 
+            highlight_height, highlight_center = self.bboxes.height()+0.4, self.bboxes.center()
+        self.step_highlight = Rectangle(
+                width=1,
+                height=highlight_height,
+                color=YELLOW,
+                stroke_width=4,
+        ).move_to(highlight_center).set_stroke(opacity=0)
+        self.add(self.step_highlight)
+        self.step_column = 0
+        # (columns+1, bars) probabilities, set once simulated
+        # At most ConvertToManim.max_bars bars, however wide the register
+        self.step_probabilities = None
+
+        def place_step_chart(histogram): 
+            bar_names, self.step_probabilities = histogram
+            bar_chart, title = ConvertToManim(self.qc).step_chart(
+                    self.step_probabilities[self.step_column],
+                    bar_names=bar_names,
+            )
+            step_chart = VGroup(bar_chart, title)
+            step_chart.scale_to_fit_height(config.frame_height*0.45).move_to(step_location)
+
+            self.remove(*self.step_chart)
+            self.step_chart = [bar_chart, title]
+            self.add(bar_chart, title)
+            return
+
+        def request_step_chart(): 
+            converter = ConvertToManim(self.qc, engine=self.sv_engine)
+            self.simulations.submit(
+                    'step_through', 
+                    lambda: converter.step_histogram(show_labels=show_labels), 
+                    place_step_chart, 
+            )
+            return
+
+        def step_to(step, animate=True): 
+            """ 
+            Shows the state after `step` columns, i.e. step 0 is |000...>
+            and step c+1 the state after column c.
+
+            """ 
+            if self.step_probabilities is None: 
+                print('Step-through states are still simulating.')
+                return
+            step = int(np.clip(step, 0, len(self.step_probabilities)-1))
+            self.step_column = step
+
+            values = np.maximum(self.step_probabilities[step], ConvertToManim.min_bar_value)
+            bounds = self.column_highlight_bounds(step-1) if step > 0 else None
+
+            highlight = self.step_highlight.generate_target()
+            if bounds is None: 
+                highlight.set_stroke(opacity=0)
+            else: 
+                highlight.stretch_to_fit_width(bounds[1]-bounds[0]+0.2)
+                highlight.set_x(bounds.mean()).set_stroke(opacity=1)
+
+            # Culled circuits pan to columns outside the frame
+            center, width, _ = camera_frame(self.camera)
+            pan = bounds is not None and self.cull_columns and abs(bounds.mean()-center[0]) > width/2
+
+            if animate: 
+                animations = [
+                    self.step_chart[0].animate.change_bar_values(values),
+                    MoveToTarget(self.step_highlight),
+                ]
+                if pan: 
+                    animations.append(self.camera.animate.set_x(bounds.mean()))
+                self.play(*animations, run_time=run_time)
+            else: 
+                self.step_chart[0].change_bar_values(values)
+                self.step_highlight.become(highlight)
+                if pan: 
+                    self.camera.set_x(bounds.mean())
+            return
+
+        def step_forward(): 
+            step_to(self.step_column+1)
+            return
+
+        def step_backward(): 
+            step_to(self.step_column-1)
+            return
+
+        def play_through(): 
+            """ 
+            Steps through every column from the initial state.
+
+            """ 
+            step_to(0, animate=False)
+            for step in range(1, len(self.step_probabilities)): 
+                step_to(step)
+            return
+
+        def show_step_through(): 
+            self.play(self.camera.animate.move_to(step_location))
+            return
+
+        def update_step_through(): 
+            # States are re-evolved from the first edited column onward
+            self.step_probabilities = None
+            request_step_chart()
+            return
+
+        request_step_chart()
+
+        self.step_to = step_to
+        self.step_forward = step_forward
+        self.step_backward = step_backward
+        self.play_through = play_through
+        self.show_step_through = show_step_through
+        self.update_step_through = update_step_through
+        return
+
     def remove_gate(self, gate_id):
         """
         Removes a specific gate corresponding to 'gate_id' in the scene. 
         Updates the stored quantum circuit to not contain that gate. 
 
         """
+        self.remove_gates([gate_id])
+        return
 
-        # Remove gate from display 
-        self.remove(self.gate_references.get(gate_id)[0]) 
+    @timed('events')
+    def remove_gates(self, gate_ids): 
+        """
+        Removes every gate in `gate_ids` from the scene and the stored 
+        quantum circuit as one edit: the circuit table is filtered, 
+        self.qc updated and the statevector engine invalidated once, 
+        then every open simulation is re-requested once. 
 
-        # Filter circuit dataframe to drop row with specific gate_id
-        self.circuit_data = self.circuit_data[self.circuit_data['gate_id'] != gate_id]
+        Args: 
+            gate_ids (iterable): gate_ids to remove. Unknown ids are ignored. 
+
+        """
+        gate_ids = [gate_id for gate_id in dict.fromkeys(gate_ids) if gate_id in self.gate_instructions]
+        if not gate_ids: 
+            return
+        removed = set(gate_ids)
+
+        if getattr(self, 'multi_select_active', False): 
+            self.deselect(gate_ids)
+
+        # Remove gates from display (culled columns may not be built)
+        gates = [self.gate_references.pop(gate_id, None) for gate_id in gate_ids]
+        gates = [gate for gate in gates if gate is not None]
+        if gates: 
+            self.remove(*gates) 
+            self.circuit.remove(*gates)
+        for gate_id in gate_ids: 
+            self.bboxes.remove(gate_id)
+            if self.gate_index is not None: 
+                self.gate_index.remove(gate_id)
+        self.gate_ids = [gate_id for gate_id in self.gate_ids if gate_id not in removed]
+
+        # Only columns from the earliest removed gate onward need re-evolving
+        self.sv_engine.remove_many([self.gate_instructions.pop(gate_id) for gate_id in gate_ids])
+        # Results of in-flight simulations are now stale
+        self.simulations.supersede()
+
+        # Filter circuit table to drop the rows of every removed gate
+        self.circuit_data = self.circuit_data.drop(gate_ids)
+
+        # Update self.qc attribute in place, keeping the original gate objects
+        for position in self.instruction_index.pop_many(gate_ids): 
+            del self.qc.data[position]
+
+        self.refresh_simulations()
+        return
+
+    def refresh_simulations(self): 
+        """ 
+        Re-requests every simulation currently displayed, i.e. once after 
+        an edit. Current results stay shown until the new ones land. 
 
-        # Update self.qc attribute
-        updater_instance = CircuitUpdate(self.circuit_data) 
-        self.qc = updater_instance.update_circuit()
+        """
+        if hasattr(self, 'update_distribution'): 
+            for idx, settings in enumerate(self.distribution_settings): 
+                if settings is not None: 
+                    self.update_distribution(idx, **settings)
+        if hasattr(self, 'update_density_plot'): 
+            self.update_density_plot()
+        if hasattr(self, 'update_step_through'): 
+            self.update_step_through()
         return
 
 
+    @timed('events')
     def on_mouse_press(self, point, button, modifiers):
         """
         Runs everytime mouse is pressed in pyglet window
 
         """
 
-        # Get cursor coordinates in manim-space
-        self.x_manim, self.y_manim = global_cursor_to_manim(self, 1)
+        # Event point in manim-space under the current camera frame
+        self.x_manim, self.y_manim = event_to_manim(point, self.camera)
+
+        # Index is built once; later only moved gates are re-located
+        hit_testing = getattr(self, 'gate_label_active', False) or getattr(self, 'multi_select_active', False)
+        if hit_testing and self.gate_index is None: 
+            self.update_gate_pos()
 
         if hasattr(self, 'gate_label_active'):
             if self.gate_label_active: 
-                self.update_gate_pos()
                 self.update_gate_label() 
 
+        if hasattr(self, 'multi_select_active'): 
+            if self.multi_select_active and modifiers & key.MOD_SHIFT: 
+                self.end_rubber_band()
+                # Pressing on empty space starts a rubber band instead 
+                if not self.toggle_selection(self.x_manim, self.y_manim): 
+                    self.begin_rubber_band(self.x_manim, self.y_manim)
+
         super().on_mouse_press(point, button, modifiers)
         return 
 
+    def on_mouse_drag(self, point, d_point, buttons, modifiers): 
+        """
+        Stretches the rubber band while one is active, otherwise 
+        leaves the drag to manim's camera controls. 
+
+        """
+        if getattr(self, 'rubber_band', None) is not None: 
+            self.drag_rubber_band(*event_to_manim(point, self.camera))
+            return
+        super().on_mouse_drag(point, d_point, buttons, modifiers)
+        return
+
+    def on_mouse_motion(self, point, d_point): 
+        """
+        Shift-motion pans the camera in manim; not while multi-selecting. 
+
+        """
+        if getattr(self, 'multi_select_active', False): 
+            self.mouse_point.move_to(point)
+            return
+        super().on_mouse_motion(point, d_point)
+        return
+
+    def on_key_press(self, symbol, modifiers): 
+        """
+        Delete/Backspace removes the selected gates in multi-select mode. 
+
+        """
+        if getattr(self, 'multi_select_active', False) and symbol in (key.DELETE, key.BACKSPACE): 
+            self.remove_selected()
+            return
+        super().on_key_press(symbol, modifiers)
+        return
+
+    def on_key_release(self, symbol, modifiers): 
+        """
+        Releasing shift ends the rubber band, keeping its selection. 
+
+        """
+        if symbol in (key.LSHIFT, key.RSHIFT) and getattr(self, 'rubber_band', None) is not None: 
+            self.end_rubber_band()
+        super().on_key_release(symbol, modifiers)
+        return
+
 
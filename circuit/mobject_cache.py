@@ -0,0 +1,77 @@
+"""
+In-process cache for mobjects that are expensive to build
+but repeat many times across a circuit (i.e. LaTeX gate labels).
+
+"""
+
+
+class MobjectCache:
+    """
+    Builds each distinct mobject once and hands back copies.
+
+    Copying a mobject only duplicates its point arrays, whereas
+    building a MathTex compiles or parses LaTeX SVG every time.
+
+    """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Name of the cache, shown in its stats.
+
+        """
+        self.name = name
+        self.mobjects = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """
+        Returns a copy of the mobject cached under `key`.
+
+        Args:
+            key (hashable): Uniquely identifies the mobject's appearance.
+            build (callable): Builds the mobject on a cache miss.
+
+        Returns:
+            A fresh copy of the cached mobject, safe to move/modify.
+
+        """
+        mobj = self.mobjects.get(key)
+        if mobj is None:
+            self.misses += 1
+            mobj = build()
+            self.mobjects[key] = mobj
+        else:
+            self.hits += 1
+        return mobj.copy()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Cache counters as a dictionary.
+
+        """
+        return {
+            'name': self.name,
+            'entries': len(self.mobjects),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+        }
+
+    def clear(self):
+        self.mobjects.clear()
+        self.hits = 0
+        self.misses = 0
+        return
+
+    def __repr__(self):
+        return (
+            f'{self.name}: {len(self.mobjects)} entries, '
+            f'{self.hits} hits, {self.misses} misses ({self.hit_rate:.1%} hit rate)'
+        )
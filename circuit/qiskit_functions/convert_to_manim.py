@@ -1,7 +1,6 @@
 from manim import * 
 from qiskit_functions.qiskit_calculations import QiskitCalculations
-from qiskit import QuantumCircuit
-from qiskit.quantum_info import DensityMatrix
+from instrumentation import timed
 
 import itertools
 
@@ -13,8 +12,12 @@ class ConvertToManim(QiskitCalculations):
     manim mobjects for display. 
 
     """ 
-    def __init__(self, qc): 
+    # Bars never shrink to zero height so they can be rescaled when animated
+    min_bar_value = 1e-6
+
+    def __init__(self, qc, engine=None): 
         self.qc = qc 
+        self.engine = engine 
 
     def statevector(self):
         # Calculate final statevector from evolving the circuit 
@@ -24,14 +27,23 @@ class ConvertToManim(QiskitCalculations):
         latex_mobj = MathTex(latex_str, font_size=25, color=GRAY_C)
         return latex_mobj 
 
-    def meas_dist(self, shots=None, normalize=False, show_labels=False): 
+    def meas_dist(self, shots=None, normalize=False, show_labels=False, seed=None, bars=None, 
+                  top_k=None, bucket=None): 
+        """ 
+        Builds the measurement distribution bar chart. 
+
+        Args: 
+            bars (tuple): Precomputed (bar names, values, shots) from 
+                          `distribution`, i.e. from a background simulation. 
+            top_k, bucket: Bar reduction, see `histogram_bars`. 
 
-        # Calculate measurement distribution 
-        dist, counts, shots = self.get_counts(shots=shots)
+        """
 
-        bar_labels = [meas_label for meas_label in dist.keys()]
-        prob_vals = [meas_prob for meas_prob in dist.values()]
-        meas_vals = [meas_val for meas_val in counts.values()]
+        # Bounded number of bars however wide the register 
+        if bars is None: 
+            bars = self.distribution(shots=shots, seed=seed, top_k=top_k, bucket=bucket)
+        bar_labels, (prob_vals, meas_vals), shots = bars
+        prob_vals, meas_vals = prob_vals.tolist(), meas_vals.tolist()
 
         if not normalize:
             # Shot count distributoin
@@ -73,21 +85,123 @@ class ConvertToManim(QiskitCalculations):
                 meas_dist = VGroup(bar_chart, shot_label)
         return meas_dist 
 
-    def density_matrix_hinton(self):
+    @timed('simulation')
+    def step_histogram(self, show_labels=False): 
+        """ 
+        Bars of the step-through chart for every column. 
+
+        Every column shares the same bars so the chart can be animated 
+        with `BarChart.change_bar_values`: all basis states if there are 
+        at most max_bars, otherwise the max_bars-1 states most likely at 
+        any column plus an "other" bar. Picking those takes a second pass 
+        over the columns, as only one state is held at a time. 
+
+        Args: 
+            show_labels (bool): Name bars with their basis state. 
+
+        Returns: 
+            (bar names or None, values of shape (columns+1, bars)). 
+
+        """
+        num_qubits = self.qc.num_qubits
+        num_states = 2**num_qubits
+        top = None
+        if num_states > self.max_bars: 
+            # Peak probability of each basis state over all columns
+            peak = np.zeros(num_states)
+            for probabilities in self.column_probabilities(): 
+                np.maximum(peak, probabilities, out=peak)
+            top_k = self.max_bars-1
+            top = np.sort(np.argpartition(peak, -top_k)[-top_k:])
+
+        rows = []
+        for probabilities in self.column_probabilities(): 
+            if top is None: 
+                rows.append(probabilities)
+            else: 
+                kept = probabilities[top]
+                rows.append(np.append(kept, probabilities.sum()-kept.sum()))
+        values = np.stack(rows)
+
+        bar_names = None
+        if show_labels: 
+            idxs = range(num_states) if top is None else top
+            bar_names = [format(idx, f'0{num_qubits}b') for idx in idxs]
+            if top is not None: 
+                bar_names.append(r"\text{other}")
+        return bar_names, values
+
+    def step_chart(self, values, bar_names=None): 
+        """ 
+        Builds the probability bar chart animated by step-through mode. 
+
+        Args: 
+            values (np.ndarray): Bar values of one column, from step_histogram. 
+            bar_names (list): Bar names from step_histogram, if labelled. 
+
+        Returns: 
+            (bar chart, title) -- the chart is animated with 
+            `BarChart.change_bar_values`. 
+
+        """
+        bar_chart = BarChart(
+            values=np.maximum(values, self.min_bar_value), 
+            bar_names=bar_names, 
+            y_range=[0, 1, 0.2], 
+            x_axis_config={'font_size': 36}
+        )
+        title = Tex(rf"State Probabilities", font_size=40).next_to(bar_chart, DOWN)
+        return bar_chart, title
+
+    def density_matrix_hinton(self, rho=None):
+        """ 
+        Builds real and imaginary density matrix Hinton plots. 
+
+        Args: 
+            rho (DensityMatrix): Precomputed density matrix, 
+                                 i.e. from a background simulation. 
+
+        """
         # Emulating Qiskit's plot_state_hinton density matrix visualization
         def hinton_size(value, max_size=1.4): 
-            return max_size * np.sqrt(abs(value)) 
+            return max_size * np.sqrt(np.abs(value)) 
+
+        def hinton_squares(values, positive, color): 
+            """
+            Builds every Hinton square of one sign as a single VMobject. 
+            Each square is a closed subpath of straight bezier curves, 
+            with sizes and positions computed by numpy for all cells at once. 
+
+            """
+            mask = values > 0 if positive else values < 0 
+            rows, cols = np.nonzero(mask) 
+            half_sides = hinton_size(values[rows, cols]) / 2 
+
+            centers = top_left + np.stack(
+                [cols * spacing, -rows * spacing, np.zeros(len(rows))], 
+                axis=1, 
+            )
+            # Corners of each square, traversed as a closed loop 
+            corners = centers[:, None, :] + half_sides[:, None, None] * square_loop[None]
+            starts, ends = corners[:, :-1], corners[:, 1:]
 
-        def hinton_color(value): 
-            return BLUE_C if value >= 0 else GRAY_C
+            mesh = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
 
-        # Removing any measurement gates from the circuit
-        self.qc.data = [
-            instruction for instruction in self.qc.data if instruction.operation.name != 'measure'
-        ]
+            # Straight edges as bezier curves; 4 points per curve in cairo, 3 in opengl 
+            if hasattr(mesh, 'n_points_per_curve'): 
+                points_per_curve = mesh.n_points_per_curve 
+            else: 
+                points_per_curve = mesh.n_points_per_cubic_curve 
+            alphas = np.linspace(0, 1, points_per_curve)[None, None, :, None]
+            points = starts[:, :, None, :] + alphas * (ends - starts)[:, :, None, :]
+
+            mesh.set_points(points.reshape(-1, 3))
+            return mesh 
 
-        # Density matrix nxn numpy array
-        rho = DensityMatrix(self.qc) 
+        # Density matrix nxn numpy array, derived from the shared statevector
+        # Measurement gates are dropped when calculating the statevector
+        if rho is None: 
+            rho = self.density_matrix() 
         dm_array = rho.data 
 
         real_part = dm_array.real 
@@ -99,39 +213,18 @@ class ConvertToManim(QiskitCalculations):
 
         # Define the top-left as the 0,0 position of the matrix
         top_left = np.array([-(n-1)/2, (n-1)/2, 0]) 
+        # Unit square corner offsets, starting and ending at the upper right
+        square_loop = np.array([[1, 1, 0], [-1, 1, 0], [-1, -1, 0], [1, -1, 0], [1, 1, 0]])
 
-        # Generate real and imaginary Hinton mobjects
-        real_squares = [] 
-        imag_squares = []
-        for i in range(n): 
-            for j in range(n): 
-                real_val = real_part[i, j] 
-                real_side_len = hinton_size(real_val) 
-                real_color = hinton_color(real_val) 
-
-                real_sq = Square(side_length=real_side_len) 
-                real_sq.set_fill(real_color, opacity=1.0) 
-                real_sq.set_stroke(width=0) 
-
-                real_shift_x = j * spacing
-                real_shift_y = -i * spacing 
-                real_sq.move_to(top_left + np.array([real_shift_x, real_shift_y, 0]))
-
-                real_squares.append(real_sq)
-
-                imag_val = imag_part[i, j] 
-                imag_side_len = hinton_size(imag_val) 
-                imag_color = hinton_color(imag_val) 
-
-                imag_sq = Square(side_length=imag_side_len) 
-                imag_sq.set_fill(imag_color, opacity=1.0) 
-                imag_sq.set_stroke(width=0) 
-
-                imag_shift_x = j * spacing
-                imag_shift_y = -i * spacing 
-                imag_sq.move_to(top_left + np.array([imag_shift_x, imag_shift_y, 0]))
-
-                imag_squares.append(imag_sq)
+        # Generate real and imaginary Hinton mobjects, one mesh per sign color 
+        real_squares = [
+            hinton_squares(real_part, positive=True, color=BLUE_C), 
+            hinton_squares(real_part, positive=False, color=GRAY_C), 
+        ]
+        imag_squares = [
+            hinton_squares(imag_part, positive=True, color=BLUE_C), 
+            hinton_squares(imag_part, positive=False, color=GRAY_C), 
+        ]
 
         # Background of squares
         real_background = Square(
@@ -144,14 +237,7 @@ class ConvertToManim(QiskitCalculations):
         )
         real_tex = MathTex(rf"Re[\rho]").next_to(real_background, UP)
 
-        imag_background = Square(
-                side_length=n * spacing, 
-                color=BLACK, 
-                fill_opacity=1.0, 
-        ).set_stroke(width=0)
-        imag_background.move_to(
-            top_left + np.array([(n-1) * spacing / 2, -(n-1) * spacing / 2, 0])
-        )
+        imag_background = real_background.copy() 
         imag_tex = MathTex(rf"Im[\rho]").next_to(imag_background, UP)
 
         # Axis labels
@@ -162,24 +248,24 @@ class ConvertToManim(QiskitCalculations):
             num_qubits = int(np.log2(n))
             bit_strings = ["".join(seq) for seq in product("01", repeat=num_qubits)]
 
-            # X-axis labels
+            # X-axis labels, each bit string Text is only built once
             x_labels = VGroup()
             for col in range(n):
                 label = Text(bit_strings[col], font_size=24)
                 label.move_to(top_left + np.array([col*spacing, -(n-1)*spacing-axis_offset, 0]))
                 x_labels.add(label)
 
-            # Y-axis labels
+            # Y-axis labels, copied from the x-axis labels
             y_labels = VGroup()
             for row in range(n):
-                label = Text(bit_strings[row], font_size=24)
+                label = x_labels[row].copy()
                 label.move_to(top_left + np.array([-axis_offset, -row * spacing, 0]))
                 y_labels.add(label)
 
             return x_labels, y_labels
 
         real_x_labels, real_y_labels = add_axis_labels(n, top_left, spacing)
-        imag_x_labels, imag_y_labels = add_axis_labels(n, top_left, spacing)
+        imag_x_labels, imag_y_labels = real_x_labels.copy(), real_y_labels.copy()
 
         # Final real and imaginary density matrix Hinton plots
         real_hinton_plot = VGroup(real_background, real_tex, *real_squares, real_x_labels, real_y_labels)
@@ -190,6 +276,7 @@ class ConvertToManim(QiskitCalculations):
 
 class Tests(Scene):
     def construct(self):
+        from qiskit import QuantumCircuit
         qc = QuantumCircuit(2)
         qc.h([0, 1])
         qc.cz(0,1)
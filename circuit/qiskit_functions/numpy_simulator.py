@@ -0,0 +1,149 @@
+"""
+Native numpy statevector simulator.
+
+The statevector is held as a rank-n tensor with one axis of size 2 per
+qubit, and each gate is contracted into the axes of the qubits it acts
+on with np.tensordot. Diagonal gates (Z, S, T, P, RZ, CZ, CP, RZZ, ...)
+are applied as a broadcast elementwise product instead.
+
+Covers every qiskit standard gate listed in gates.yaml, and any other
+gate whose matrix qiskit can build directly. Circuits containing
+anything else (i.e. resets or control flow) are reported as
+unsupported so callers can fall back to Aer.
+
+"""
+
+import numpy as np
+
+
+# Operations ignored when simulating the statevector
+SKIPPED_OPERATIONS = ('measure', 'barrier', 'delay')
+
+# Beyond this, multithreaded Aer outruns the numpy simulator even with
+# its start-up cost (see benchmarks/bench_simulator.py)
+MAX_QUBITS = 16
+
+# name -> (matrix tensor, diagonal tensor or None) of parameterless gates
+_MATRIX_CACHE = {}
+
+
+def gate_tensors(operation):
+    """
+    Matrix of a k-qubit gate reshaped to a (2,)*2k tensor, plus its
+    diagonal reshaped to (2,)*k if the matrix is diagonal.
+
+    Returns:
+        (matrix, diagonal), or None if the operation has no matrix.
+
+    """
+    cached = _MATRIX_CACHE.get(operation.name) if not operation.params else None
+    if cached is not None:
+        return cached
+
+    try:
+        matrix = np.asarray(operation.to_matrix(), dtype=complex)
+    except Exception:
+        return None
+
+    num_qubits = operation.num_qubits
+    diagonal = np.diagonal(matrix)
+    if np.count_nonzero(matrix - np.diag(diagonal)):
+        diagonal = None
+    else:
+        diagonal = diagonal.reshape((2,)*num_qubits)
+
+    tensors = (matrix.reshape((2,)*(2*num_qubits)), diagonal)
+    if not operation.params:
+        _MATRIX_CACHE[operation.name] = tensors
+    return tensors
+
+
+def apply_gate(state, tensors, qargs):
+    """
+    Applies a gate to a statevector tensor.
+
+    Args:
+        state (np.ndarray): Statevector tensor of shape (2,)*n. Axis 0 is
+                            the most significant qubit, i.e. qubit n-1.
+        tensors (tuple): (matrix, diagonal) from `gate_tensors`.
+        qargs (list): Qubit idxs the gate acts on, in qiskit order
+                      (qargs[0] is the least significant bit of the matrix).
+
+    Returns:
+        The evolved statevector tensor.
+
+    """
+    matrix, diagonal = tensors
+    num_qubits = state.ndim
+
+    # Matrix axes run from its most significant qubit, qargs[-1], down
+    axes = [num_qubits-1-qarg for qarg in reversed(qargs)]
+
+    if diagonal is not None:
+        # Broadcast the diagonal over the untouched axes
+        shape = [1]*num_qubits
+        order = np.argsort(axes)
+        for axis in axes:
+            shape[axis] = 2
+        return state * np.transpose(diagonal, order).reshape(shape)
+
+    k = len(qargs)
+    evolved = np.tensordot(matrix, state, axes=(list(range(k, 2*k)), axes))
+    # tensordot puts the gate's output axes first
+    return np.moveaxis(evolved, list(range(k)), axes)
+
+
+def evolve(data, instructions, qubit_idxs):
+    """
+    Evolves a flat statevector through `instructions`.
+
+    Args:
+        data (np.ndarray): Statevector of length 2**n.
+        instructions (iterable): qiskit CircuitInstructions.
+        qubit_idxs (dict): Maps each qiskit Qubit to its wire index.
+
+    Returns:
+        The evolved flat statevector, or None if an instruction is not
+        supported natively.
+
+    """
+    num_qubits = int(np.log2(len(data)))
+    state = np.asarray(data, dtype=complex).reshape((2,)*num_qubits)
+
+    for instruction in instructions:
+        operation = instruction.operation
+        if operation.name in SKIPPED_OPERATIONS:
+            continue
+        tensors = gate_tensors(operation)
+        if tensors is None:
+            return None
+        state = apply_gate(state, tensors, [qubit_idxs[qubit] for qubit in instruction.qubits])
+
+    return state.reshape(-1)
+
+
+def simulate_statevector(qc):
+    """
+    Final statevector of `qc` run on |000...>, ignoring measurements.
+
+    Returns:
+        Flat np.ndarray of length 2**num_qubits, or None if the circuit
+        holds an operation that is not supported natively.
+
+    """
+    qubit_idxs = {qubit: idx for idx, qubit in enumerate(qc.qubits)}
+
+    data = np.zeros(2**qc.num_qubits, dtype=complex)
+    data[0] = 1
+    data = evolve(data, qc.data, qubit_idxs)
+    if data is None:
+        return None
+
+    global_phase = qc.global_phase
+    if global_phase:
+        try:
+            data = data * np.exp(1j*float(global_phase))
+        except TypeError:
+            # Unbound parameter in the global phase
+            return None
+    return data
@@ -1,7 +1,9 @@
-from qiskit import ClassicalRegister, QuantumCircuit, transpile 
-from qiskit_aer import Aer
-from qiskit.quantum_info import Statevector
-from qiskit.primitives import Sampler
+from qiskit_functions.simulation_cache import SIMULATION_CACHE
+from qiskit_functions.numpy_simulator import MAX_QUBITS, simulate_statevector
+from instrumentation import timed
+
+import numpy as np 
+
 
 class QiskitCalculations: 
     """ 
@@ -11,80 +13,270 @@ class QiskitCalculations:
         - Returning measurement probabilities 
         - Returning resultant statevectors/density matrices
 
+    Statevectors are simulated natively with numpy; Aer, imported on 
+    first use, is only the fallback for unsupported operations. 
+
     """
 
-    def __init__(self, qc):
+    # Default multinomial seed, so sampled histograms are reproducible
+    sampling_seed = 0
+    # Wider distributions are cut to their top outcomes plus an "other" bar
+    max_bars = 32
+
+    def __init__(self, qc, engine=None):
+        """
+        Args: 
+            qc (qiskit QuantumCircuit): Circuit to perform calculations on. 
+            engine (StatevectorEngine): Optional per-column statevector engine. 
+                                        Used instead of re-simulating the circuit 
+                                        or consulting SIMULATION_CACHE.
+
+        """
         self.qc = qc 
+        self.engine = engine 
 
     def sv(self): 
         """ 
         Runs the circuit and returns the final statevector. 
 
         """
-        
-        self.qc.data = [instr for instr in self.qc.data if instr.operation.name != "measure"]
+
+        # Incremental engine already tracks the final statevector
+        if self.engine is not None: 
+            return self.engine.state()
+
+        # Identical circuits are only simulated once across instances
+        return SIMULATION_CACHE.statevector(self.qc, self.simulate)
+
+    @timed('simulation')
+    def simulate(self): 
+        """ 
+        Simulates the circuit, ignoring measurements. Runs on the numpy 
+        simulator unless the circuit is large or holds an unsupported 
+        operation. 
+
+        """
+        from qiskit.quantum_info import Statevector
+
+        if self.qc.num_qubits > MAX_QUBITS: 
+            return self.simulate_aer()
+
+        data = simulate_statevector(self.qc)
+        if data is None: 
+            return self.simulate_aer()
+        return Statevector(data)
+
+    @timed('simulation')
+    def simulate_aer(self): 
+        """ 
+        Simulates the circuit on Aer, ignoring measurements. 
+
+        """
+        from qiskit import transpile 
+        from qiskit_aer import Aer
+
+        qc = self.qc.copy()
+        qc.data = [instr for instr in qc.data if instr.operation.name != "measure"]
         simulator = Aer.get_backend('statevector_simulator')
-        transpiled_qc = transpile(self.qc, simulator) 
+        # Higher optimization levels elide SWAPs into a final layout, 
+        # which would permute the returned statevector 
+        transpiled_qc = transpile(qc, simulator, optimization_level=0) 
         job = simulator.run(transpiled_qc).result()
 
         sv = job.get_statevector(transpiled_qc) 
         return sv
+
+    @timed('simulation')
+    def density_matrix(self): 
+        """ 
+        Density matrix of the final state, derived from the statevector. 
+
+        """
+        from qiskit.quantum_info import DensityMatrix
+
+        if self.engine is not None: 
+            return DensityMatrix(self.engine.state())
+        return SIMULATION_CACHE.density_matrix(self.qc, self.simulate)
     
-    def get_counts(self, shots=None): 
+    @timed('simulation')
+    def probabilities(self): 
         """ 
-        Runs the circuit and outputs the measurement probabilities.
-        Uses sampler primitive. 
+        Exact measurement probabilities |amplitude|^2 of the final 
+        statevector, indexed by basis state. Computed once per circuit 
+        and shared through the simulation cache. 
+
+        """
+
+        # Engine caches probabilities until the circuit is edited
+        if self.engine is not None: 
+            return self.engine.probabilities()
 
+        return SIMULATION_CACHE.probabilities(self.qc, self.simulate)
+    
+    def column_states(self): 
         """ 
+        Statevectors before the first and after every layout column, 
+        yielded one at a time in one pass (see StatevectorEngine.column_states). 
+
+        """
+        engine = self.engine 
+        if engine is None: 
+            from qiskit_functions.statevector_engine import StatevectorEngine
+            from scheduler import schedule_instructions
 
-        def add_missing_measurements(qc):
-            
-            num_qubits = qc.num_qubits 
-
-            # Ensuring classical register exists for measurement gates
-            if not qc.cregs: 
-                classical_reg = ClassicalRegister(num_qubits, 'c')
-                qc.add_register(classical_reg) 
-
-            # Finding which qubits already have measurement gates
-            measured_qubits = set() 
-            for instruction in qc.data:
-                if instruction.operation.name == 'measure': 
-                    measured_idxs = [qc.find_bit(qubit).index for qubit in instruction.qubits]
-                    for idx in measured_idxs: 
-                        measured_qubits.add(idx)
-
-            # Adds measurement gate to first quantum register
-            qc.barrier()
-            for qubit in range(num_qubits): 
-                if qubit not in measured_qubits: 
-                    qc.measure(qubit, qc.cregs[0][qubit])
-            return qc
-
-        # Add missing measurement gates, if any
-        add_missing_measurements(self.qc)
-
-        # Initialize Sampler Primitive
-        sampler = Sampler()
-
-        # Run simulation (exact if counts not specified)
-        result = sampler.run([self.qc], shots=shots).result()
-        dist = result.quasi_dists[0] 
-        dist = {bin(qubit_idx)[2:]: val for qubit_idx, val in dist.items()}
-
-        # If shots not specified, set shots=1000
-        if not shots: 
+            engine = StatevectorEngine.from_sorted_instructions(
+                    self.qc, 
+                    schedule_instructions(self.qc), 
+            )
+        return engine.column_states()
+
+    def column_probabilities(self): 
+        """ 
+        Measurement probabilities of the state before the first and after 
+        every layout column. The c+1-th yielded array holds the 
+        probabilities after column c. 
+
+        Yielded one column at a time, so only a single 2**n array of 
+        probabilities exists at once. 
+
+        """
+        for state in self.column_states(): 
+            yield np.abs(state)**2
+    
+    def sample_counts(self, shots=None, seed=None): 
+        """ 
+        Exact measurement probabilities and measurement counts of every 
+        basis state, as arrays indexed by basis state. 
+
+        Counts are drawn with a seeded multinomial from the cached exact 
+        probabilities, so repeated calls with different shot counts cost 
+        a single simulation. 
+
+        Args: 
+            shots (int): Number of shots to sample. If not specified, 
+                         counts are the expected counts for 1000 shots. 
+            seed (int): Seed for the multinomial sampler. Defaults to 
+                        `sampling_seed`, so the same circuit and shots 
+                        always give the same histogram. 
+
+        Returns: 
+            (probabilities, counts, shots) 
+
+        """
+        probs = self.probabilities()
+
+        if shots: 
+            if seed is None: 
+                seed = self.sampling_seed
+            rng = np.random.default_rng(seed)
+            counts = rng.multinomial(shots, probs / probs.sum())
+        else: 
+            # If shots not specified, set shots=1000
             shots = 1000
-        
-        counts = {qubit_idx: val * shots for qubit_idx, val in dist.items()}
-         
+            counts = probs * shots
+        return probs, counts, shots
+
+    def get_counts(self, shots=None, seed=None): 
+        """ 
+        Outputs the exact measurement probabilities of every qubit and, 
+        given `shots`, a sampled histogram of measurement counts, as 
+        dictionaries keyed by bit string (see `sample_counts`). 
+
+        Builds one entry per nonzero outcome; use `distribution` for 
+        wide registers. 
+
+        """ 
+        probs, counts, shots = self.sample_counts(shots=shots, seed=seed)
+
+        # Only outcomes with nonzero probability are displayed
+        outcomes = np.flatnonzero(probs > 1e-12)
+        dist = {bin(qubit_idx)[2:]: probs[qubit_idx] for qubit_idx in outcomes}
+        counts = {bin(qubit_idx)[2:]: counts[qubit_idx] for qubit_idx in outcomes}
         return dist, counts, shots
 
+    def histogram_bars(self, outcomes, values, top_k=None, bucket=None): 
+        """ 
+        Reduces a distribution over basis states to a bounded number of bars. 
+        Pure numpy over the outcome arrays; only the kept bars are named. 
 
+        Args: 
+            outcomes (np.ndarray): Basis state idx of each outcome. 
+            values (array-like): One row of values per outcome series 
+                                 (i.e. probabilities, counts). Bars are 
+                                 ranked on the first row. 
+            top_k (int): Keep the k largest bars (k >= 1) and sum the rest 
+                         into an "other" bar. Applied automatically with 
+                         k = max_bars-1 when there are more than max_bars bars. 
+            bucket (str or list): 'hamming' sums outcomes of equal Hamming 
+                                  weight; a list of qubit idxs marginalises 
+                                  onto those qubits (first idx = last bit). 
 
+        Returns: 
+            (bar names, values of shape (series, bars)). 
 
+        Raises: 
+            ValueError: If top_k is less than 1. 
 
-    
+        """
+        if top_k is not None and top_k < 1: 
+            raise ValueError(f'top_k must be at least 1, got {top_k}.')
+
+        outcomes = np.asarray(outcomes, dtype=np.int64)
+        values = np.asarray(values, dtype=float).reshape(len(values), -1)
+        name = lambda key: bin(key)[2:]
 
+        if bucket is not None: 
+            keys = np.zeros_like(outcomes)
+            if bucket == 'hamming': 
+                for qubit in range(self.qc.num_qubits): 
+                    keys += (outcomes >> qubit) & 1
+                num_keys = self.qc.num_qubits+1
+                name = lambda key: rf"w={key}"
+            else: 
+                qubits = list(bucket)
+                for bit, qubit in enumerate(qubits): 
+                    keys |= ((outcomes >> qubit) & 1) << bit
+                num_keys = 2**len(qubits)
+                name = lambda key: format(key, f'0{len(qubits)}b')
 
+            values = np.stack([
+                np.bincount(keys, weights=series, minlength=num_keys) for series in values
+            ])
+            # Only buckets with nonzero probability are displayed
+            outcomes = np.flatnonzero(values[0] > 0)
+            values = values[:, outcomes]
+
+        num_bars = values.shape[1]
+        if top_k is None and num_bars > self.max_bars: 
+            top_k = self.max_bars-1
+        if top_k is not None and num_bars > top_k: 
+            # Linear-time selection; kept bars stay in basis-state order 
+            top = np.sort(np.argpartition(values[0], -top_k)[-top_k:])
+            other = values.sum(axis=1)-values[:, top].sum(axis=1)
+            values = np.column_stack((values[:, top], other))
+            return [name(key) for key in outcomes[top]] + [r"\text{other}"], values
+
+        return [name(key) for key in outcomes], values
+
+    def distribution(self, shots=None, seed=None, top_k=None, bucket=None): 
+        """ 
+        Bars of the measurement distribution chart, reduced to a bounded 
+        number with `histogram_bars`. Array work only, so it is meant 
+        to run in the background; the scene thread just builds the chart. 
+
+        Returns: 
+            (bar names, values of shape (2, bars), shots), the rows 
+            holding the exact probabilities and the counts. 
+
+        """
+        probs, counts, shots = self.sample_counts(shots=shots, seed=seed)
 
+        # Only outcomes with nonzero probability are displayed
+        outcomes = np.flatnonzero(probs > 1e-12)
+        names, values = self.histogram_bars(
+                outcomes, 
+                [probs[outcomes], counts[outcomes]], 
+                top_k=top_k, 
+                bucket=bucket, 
+        )
+        return names, values, shots
@@ -0,0 +1,197 @@
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+
+import numpy as np
+
+
+# Operations that never change the simulated statevector
+IGNORED_OPERATIONS = ('barrier', 'delay')
+
+
+@lru_cache(maxsize=1)
+def _standard_names():
+    from qiskit.circuit.library import get_standard_gate_name_mapping
+    return frozenset(get_standard_gate_name_mapping())
+
+
+def _param_key(param):
+    # Large arrays (i.e. unitary gates) would be summarised by repr
+    if isinstance(param, np.ndarray):
+        return hashlib.blake2b(param.tobytes(), digest_size=16).hexdigest()
+    return repr(param)
+
+
+def _update_fingerprint(digest, qc):
+    qubit_idxs = {qubit: idx for idx, qubit in enumerate(qc.qubits)}
+    clbit_idxs = {clbit: idx for idx, clbit in enumerate(qc.clbits)}
+
+    digest.update(repr((qc.num_qubits, qc.num_clbits, repr(qc.global_phase))).encode())
+    for instruction in qc.data:
+        operation = instruction.operation
+        name = operation.name
+        if name in IGNORED_OPERATIONS:
+            continue
+
+        qubits = tuple(qubit_idxs[qubit] for qubit in instruction.qubits)
+        clbits = tuple(clbit_idxs[clbit] for clbit in instruction.clbits)
+        params = []
+        for param in operation.params:
+            if hasattr(param, 'qubits') and hasattr(param, 'data'):
+                # Control-flow blocks are circuits themselves
+                digest.update(b'(')
+                _update_fingerprint(digest, param)
+                digest.update(b')')
+            else:
+                params.append(_param_key(param))
+        condition = getattr(operation, 'condition', None)
+        digest.update(repr((name, qubits, clbits, tuple(params), repr(condition))).encode())
+
+        # Custom gates can share a name but not a definition
+        if name not in _standard_names() and not operation.params:
+            definition = getattr(operation, 'definition', None)
+            if definition is not None:
+                digest.update(b'{')
+                _update_fingerprint(digest, definition)
+                digest.update(b'}')
+    return
+
+
+def circuit_fingerprint(qc):
+    """
+    Structural hash of everything that determines a circuit's simulated
+    result: the number of qubits and clbits, the global phase and every
+    instruction's name, qubit and clbit idxs, params and classical
+    condition, in circuit order. Control-flow blocks and the definitions
+    of custom gates are hashed recursively. Only barriers and delays are
+    skipped.
+
+    Args:
+        qc (qiskit QuantumCircuit): Circuit to fingerprint.
+
+    Returns:
+        Hex digest string identifying the circuit.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_fingerprint(digest, qc)
+    return digest.hexdigest()
+
+
+class SimulationCache:
+    """
+    Process-wide cache of simulation results keyed by circuit fingerprint.
+
+    Used by every QiskitCalculations/ConvertToManim built without a
+    StatevectorEngine: batch renders, scripts and the Tests scene. The
+    interactive ManiQCircuit scene does not consult it; its engine
+    already keeps the final state and probabilities, updated
+    incrementally per edit, and fingerprinting self.qc from the
+    simulation thread would race edits made on the scene thread.
+
+    Only the statevector is simulated; measurement probabilities are
+    derived from it on demand and stored alongside it, and density
+    matrices are derived on demand without being stored. Entries are
+    evicted least-recently-used once their total size exceeds `max_bytes`.
+
+    """
+
+    def __init__(self, max_bytes=256 * 2**20):
+        """
+        Args:
+            max_bytes (int): Upper bound on the bytes held by cached arrays.
+
+        """
+        self.max_bytes = max_bytes
+        # fingerprint -> {'statevector': Statevector, 'probabilities': np.ndarray or None}
+        self.entries = OrderedDict()
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _entry_bytes(entry):
+        nbytes = entry['statevector'].data.nbytes
+        if entry['probabilities'] is not None:
+            nbytes += entry['probabilities'].nbytes
+        return nbytes
+
+    def _evict(self):
+        # Least recently used entries are at the front
+        while self.nbytes > self.max_bytes and self.entries:
+            _, entry = self.entries.popitem(last=False)
+            self.nbytes -= self._entry_bytes(entry)
+        return
+
+    def _entry(self, qc, simulate):
+        """
+        Cached entry for `qc`, simulating it with `simulate()` on a miss.
+
+        Returns:
+            The circuit fingerprint and its entry.
+
+        """
+        fingerprint = circuit_fingerprint(qc)
+
+        entry = self.entries.get(fingerprint)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(fingerprint)
+            return fingerprint, entry
+
+        self.misses += 1
+        entry = {'statevector': simulate(), 'probabilities': None}
+
+        # States larger than the whole budget are returned but not kept
+        entry_bytes = self._entry_bytes(entry)
+        if entry_bytes <= self.max_bytes:
+            self.entries[fingerprint] = entry
+            self.nbytes += entry_bytes
+            self._evict()
+        return fingerprint, entry
+
+    def statevector(self, qc, simulate):
+        """
+        Final statevector of `qc`.
+
+        Args:
+            qc (qiskit QuantumCircuit): Circuit being simulated.
+            simulate (callable): Returns the statevector on a cache miss.
+
+        """
+        _, entry = self._entry(qc, simulate)
+        return entry['statevector']
+
+    def probabilities(self, qc, simulate):
+        """
+        Exact measurement probabilities of `qc`, derived from the
+        cached statevector.
+
+        """
+        fingerprint, entry = self._entry(qc, simulate)
+        if entry['probabilities'] is None:
+            entry['probabilities'] = entry['statevector'].probabilities()
+            # Only entries still held by the cache count toward its size
+            if self.entries.get(fingerprint) is entry:
+                self.nbytes += entry['probabilities'].nbytes
+                self._evict()
+        return entry['probabilities']
+
+    def density_matrix(self, qc, simulate):
+        """
+        Density matrix of `qc`, derived from the cached statevector.
+        Not stored, as it is 2^n times larger than the statevector.
+
+        """
+        from qiskit.quantum_info import DensityMatrix
+        return DensityMatrix(self.statevector(qc, simulate))
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+        return
+
+
+# Shared across every QiskitCalculations instance
+SIMULATION_CACHE = SimulationCache()
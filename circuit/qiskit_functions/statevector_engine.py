@@ -0,0 +1,294 @@
+from qiskit_functions.numpy_simulator import SKIPPED_OPERATIONS, apply_gate, gate_tensors
+from instrumentation import timed
+
+import cmath
+import threading
+
+
+class StatevectorEngine:
+    """
+    Incrementally evolves the trivial statevector |000...> through a circuit
+    one layout column at a time.
+
+    The statevector before every `interval`-th column (the `start_times`
+    groups from ManiQCircuit.sort_instructions) is kept as a checkpoint,
+    so an edit at column k only re-evolves columns from the checkpoint
+    at or before k to the end the next time a state is requested. The
+    interval widens for wide registers so the checkpoints never hold
+    more than max_checkpoint_bytes.
+
+    The circuit's global phase and GlobalPhaseGates, which have no layout
+    column, are applied as one scalar factor to every state returned.
+
+    Safe to query from a background simulation thread while the scene
+    thread edits the circuit: columns are evolved outside the lock, and
+    an evolution that raced with an edit is discarded rather than stored.
+
+    """
+
+    # Operations that do not evolve the statevector
+    skipped_operations = SKIPPED_OPERATIONS
+    # Keep the state before every checkpoint_interval-th column at least
+    checkpoint_interval = 8
+    # Memory budget of the checkpoints, widening the interval if needed
+    max_checkpoint_bytes = 512 * 2**20
+
+    def __init__(self, num_qubits, columns, qubit_idxs, global_phase=0):
+        """
+        Args:
+            num_qubits (int): Number of qubits in the circuit.
+            columns (list): One list of qiskit CircuitInstructions per layout column.
+            qubit_idxs (dict): Maps each qiskit Qubit to its wire index.
+            global_phase (float): Global phase of the circuit.
+
+        """
+        self.num_qubits = num_qubits
+        self.columns = [list(column) for column in columns]
+        self.qubit_idxs = qubit_idxs
+
+        # c -> statevector *before* column c is applied, for every c
+        # that is a multiple of `interval`
+        # |000...> is only allocated on the first state request
+        self.checkpoints = {}
+        self.interval = self._interval()
+        # States before columns 0..num_valid are up to date
+        self.num_valid = 0
+        # (c, state) of the last state evolved, i.e. the final one
+        self.last = (None, None)
+
+        # |amplitude|^2 of the final state, cleared on edits
+        self._probabilities = None
+
+        # Number of column evolutions performed, useful for profiling edits
+        self.column_updates = 0
+
+        # Guards columns/checkpoints; `edits` counts invalidations
+        self.lock = threading.Lock()
+        self.edits = 0
+
+        # exp(1j*phase) of the global phase and every GlobalPhaseGate
+        self.phase = 1
+        self.add_phase(global_phase)
+
+    @classmethod
+    def from_sorted_instructions(cls, qc, sorted_instructions):
+        """
+        Builds the engine from the (start_time, instruction) pairs
+        generated by ManiQCircuit.sort_instructions.
+
+        """
+        qubit_idxs = {qubit: idx for idx, qubit in enumerate(qc.qubits)}
+
+        columns = []
+        for start_time, instruction in sorted_instructions:
+            while len(columns) <= start_time:
+                columns.append([])
+            columns[start_time].append(instruction)
+
+        engine = cls(qc.num_qubits, columns, qubit_idxs, qc.global_phase)
+        # LayerScheduler leaves zero-qubit operations out of the columns
+        for instruction in qc.data:
+            if not instruction.qubits and instruction.operation.name == 'global_phase':
+                engine.add_phase(instruction.operation.params[0])
+        return engine
+
+    def add_phase(self, phase):
+        """
+        Multiplies every returned state by exp(1j*phase), i.e. for a
+        GlobalPhaseGate, which has no layout column.
+
+        """
+        try:
+            factor = cmath.exp(1j*float(phase))
+        except TypeError:
+            # Unbound parameter, as in the gates it would be evolved with
+            return
+        with self.lock:
+            self.phase *= factor
+        return
+
+    def extend(self, columns):
+        """
+        Appends layout columns, i.e. while a circuit is streamed in.
+        States of the existing columns stay valid.
+
+        """
+        with self.lock:
+            self.columns.extend(list(column) for column in columns)
+            interval = self._interval()
+            if interval != self.interval:
+                self.interval = interval
+                self.checkpoints = {
+                    idx: state for idx, state in self.checkpoints.items() if idx % interval == 0
+                }
+            self._probabilities = None
+            self.edits += 1
+        return
+
+    def _interval(self):
+        # Doubled until the checkpoints fit the memory budget, so a wider
+        # interval's checkpoints are a subset of the narrower one's
+        state_bytes = 16 * 2**self.num_qubits
+        max_checkpoints = max(1, self.max_checkpoint_bytes // state_bytes)
+        interval = self.checkpoint_interval
+        while len(self.columns) // interval + 1 > max_checkpoints:
+            interval *= 2
+        return interval
+
+    def invalidate(self, column):
+        """
+        Marks the state after `column` and every later column as stale.
+
+        """
+        with self.lock:
+            self.num_valid = min(self.num_valid, column)
+            # Stale states are dropped rather than kept until overwritten
+            for idx in [idx for idx in self.checkpoints if idx > column]:
+                del self.checkpoints[idx]
+            if self.last[0] is not None and self.last[0] > column:
+                self.last = (None, None)
+            self._probabilities = None
+            self.edits += 1
+        return
+
+    def remove(self, column, instruction):
+        """
+        Removes `instruction` from `column` and invalidates every
+        state from that column onward.
+
+        """
+        self.remove_many([(column, instruction)])
+        return
+
+    def remove_many(self, column_instructions):
+        """
+        Removes several (column, instruction) pairs, invalidating once
+        from the earliest column touched.
+
+        """
+        first_column = None
+        with self.lock:
+            for column, instruction in column_instructions:
+                instructions = self.columns[column]
+                for idx, column_instruction in enumerate(instructions):
+                    if column_instruction is instruction:
+                        del instructions[idx]
+                        break
+                else:
+                    raise ValueError(f'Instruction not found in column {column}.')
+                first_column = column if first_column is None else min(first_column, column)
+
+        if first_column is not None:
+            self.invalidate(first_column)
+        return
+
+    @timed('simulation')
+    def evolve_column(self, state, instructions):
+        """
+        Applies every instruction of a column to `state`, contracting
+        gate matrices into the state tensor with numpy. Operations
+        without a matrix fall back to Statevector.evolve.
+
+        """
+        from qiskit.quantum_info import Statevector
+
+        tensor = state.data.reshape((2,)*self.num_qubits)
+        for instruction in instructions:
+            if instruction.operation.name in self.skipped_operations:
+                continue
+            qargs = [self.qubit_idxs[qubit] for qubit in instruction.qubits]
+
+            tensors = gate_tensors(instruction.operation)
+            if tensors is None:
+                state = Statevector(tensor.reshape(-1)).evolve(instruction.operation, qargs=qargs)
+                tensor = state.data.reshape((2,)*self.num_qubits)
+            else:
+                tensor = apply_gate(tensor, tensors, qargs)
+
+        self.column_updates += 1
+        return Statevector(tensor.reshape(-1))
+
+    def state(self, column=None):
+        """
+        Returns the statevector after `column` has been applied, global
+        phase included. Defaults to the final statevector of the circuit.
+
+        """
+        from qiskit.quantum_info import Statevector
+
+        state = self._state(column)
+        if self.phase != 1:
+            state = Statevector(state.data*self.phase)
+        return state
+
+    def _state(self, column=None):
+        """
+        Statevector after `column` without the global phase. Evolves from
+        the latest up-to-date state at or before the column: the last
+        state evolved, or else the nearest checkpoint.
+
+        """
+        from qiskit.quantum_info import Statevector
+
+        target = len(self.columns) if column is None else column+1
+
+        while True:
+            with self.lock:
+                limit = min(target, self.num_valid)
+                idx = limit // self.interval * self.interval
+                if idx == 0 and 0 not in self.checkpoints:
+                    self.checkpoints[0] = Statevector.from_int(0, 2**self.num_qubits)
+                state = self.checkpoints[idx]
+
+                last_idx, last_state = self.last
+                if last_idx is not None and idx < last_idx <= limit:
+                    idx, state = last_idx, last_state
+                if idx == target:
+                    return state
+
+                instructions = list(self.columns[idx])
+                edits = self.edits
+
+            # Evolved outside the lock so edits never wait on a simulation
+            state = self.evolve_column(state, instructions)
+
+            with self.lock:
+                # Discard if the circuit was edited in the meantime
+                if self.edits == edits:
+                    idx += 1
+                    if idx % self.interval == 0:
+                        self.checkpoints[idx] = state
+                    self.last = (idx, state)
+                    self.num_valid = max(self.num_valid, idx)
+
+    def column_states(self):
+        """
+        Every intermediate statevector, yielded one at a time in a single
+        pass. Entry 0 is |000...>, entry c+1 the state after column c,
+        both with the global phase applied.
+
+        Only checkpoints are kept, so iterating costs one column
+        evolution per column but no more memory than a single state.
+
+        Yields:
+            Complex np.ndarrays of length 2**num_qubits.
+
+        """
+        for column in range(-1, len(self.columns)):
+            yield self.state(column).data
+
+    def probabilities(self):
+        """
+        Exact measurement probabilities of the final statevector.
+        Cached until the next edit.
+
+        """
+        probabilities = self._probabilities
+        if probabilities is None:
+            edits = self.edits
+            # The global phase does not change probabilities
+            probabilities = self._state().probabilities()
+            with self.lock:
+                if self.edits == edits:
+                    self._probabilities = probabilities
+        return probabilities
@@ -0,0 +1,184 @@
+from collections import defaultdict
+
+import numpy as np
+
+
+class GateGrid:
+    """
+    Uniform grid over gate bounding boxes in manim-space.
+
+    Every gate is bucketed into each grid cell its bounding box overlaps,
+    so hit-testing a point only checks the gates in a single cell instead
+    of scanning every gate in the circuit. Bounding boxes are only
+    recomputed for gates explicitly invalidated (i.e. mobjects that moved).
+
+    """
+
+    def __init__(self, locate, cell_size=1.0):
+        """
+        Args:
+            locate (callable): Maps a gate_id to its current bounding box,
+                               np.array([lower_left, upper_right]).
+            cell_size (float): Manim-space side length of each grid cell.
+
+        """
+        self.locate = locate
+        self.cell_size = cell_size
+
+        # (col, row) -> set of gate_ids overlapping that cell
+        self.cells = defaultdict(set)
+        # gate_id -> bounding box
+        self.bboxes = {}
+        # gate_ids whose mobjects moved since they were indexed
+        self.stale = set()
+
+    @classmethod
+    def from_gate_ids(cls, gate_ids, locate):
+        """
+        Builds the grid for `gate_ids`. The cell size is taken from the
+        median gate width, which is roughly one layout column.
+
+        """
+        bboxes = {gate_id: locate(gate_id) for gate_id in gate_ids}
+
+        widths = [bbox[1][0]-bbox[0][0] for bbox in bboxes.values()]
+        cell_size = float(np.median(widths)) if widths else 1.0
+
+        grid = cls(locate, cell_size=max(cell_size, 1e-3))
+        for gate_id, bbox in bboxes.items():
+            grid.insert(gate_id, bbox)
+        return grid
+
+    def _cell_span(self, bbox):
+        """
+        Range of grid cells covered by a bounding box.
+
+        """
+        lower = np.floor(np.asarray(bbox[0][:2]) / self.cell_size).astype(int)
+        upper = np.floor(np.asarray(bbox[1][:2]) / self.cell_size).astype(int)
+        return lower, upper
+
+    def insert(self, gate_id, bbox):
+        """
+        Adds (or re-adds) a gate with bounding box `bbox` to the grid.
+
+        """
+        if gate_id in self.bboxes:
+            self.remove(gate_id)
+
+        bbox = np.asarray(bbox)
+        self.bboxes[gate_id] = bbox
+
+        lower, upper = self._cell_span(bbox)
+        for col in range(lower[0], upper[0]+1):
+            for row in range(lower[1], upper[1]+1):
+                self.cells[(col, row)].add(gate_id)
+        return
+
+    def remove(self, gate_id):
+        """
+        Removes a gate from the grid. Unknown gate_ids are ignored.
+
+        """
+        bbox = self.bboxes.pop(gate_id, None)
+        self.stale.discard(gate_id)
+        if bbox is None:
+            return
+
+        lower, upper = self._cell_span(bbox)
+        for col in range(lower[0], upper[0]+1):
+            for row in range(lower[1], upper[1]+1):
+                cell = self.cells[(col, row)]
+                cell.discard(gate_id)
+                if not cell:
+                    del self.cells[(col, row)]
+        return
+
+    def invalidate(self, *gate_ids):
+        """
+        Marks gates whose mobjects moved. Their bounding boxes are
+        recomputed lazily on the next query.
+
+        """
+        self.stale.update(gate_id for gate_id in gate_ids if gate_id in self.bboxes)
+        return
+
+    def refresh(self):
+        """
+        Re-locates every invalidated gate.
+
+        """
+        while self.stale:
+            gate_id = self.stale.pop()
+            self.insert(gate_id, self.locate(gate_id))
+        return
+
+    def _ordered(self, hits):
+        """
+        Sorts hits smallest bounding box first, i.e. a gate before the
+        measure box spanning down to the classical wire over it. Ties are
+        broken by gate_id so the order never depends on set iteration.
+
+        """
+        def key(gate_id):
+            (x0, y0), (x1, y1) = self.bboxes[gate_id][:, :2]
+            return (x1-x0)*(y1-y0), gate_id
+        return sorted(hits, key=key)
+
+    def query_rect(self, corner, opposite_corner, contained=False):
+        """
+        Returns the gate_ids whose bounding boxes overlap the rectangle
+        spanned by two corners, or lie entirely inside it with `contained`,
+        smallest first.
+
+        """
+        self.refresh()
+
+        rect = np.array([corner[:2], opposite_corner[:2]])
+        rect = np.array([rect.min(axis=0), rect.max(axis=0)])
+        lower, upper = self._cell_span(rect)
+
+        # Walk whichever is smaller: the covered cells or the occupied ones
+        span = (upper[0]-lower[0]+1)*(upper[1]-lower[1]+1)
+        if span <= len(self.cells):
+            cells = (
+                self.cells.get((col, row), ())
+                for col in range(lower[0], upper[0]+1)
+                for row in range(lower[1], upper[1]+1)
+            )
+        else:
+            cells = (
+                cell for (col, row), cell in self.cells.items()
+                if lower[0] <= col <= upper[0] and lower[1] <= row <= upper[1]
+            )
+        candidates = set().union(*cells)
+
+        hits = []
+        for gate_id in candidates:
+            bbox = self.bboxes[gate_id][:, :2]
+            if contained:
+                inside = (bbox[0] >= rect[0]).all() and (bbox[1] <= rect[1]).all()
+            else:
+                inside = (bbox[0] <= rect[1]).all() and (bbox[1] >= rect[0]).all()
+            if inside:
+                hits.append(gate_id)
+        return self._ordered(hits)
+
+    def query(self, x, y):
+        """
+        Returns the gate_ids whose bounding boxes contain (x, y),
+        smallest first.
+
+        """
+        self.refresh()
+
+        col = int(np.floor(x / self.cell_size))
+        row = int(np.floor(y / self.cell_size))
+
+        hits = []
+        for gate_id in self.cells.get((col, row), ()):
+            bbox = self.bboxes[gate_id]
+            if (bbox[0][0] <= x <= bbox[1][0] and
+                bbox[0][1] <= y <= bbox[1][1]):
+                hits.append(gate_id)
+        return self._ordered(hits)
@@ -0,0 +1,219 @@
+"""
+Line-by-line OpenQASM 2 reader for streaming circuits into ManiQ.
+
+Unlike QuantumCircuit.from_qasm_file, instructions are yielded as soon
+as their line is read, so a scene can start scheduling and drawing the
+first columns of a long generated file while the rest is still parsed.
+
+Register declarations are read up front (they precede the gates in
+any OpenQASM 2 file); custom `gate` definitions are not supported.
+
+"""
+
+import ast
+import math
+import operator
+import re
+
+
+# Identifiers allowed in OpenQASM 2 parameter expressions
+_PARAM_NAMES = {
+    'pi': math.pi,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'exp': math.exp,
+    'ln': math.log,
+    'sqrt': math.sqrt,
+}
+
+# Operators allowed in OpenQASM 2 parameter expressions
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+
+_REGISTER = re.compile(r'^(qreg|creg)\s+(\w+)\s*\[\s*(\d+)\s*\]$')
+_OPERATION = re.compile(r'^(\w+)\s*(?:\((.*)\))?\s+(.+)$')
+_MEASURE = re.compile(r'^measure\s+(.+?)\s*->\s*(.+)$')
+_ARGUMENT = re.compile(r'^(\w+)\s*(?:\[\s*(\d+)\s*\])?$')
+
+_SKIPPED = ('OPENQASM', 'include')
+
+
+def _statements(lines):
+    """
+    Splits lines into `;`-terminated statements, dropping comments.
+
+    """
+    pending = ''
+    for line in lines:
+        pending += ' ' + line.split('//', 1)[0]
+        *statements, pending = pending.split(';')
+        for statement in statements:
+            # Statements may span lines; collapse their whitespace
+            statement = ' '.join(statement.split())
+            if statement:
+                yield statement
+    if pending.strip():
+        raise ValueError(f"Unterminated OpenQASM statement: '{pending.strip()}'")
+
+
+def _param(expression):
+    """
+    Evaluates a parameter expression, i.e. `-pi/4` or `2*sin(0.3)`.
+
+    Only numbers, the names in _PARAM_NAMES, calls of its functions and
+    + - * / ** are accepted; the expression is walked as a syntax tree
+    rather than handed to eval, so a QASM file cannot run code.
+
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid parameter expression: '{expression}'") from e
+    try:
+        return float(_evaluate(tree.body, expression))
+    except (ArithmeticError, TypeError) as e:
+        raise ValueError(f"Invalid parameter expression: '{expression}'") from e
+
+
+def _evaluate(node, expression):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        # Floats keep `**` from building arbitrarily large integers
+        return float(node.value)
+    if isinstance(node, ast.Name) and node.id in _PARAM_NAMES:
+        return _PARAM_NAMES[node.id]
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_evaluate(node.operand, expression))
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        return _BINARY_OPS[type(node.op)](
+            _evaluate(node.left, expression),
+            _evaluate(node.right, expression),
+        )
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and callable(_PARAM_NAMES.get(node.func.id)) and not node.keywords):
+        args = [_evaluate(arg, expression) for arg in node.args]
+        return _PARAM_NAMES[node.func.id](*args)
+    raise ValueError(f"Unsupported parameter expression: '{expression}'")
+
+
+class QasmStream:
+    """
+    Streams the instructions of an OpenQASM 2 file.
+
+    `qc` is an empty QuantumCircuit holding the declared registers;
+    iterating yields a qiskit CircuitInstruction on its bits per gate,
+    without appending it.
+
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path of the .qasm file.
+
+        """
+        from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+        self.path = path
+        self.file = open(path, 'r')
+        self.statements = _statements(self.file)
+        self.qc = QuantumCircuit()
+
+        # Registers are declared before the first operation
+        self.first_operation = None
+        for statement in self.statements:
+            if statement.startswith(_SKIPPED):
+                continue
+            match = _REGISTER.match(statement)
+            if match is None:
+                self.first_operation = statement
+                break
+            kind, name, size = match.groups()
+            register = QuantumRegister if kind == 'qreg' else ClassicalRegister
+            self.qc.add_register(register(int(size), name))
+
+        self.qregs = {register.name: register for register in self.qc.qregs}
+        self.cregs = {register.name: register for register in self.qc.cregs}
+
+    def _bits(self, arguments, registers):
+        """
+        Resolves comma-separated `reg[idx]`/`reg` arguments. Whole
+        registers broadcast, as in OpenQASM 2.
+
+        Returns:
+            One list of bits per broadcast instance.
+
+        """
+        resolved = []
+        for argument in arguments.split(','):
+            match = _ARGUMENT.match(argument.strip())
+            if match is None or match.group(1) not in registers:
+                raise ValueError(f"Unknown register in '{argument.strip()}' ({self.path}).")
+            register = registers[match.group(1)]
+            if match.group(2) is None:
+                resolved.append(list(register))
+            else:
+                resolved.append([register[int(match.group(2))]])
+
+        size = max(len(bits) for bits in resolved)
+        return [
+            [bits[idx] if len(bits) > 1 else bits[0] for bits in resolved]
+            for idx in range(size)
+        ]
+
+    def _instructions(self, statement):
+        from qiskit.circuit import Barrier, CircuitInstruction, Measure
+        from qiskit.circuit.library import get_standard_gate_name_mapping
+
+        if statement.startswith('measure'):
+            match = _MEASURE.match(statement)
+            if match is None:
+                raise ValueError(f"Malformed measurement '{statement}' ({self.path}).")
+            qubits = self._bits(match.group(1), self.qregs)
+            clbits = self._bits(match.group(2), self.cregs)
+            for (qubit,), (clbit,) in zip(qubits, clbits):
+                yield CircuitInstruction(Measure(), (qubit,), (clbit,))
+            return
+
+        match = _OPERATION.match(statement)
+        if match is None:
+            raise ValueError(f"Malformed statement '{statement}' ({self.path}).")
+        name, params, arguments = match.groups()
+
+        if name == 'barrier':
+            qubits = [qubit for bits in self._bits(arguments, self.qregs) for qubit in bits]
+            qubits = list(dict.fromkeys(qubits))
+            yield CircuitInstruction(Barrier(len(qubits)), tuple(qubits), ())
+            return
+
+        gate = get_standard_gate_name_mapping().get(name)
+        if gate is None:
+            raise ValueError(
+                f"Unsupported operation '{name}' ({self.path}); "
+                "use QuantumCircuit.from_qasm_file for custom gates."
+            )
+        params = [_param(param) for param in params.split(',')] if params else []
+        for qubits in self._bits(arguments, self.qregs):
+            yield CircuitInstruction(gate.base_class(*params), tuple(qubits), ())
+
+    def __iter__(self):
+        try:
+            if self.first_operation is not None:
+                yield from self._instructions(self.first_operation)
+            for statement in self.statements:
+                yield from self._instructions(statement)
+        finally:
+            self.close()
+
+    def close(self):
+        self.file.close()
+        return
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules in circuit/ import each other flat, as when main.py is run from there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,94 @@
+from concurrent.futures import wait
+import threading
+
+from background import SimulationWorker
+
+
+class Blocker:
+    """
+    Job that holds the single worker thread until released.
+
+    """
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.release.wait(5)
+        return 'blocker'
+
+
+def drain(worker):
+    wait([future for future, _, _, _ in worker.jobs.values()], timeout=5)
+    worker.poll()
+
+
+def test_results_are_handed_to_their_callbacks():
+    worker = SimulationWorker()
+    results = []
+    worker.submit('a', lambda: 1, results.append)
+    worker.submit('b', lambda: 2, results.append)
+    drain(worker)
+    assert sorted(results) == [1, 2]
+    assert not worker.busy
+    worker.shutdown()
+
+
+def test_submit_cancels_the_queued_job_it_replaces():
+    worker = SimulationWorker()
+    blocker = Blocker()
+    worker.submit('busy', blocker, lambda result: None)
+    assert blocker.started.wait(5)
+
+    runs, results = [], []
+    stale = worker.submit('chart', lambda: runs.append('stale') or 'stale', results.append)
+    worker.submit('chart', lambda: runs.append('latest') or 'latest', results.append)
+    assert stale.cancelled()
+
+    blocker.release.set()
+    drain(worker)
+    assert runs == ['latest'] and results == ['latest']
+    worker.shutdown()
+
+
+def test_supersede_cancels_queued_jobs_and_reruns_them():
+    worker = SimulationWorker()
+    blocker = Blocker()
+    worker.submit('busy', blocker, lambda result: None)
+    assert blocker.started.wait(5)
+
+    circuit = ['old']
+    runs, results = [], []
+
+    def compute():
+        runs.append(circuit[0])
+        return circuit[0]
+
+    queued = worker.submit('chart', compute, results.append)
+    circuit[0] = 'edited'
+    worker.supersede()
+    assert queued.cancelled()
+
+    # The running job is stale too: its result is dropped and it is re-run
+    blocker.release.set()
+    for _ in range(3):
+        drain(worker)
+    assert runs == ['edited'] and results == ['edited']
+    assert not worker.busy
+    worker.shutdown()
+
+
+def test_failed_jobs_are_reported_and_dropped(capsys):
+    worker = SimulationWorker()
+    results = []
+
+    def fail():
+        raise RuntimeError('boom')
+
+    worker.submit('chart', fail, results.append)
+    drain(worker)
+    assert results == [] and not worker.busy
+    assert 'Simulation chart failed -- boom' in capsys.readouterr().out
+    worker.shutdown()
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from circuit_table import CATEGORIES, CircuitTable
+from scheduler import schedule_instructions
+
+
+# Registry stand-in holding the fields CircuitTable reads from a GateSpec
+REGISTRY = {
+    'h': SimpleNamespace(latex='H', color_name='BLUE', category='single_qubit_gate'),
+    'rx': SimpleNamespace(latex='R_x', color_name='GREEN', category='single_qubit_gate'),
+    'cx': SimpleNamespace(latex='CX', color_name='RED', category='cx_like_gate'),
+    'measure': SimpleNamespace(latex='M', color_name='GRAY', category='measure'),
+}
+
+
+def table(qc):
+    return CircuitTable.from_sorted_instructions(qc, schedule_instructions(qc), REGISTRY)
+
+
+def assert_same_rows(result, expected):
+    assert len(result) == len(expected)
+    assert list(result.records()) == list(expected.records())
+
+
+def test_drop():
+    qc = QuantumCircuit(2, 1)
+    qc.h(0)
+    qc.rx(0.25, 1)
+    qc.cx(0, 1)
+    qc.measure(1, 0)
+    circuit_table = table(qc)
+    assert circuit_table.gate_ids == ['h_0_0', 'rx_1_0', 'cx_01_1', 'measure_1_2']
+
+    dropped = circuit_table.drop(['rx_1_0', 'measure_1_2', 'missing_0_9'])
+    assert dropped.gate_ids == ['h_0_0', 'cx_01_1']
+    assert dropped.record(1)['qbits'] == [0, 1]
+    assert dropped.record(1)['categories'] == 'cx_like_gate'
+    assert dropped.params.size == 0
+    assert dropped.row_of('rx_1_0') is None
+
+    # The original table is left untouched
+    assert len(circuit_table) == 4
+    assert circuit_table.record(1)['params'] == [0.25]
+
+
+def test_concat_matches_building_at_once():
+    qc = QuantumCircuit(2, 1)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.rx(0.5, 0)
+    qc.measure(1, 0)
+    circuit_table = table(qc)
+
+    split = 2
+    sorted_instructions = schedule_instructions(qc)
+    head = CircuitTable.from_sorted_instructions(qc, sorted_instructions[:split], REGISTRY)
+    tail = CircuitTable.from_sorted_instructions(qc, sorted_instructions[split:], REGISTRY)
+
+    # The tail numbers its gate types from 0 too; concat re-indexes them
+    assert tail.gate_types[0][0] == 'rx'
+    combined = head.concat(tail)
+    assert_same_rows(combined, circuit_table)
+    assert [gate_type[0] for gate_type in combined.gate_types] == ['h', 'cx', 'rx', 'measure']
+    assert np.array_equal(combined.column_offsets(), circuit_table.column_offsets())
+    assert CATEGORIES[combined.category_codes[-1]] == 'measure'
+
+
+def test_concat_then_drop():
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    qc.h(0)
+    sorted_instructions = schedule_instructions(qc)
+    head = CircuitTable.from_sorted_instructions(qc, sorted_instructions[:1], REGISTRY)
+    tail = CircuitTable.from_sorted_instructions(qc, sorted_instructions[1:], REGISTRY)
+
+    combined = head.concat(tail)
+    assert combined.gate_types == [('h', 'H', 'BLUE')]
+    assert combined.drop(['h_0_0']).gate_ids == ['h_0_1']
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import QFTGate
+from qiskit.quantum_info import Statevector
+
+from qiskit_functions.numpy_simulator import simulate_statevector
+
+
+def assert_matches_statevector(qc):
+    data = simulate_statevector(qc)
+    assert data is not None
+    assert np.allclose(data, Statevector(qc).data)
+
+
+def test_standard_gates_match_statevector():
+    qc = QuantumCircuit(4)
+    qc.h(0)
+    qc.cx(0, 3)
+    qc.rx(0.3, 1)
+    qc.ry(-1.2, 2)
+    qc.rz(0.7, 0)
+    qc.s(1)
+    qc.tdg(2)
+    qc.cp(0.4, 2, 0)
+    qc.rzz(0.9, 1, 3)
+    qc.swap(0, 2)
+    qc.ccx(3, 1, 2)
+    qc.u(0.1, 0.2, 0.3, 3)
+    assert_matches_statevector(qc)
+
+
+def test_library_circuit_and_global_phase_match_statevector():
+    qc = QuantumCircuit(3)
+    qc.append(QFTGate(3), range(3))
+    qc = qc.decompose()
+    qc.x(1)
+    qc.global_phase += 0.6
+    assert_matches_statevector(qc)
+
+
+def test_measurements_and_barriers_are_ignored():
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.barrier()
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+
+    expected = QuantumCircuit(2)
+    expected.h(0)
+    expected.cx(0, 1)
+    assert np.allclose(simulate_statevector(qc), Statevector(expected).data)
+
+
+@pytest.mark.parametrize('build', [
+    lambda qc: qc.reset(0),
+    lambda qc: qc.rx(Parameter('theta'), 0),
+])
+def test_unsupported_circuits_return_none(build):
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    build(qc)
+    assert simulate_statevector(qc) is None
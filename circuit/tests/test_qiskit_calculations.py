@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+
+from qiskit_functions.qiskit_calculations import QiskitCalculations
+
+
+def uniform(num_qubits):
+    qc = QuantumCircuit(num_qubits)
+    qc.h(range(num_qubits))
+    return QiskitCalculations(qc)
+
+
+def test_distribution_is_bounded_by_max_bars():
+    calculations = uniform(12)
+    names, values, shots = calculations.distribution(shots=500)
+
+    assert len(names) == values.shape[1] == calculations.max_bars
+    assert names[-1] == r"\text{other}"
+    assert values[0].sum() == pytest.approx(1)
+    assert values[1].sum() == shots == 500
+
+
+def test_distribution_small_register_keeps_every_nonzero_outcome():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    names, values, shots = QiskitCalculations(qc).distribution()
+
+    assert names == ['0', '11']
+    assert np.allclose(values, [[0.5, 0.5], [500, 500]])
+    assert shots == 1000
+
+
+def test_histogram_bars_top_k():
+    calculations = uniform(3)
+    outcomes = np.array([1, 2, 5, 6])
+    names, values = calculations.histogram_bars(outcomes, [[0.1, 0.4, 0.2, 0.3]], top_k=2)
+
+    # Kept bars stay in basis-state order, the rest is summed into "other"
+    assert names == ['10', '110', r"\text{other}"]
+    assert np.allclose(values, [[0.4, 0.3, 0.3]])
+
+
+def test_histogram_bars_buckets():
+    calculations = uniform(3)
+    outcomes = np.array([0, 3, 5, 7])
+    probabilities = [0.1, 0.2, 0.3, 0.4]
+
+    names, values = calculations.histogram_bars(outcomes, [probabilities], bucket='hamming')
+    assert names == ['w=0', 'w=2', 'w=3']
+    assert np.allclose(values, [[0.1, 0.5, 0.4]])
+
+    # Marginal onto qubits 2 and 0, qubit 2 as the last bit
+    names, values = calculations.histogram_bars(outcomes, [probabilities], bucket=[2, 0])
+    assert names == ['00', '10', '11']
+    assert np.allclose(values, [[0.1, 0.2, 0.7]])
+
+
+@pytest.mark.parametrize('top_k', [0, -1])
+def test_histogram_bars_rejects_top_k_below_one(top_k):
+    with pytest.raises(ValueError):
+        uniform(2).histogram_bars(np.arange(4), [[0.25]*4], top_k=top_k)
+
+
+def test_get_counts_is_seeded_by_default():
+    calculations = uniform(3)
+
+    dist, counts, shots = calculations.get_counts(shots=200)
+    assert calculations.get_counts(shots=200)[1] == counts
+    assert sum(counts.values()) == shots == 200
+    assert list(dist) == list(counts) == [bin(idx)[2:] for idx in range(8)]
+    assert sum(dist.values()) == pytest.approx(1)
+
+    # An explicit seed overrides the default
+    assert calculations.get_counts(shots=200, seed=1)[1] == calculations.get_counts(shots=200, seed=1)[1]
+    assert calculations.get_counts(shots=200, seed=1)[1] != counts
+
+
+def test_sample_counts_follows_the_probabilities():
+    qc = QuantumCircuit(2)
+    qc.x(1)
+    qc.ry(2*np.arccos(np.sqrt(0.8)), 0)
+    probs, counts, shots = QiskitCalculations(qc).sample_counts(shots=20000)
+
+    assert np.allclose(probs, [0, 0, 0.8, 0.2])
+    assert counts[:2].sum() == 0 and counts.sum() == 20000
+    assert counts[2] / shots == pytest.approx(0.8, abs=0.02)
+
+    # Without shots the counts are the expected counts for 1000 shots
+    probs, counts, shots = QiskitCalculations(qc).sample_counts()
+    assert shots == 1000 and np.allclose(counts, [0, 0, 800, 200])
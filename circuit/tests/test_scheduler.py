@@ -0,0 +1,51 @@
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import GlobalPhaseGate
+
+from scheduler import LayerScheduler, schedule_instructions
+
+
+def test_schedule_instructions_columns():
+    qc = QuantumCircuit(3, 1)
+    qc.h(0)             # column 0
+    qc.h(2)             # column 0
+    qc.cx(0, 2)         # spans wires 0..2, column 1
+    qc.x(1)             # wire 1 is covered by the cx, column 2
+    qc.measure(0, 0)    # column 2, then a floor for everything after
+    qc.z(2)             # column 3
+
+    sorted_instructions, data_idxs = schedule_instructions(qc, return_idxs=True)
+
+    start_times = [start_time for start_time, _ in sorted_instructions]
+    names = [instruction.operation.name for _, instruction in sorted_instructions]
+    assert start_times == [0, 0, 1, 2, 2, 3]
+    assert names == ['h', 'h', 'cx', 'x', 'measure', 'z']
+    assert [qc.data[idx] for idx in data_idxs] == [instruction for _, instruction in sorted_instructions]
+    assert schedule_instructions(qc) == sorted_instructions
+
+
+def test_schedule_instructions_skips_zero_qubit_operations():
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    qc.append(GlobalPhaseGate(0.5), [])
+    qc.x(0)
+
+    sorted_instructions, data_idxs = schedule_instructions(qc, return_idxs=True)
+    assert [start_time for start_time, _ in sorted_instructions] == [0, 1]
+    assert data_idxs == [0, 2]
+
+
+def test_pop_settled_hands_out_finished_columns():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.h(1)
+    qc.x(0)
+
+    scheduler = LayerScheduler(2)
+    for data_idx, instruction in enumerate(qc.data[:2]):
+        scheduler.push(data_idx, instruction, [data_idx])
+    assert [start_time for start_time, _ in scheduler.pop_settled()] == [0]
+
+    scheduler.push(2, qc.data[2], [0])
+    assert scheduler.pop_settled() == []
+    columns = scheduler.pop_settled(flush=True)
+    assert [(start_time, [idx for idx, _ in column]) for start_time, column in columns] == [(1, [2])]
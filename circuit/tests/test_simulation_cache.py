@@ -0,0 +1,100 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Gate
+from qiskit.quantum_info import Statevector
+
+from qiskit_functions.simulation_cache import SimulationCache, circuit_fingerprint
+
+
+def bell():
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    return qc
+
+
+def test_fingerprint_ignores_barriers_and_copies():
+    qc = bell()
+    with_barrier = bell()
+    with_barrier.barrier()
+    assert circuit_fingerprint(qc) == circuit_fingerprint(qc.copy())
+    assert circuit_fingerprint(qc) == circuit_fingerprint(with_barrier)
+
+
+def test_fingerprint_changes_with_anything_affecting_the_result():
+    fingerprints = {circuit_fingerprint(bell())}
+
+    def add(edit):
+        qc = bell()
+        edit(qc)
+        fingerprints.add(circuit_fingerprint(qc))
+
+    add(lambda qc: qc.rx(0.1, 0))
+    add(lambda qc: qc.rx(0.2, 0))
+    add(lambda qc: qc.rx(0.1, 1))
+    add(lambda qc: qc.reset(0))
+    add(lambda qc: qc.measure(0, 0))
+    add(lambda qc: qc.measure(0, 1))
+    add(lambda qc: setattr(qc, 'global_phase', 0.3))
+    add(lambda qc: qc.unitary(np.eye(2), [0]))
+    add(lambda qc: qc.unitary(np.diag([1, -1]), [0]))
+    with_if = bell()
+    with with_if.if_test((with_if.clbits[0], 1)):
+        with_if.x(1)
+    fingerprints.add(circuit_fingerprint(with_if))
+    assert len(fingerprints) == 11
+
+
+def test_fingerprint_hashes_custom_gate_definitions():
+    def custom(build):
+        definition = QuantumCircuit(1)
+        build(definition)
+        gate = Gate('custom', 1, [])
+        gate.definition = definition
+        qc = QuantumCircuit(1)
+        qc.append(gate, [0])
+        return circuit_fingerprint(qc)
+
+    assert custom(lambda qc: qc.x(0)) == custom(lambda qc: qc.x(0))
+    assert custom(lambda qc: qc.x(0)) != custom(lambda qc: qc.z(0))
+
+
+def test_cache_hits_and_lru_byte_eviction():
+    circuits = []
+    for num_qubits in (1, 2, 3):
+        qc = QuantumCircuit(num_qubits)
+        qc.h(0)
+        circuits.append(qc)
+    simulated = []
+
+    def simulate(qc):
+        def run():
+            simulated.append(qc.num_qubits)
+            return Statevector(qc)
+        return run
+
+    # 16 bytes per amplitude: 32, 64 and 128 bytes of statevector
+    cache = SimulationCache(max_bytes=200)
+    for qc in circuits[:2]:
+        cache.statevector(qc, simulate(qc))
+    assert cache.statevector(circuits[0].copy(), simulate(circuits[0])) is not None
+    assert (cache.hits, cache.misses, cache.nbytes) == (1, 2, 96)
+
+    # The 3 qubit state evicts the least recently used entry, the 2 qubit one
+    cache.statevector(circuits[2], simulate(circuits[2]))
+    assert cache.nbytes == 160
+    assert list(cache.entries) == [circuit_fingerprint(circuits[0]), circuit_fingerprint(circuits[2])]
+
+    # Probabilities count toward the budget too: 64 more bytes evict the 1 qubit entry
+    probabilities = cache.probabilities(circuits[2], simulate(circuits[2]))
+    assert np.allclose(probabilities, [0.5, 0.5, 0, 0, 0, 0, 0, 0])
+    assert cache.nbytes == 192
+    assert list(cache.entries) == [circuit_fingerprint(circuits[2])]
+    assert simulated == [1, 2, 3]
+
+
+def test_cache_does_not_keep_states_over_the_budget():
+    qc = QuantumCircuit(4)
+    cache = SimulationCache(max_bytes=100)
+    assert np.allclose(cache.statevector(qc, lambda: Statevector(qc)).data[0], 1)
+    assert len(cache.entries) == 0 and cache.nbytes == 0
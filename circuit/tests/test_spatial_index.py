@@ -0,0 +1,64 @@
+import numpy as np
+
+from spatial_index import GateGrid
+
+
+def box(x0, y0, x1, y1):
+    return np.array([[x0, y0, 0], [x1, y1, 0]], dtype=float)
+
+
+# Two columns of single-qubit gates on wires y=1 and y=0, plus a measure
+# box in column 0 spanning down to the classical wire at y=-1
+BBOXES = {
+    'h_0_0': box(-0.25, 0.75, 0.25, 1.25),
+    'measure_0_0': box(-0.375, -1.25, 0.375, 1.375),
+    'x_1_0': box(-0.25, -0.25, 0.25, 0.25),
+    'z_0_1': box(0.75, 0.75, 1.25, 1.25),
+    'z_1_1': box(0.75, -0.25, 1.25, 0.25),
+}
+
+
+def grid():
+    bboxes = {gate_id: bbox.copy() for gate_id, bbox in BBOXES.items()}
+    return GateGrid.from_gate_ids(bboxes, bboxes.__getitem__), bboxes
+
+
+def test_query_returns_smallest_bbox_first():
+    gate_grid, _ = grid()
+    assert gate_grid.query(0, 1) == ['h_0_0', 'measure_0_0']
+    assert gate_grid.query(0, 0) == ['x_1_0', 'measure_0_0']
+    assert gate_grid.query(0, -1) == ['measure_0_0']
+    assert gate_grid.query(1, 0) == ['z_1_1']
+    assert gate_grid.query(0.5, 0.5) == []
+
+
+def test_query_order_ties_break_on_gate_id():
+    gate_grid = GateGrid(lambda gate_id: None)
+    for gate_id in ('b', 'c', 'a'):
+        gate_grid.insert(gate_id, box(0, 0, 1, 1))
+    assert gate_grid.query(0.5, 0.5) == ['a', 'b', 'c']
+
+
+def test_query_rect_overlap_and_contained():
+    gate_grid, _ = grid()
+    assert gate_grid.query_rect([0.5, 1.5], [1.5, -0.5], contained=True) == ['z_0_1', 'z_1_1']
+    assert gate_grid.query_rect([0.2, 0.2], [0.8, 0.8]) == ['h_0_0', 'x_1_0', 'z_0_1', 'z_1_1', 'measure_0_0']
+    # Corners in any order span the same rectangle
+    assert gate_grid.query_rect([-1, -2], [2, 2], contained=True) == gate_grid.query_rect([2, 2], [-1, -2], contained=True)
+    assert len(gate_grid.query_rect([-1, -2], [2, 2], contained=True)) == len(BBOXES)
+    assert gate_grid.query_rect([5, 5], [6, 6]) == []
+
+
+def test_invalidate_and_remove():
+    gate_grid, bboxes = grid()
+
+    # Moved gates are re-located lazily on the next query
+    bboxes['z_1_1'] += [3, 0, 0]
+    gate_grid.invalidate('z_1_1')
+    assert gate_grid.query(1, 0) == []
+    assert gate_grid.query(4, 0) == ['z_1_1']
+
+    gate_grid.remove('h_0_0')
+    gate_grid.remove('missing')
+    assert gate_grid.query(0, 1) == ['measure_0_0']
+    assert 'h_0_0' not in gate_grid.query_rect([-1, -2], [5, 2])
@@ -0,0 +1,137 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from qiskit_functions.statevector_engine import StatevectorEngine
+from scheduler import schedule_instructions
+
+
+def layered_circuit(num_qubits=3, num_layers=20):
+    # One column per layer: every layer spans all wires through a ccx
+    qc = QuantumCircuit(num_qubits)
+    for layer in range(num_layers):
+        qc.ry(0.1*(layer+1), layer % num_qubits)
+        qc.ccx(0, 1, 2)
+    return qc
+
+
+def engine_for(qc):
+    sorted_instructions = schedule_instructions(qc)
+    return StatevectorEngine.from_sorted_instructions(qc, sorted_instructions), sorted_instructions
+
+
+def expected_state(qc, instructions):
+    expected = QuantumCircuit(qc.num_qubits)
+    for instruction in instructions:
+        expected.append(instruction)
+    return Statevector(expected).data
+
+
+def test_state_matches_statevector_and_keeps_only_checkpoints():
+    qc = layered_circuit()
+    engine, _ = engine_for(qc)
+    num_columns = len(engine.columns)
+    assert num_columns == 40
+
+    assert np.allclose(engine.state().data, Statevector(qc).data)
+    assert engine.column_updates == num_columns
+    assert sorted(engine.checkpoints) == list(range(0, num_columns+1, engine.interval))
+
+    # Intermediate states are re-evolved from the checkpoint before them
+    updates = engine.column_updates
+    column = 2*engine.interval + 2
+    state = engine.state(column)
+    assert engine.column_updates - updates == 3
+    prefix = [instruction for instructions in engine.columns[:column+1] for instruction in instructions]
+    assert np.allclose(state.data, expected_state(qc, prefix))
+
+
+def test_remove_near_the_end_costs_few_column_updates():
+    qc = layered_circuit()
+    engine, sorted_instructions = engine_for(qc)
+    engine.state()
+    num_columns = len(engine.columns)
+
+    start_time, instruction = sorted_instructions[-2]
+    assert start_time == num_columns-2
+    engine.remove(start_time, instruction)
+
+    updates = engine.column_updates
+    remaining = [pair[1] for pair in sorted_instructions if pair[1] is not instruction]
+    assert np.allclose(engine.state().data, expected_state(qc, remaining))
+    # From the checkpoint at or before the edit to the end
+    start = start_time // engine.interval * engine.interval
+    assert engine.column_updates - updates == num_columns - start
+    assert engine.column_updates - updates <= engine.interval + 1
+
+    # The final state is kept; asking again evolves nothing
+    engine.state()
+    assert engine.column_updates - updates == num_columns - start
+
+
+def test_remove_many_invalidates_once_from_the_earliest_column():
+    qc = layered_circuit()
+    engine, sorted_instructions = engine_for(qc)
+    engine.state()
+    num_columns = len(engine.columns)
+
+    removed = [sorted_instructions[-1], sorted_instructions[-12], sorted_instructions[-5]]
+    engine.remove_many(removed)
+
+    updates = engine.column_updates
+    removed_instructions = [instruction for _, instruction in removed]
+    remaining = [
+        instruction for _, instruction in sorted_instructions
+        if not any(instruction is other for other in removed_instructions)
+    ]
+    assert np.allclose(engine.state().data, expected_state(qc, remaining))
+    first_column = min(start_time for start_time, _ in removed)
+    start = first_column // engine.interval * engine.interval
+    assert engine.column_updates - updates == num_columns - start
+    assert all(idx <= num_columns for idx in engine.checkpoints)
+
+
+def test_checkpoint_interval_widens_to_fit_the_memory_budget():
+    qc = layered_circuit(num_layers=50)
+    sorted_instructions = schedule_instructions(qc)
+
+    class SmallBudget(StatevectorEngine):
+        # Room for 4 checkpoints of a 3 qubit state
+        max_checkpoint_bytes = 4 * 16 * 2**3
+
+    engine = SmallBudget.from_sorted_instructions(qc, sorted_instructions)
+    assert engine.interval == 32
+    assert np.allclose(engine.state().data, Statevector(qc).data)
+    assert len(engine.checkpoints) <= 4
+
+
+def test_column_states_yields_every_intermediate_state():
+    qc = layered_circuit(num_layers=6)
+    engine, _ = engine_for(qc)
+
+    states = list(engine.column_states())
+    assert len(states) == len(engine.columns)+1
+    assert np.allclose(states[0], Statevector.from_int(0, 8).data)
+    assert np.allclose(states[-1], Statevector(qc).data)
+    assert engine.column_updates == len(engine.columns)
+
+
+def test_global_phase_and_global_phase_gates_are_applied():
+    from qiskit.circuit.library import GlobalPhaseGate
+
+    qc = QuantumCircuit(2, global_phase=0.4)
+    qc.h(0)
+    qc.append(GlobalPhaseGate(1.1), [])
+    qc.cx(0, 1)
+    engine, sorted_instructions = engine_for(qc)
+    assert len(sorted_instructions) == 2
+
+    assert np.allclose(engine.state().data, Statevector(qc).data)
+    assert np.allclose(engine.probabilities(), Statevector(qc).probabilities())
+    # Checkpoints are stored without the phase, so it is applied only once
+    assert np.allclose(engine.state().data, Statevector(qc).data)
+
+    # Phases added while streaming, i.e. a GlobalPhaseGate read later
+    engine.add_phase(-1.5)
+    qc.global_phase -= 1.5
+    assert np.allclose(engine.state().data, Statevector(qc).data)
@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Operator
+
+from streaming import QasmStream, _param
+
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+// Registers come first
+qreg q[3];
+creg c[3];
+h q[0]; cx q[0],
+   q[1];
+rz(-pi/4) q[2];
+u(2*sin(0.3), pi/2, ln(2)) q[1];
+barrier q;
+x q;
+measure q -> c;
+"""
+
+
+@pytest.mark.parametrize('expression, value', [
+    ('pi', math.pi),
+    ('-pi/4', -math.pi/4),
+    ('2*sin(0.3)', 2*math.sin(0.3)),
+    ('sqrt(2)**2 - 1', 1.0),
+    ('+3e-2', 0.03),
+    (' exp(ln(5)) ', 5.0),
+])
+def test_param_evaluates_qasm_expressions(expression, value):
+    assert _param(expression) == pytest.approx(value)
+
+
+@pytest.mark.parametrize('expression', [
+    '__import__("os").system("true")',
+    'pi.real',
+    '(lambda: 1)()',
+    'open',
+    'sin',
+    'sin(x=1)',
+    '[1][0]',
+    '"1"',
+    '1 if 1 else 0',
+    '1/0',
+    '9**9**9',
+    'sqrt(-1)',
+    '1 +',
+])
+def test_param_rejects_everything_else(expression):
+    with pytest.raises(ValueError):
+        _param(expression)
+
+
+def test_qasm_stream_matches_from_qasm_str(tmp_path):
+    path = tmp_path / 'circuit.qasm'
+    path.write_text(QASM)
+
+    stream = QasmStream(str(path))
+    assert [register.name for register in stream.qc.qregs] == ['q']
+    assert [register.name for register in stream.qc.cregs] == ['c']
+
+    instructions = list(stream)
+    assert stream.file.closed
+    names = [instruction.operation.name for instruction in instructions]
+    assert names == ['h', 'cx', 'rz', 'u', 'barrier', 'x', 'x', 'x', 'measure', 'measure', 'measure']
+
+    qc = stream.qc
+    for instruction in instructions:
+        qc.append(instruction)
+    expected = QuantumCircuit.from_qasm_str(QASM)
+    assert [[qc.find_bit(qubit).index for qubit in instruction.qubits] for instruction in qc.data] == \
+        [[expected.find_bit(qubit).index for qubit in instruction.qubits] for instruction in expected.data]
+    for instruction, expected_instruction in zip(qc.data, expected.data):
+        assert np.allclose(
+            [float(param) for param in instruction.operation.params],
+            [float(param) for param in expected_instruction.operation.params],
+        )
+
+    unitary = qc.remove_final_measurements(inplace=False)
+    expected_unitary = expected.remove_final_measurements(inplace=False)
+    assert Operator(unitary).equiv(Operator(expected_unitary))
@@ -0,0 +1,33 @@
+import random
+
+from update_qc import InstructionIndex
+
+
+def test_pop_many_matches_deleting_from_the_list():
+    data = [f'g{idx}' for idx in range(20)]
+    index = InstructionIndex(data, range(len(data)), len(data))
+
+    for batch in (['g3', 'g17', 'g0'], ['g19', 'g4', 'g5', 'g10'], ['g1']):
+        positions = index.pop_many(batch)
+        assert positions == sorted(positions, reverse=True)
+        assert sorted(data[position] for position in positions) == sorted(batch)
+        for position in positions:
+            del data[position]
+        assert all(gate_id not in index for gate_id in batch)
+
+    # Positions of the remaining gates still point at them
+    remaining = list(data)
+    random.Random(0).shuffle(remaining)
+    for gate_id in remaining:
+        position = index.pop(gate_id)
+        assert data[position] == gate_id
+        del data[position]
+    assert data == []
+
+
+def test_pop_many_after_extend():
+    index = InstructionIndex(['a', 'b'], [0, 1], 2)
+    assert index.pop('a') == 0
+    index.extend(['c', 'd'], [2, 3], 4)
+    assert index.pop_many(['d', 'b']) == [2, 0]
+    assert index.pop('c') == 0
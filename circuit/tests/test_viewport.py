@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from viewport import ColumnViewport, camera_frame, event_to_manim
+
+
+class CameraStub:
+    """
+    Stands in for the OpenGLCamera, which is itself a mobject.
+
+    """
+
+    def __init__(self, center, width, height):
+        self.center = np.array(center, dtype=float)
+        self.width = width
+        self.height = height
+
+    def get_center(self):
+        return self.center
+
+
+def test_camera_frame_of_mobject_and_cairo_cameras():
+    center, width, height = camera_frame(CameraStub([1, 2, 0], 16, 9))
+    assert np.allclose(center, [1, 2, 0]) and (width, height) == (16, 9)
+
+    cairo = SimpleNamespace(frame_center=[3, -1, 0], frame_width=8, frame_height=4.5)
+    center, width, height = camera_frame(cairo)
+    assert np.allclose(center, [3, -1, 0]) and (width, height) == (8, 4.5)
+
+
+def test_event_to_manim_unzoomed_camera_keeps_point():
+    camera = CameraStub([2, -1, 0], 16, 8)
+    assert event_to_manim(np.array([3.5, 0.5, 0]), camera, reference_height=8) == (3.5, 0.5)
+
+
+def test_event_to_manim_panned_and_zoomed_camera():
+    # Panned to (2, -1) and zoomed in 2x: the renderer maps the event as if
+    # the frame were still 8 high, so its offset from the center is halved
+    camera = CameraStub([2, -1, 0], 8, 4)
+    x, y = event_to_manim(np.array([5, 1, 0]), camera, reference_height=8)
+    assert (x, y) == pytest.approx((3.5, 0))
+
+    # Zoomed out 2x the offset doubles
+    camera = CameraStub([2, -1, 0], 32, 16)
+    x, y = event_to_manim(np.array([5, 1, 0]), camera, reference_height=8)
+    assert (x, y) == pytest.approx((8, 3))
+
+    # The camera center itself maps to itself at any zoom
+    assert event_to_manim(camera.center, camera, reference_height=8) == pytest.approx((2, -1))
+
+
+def column_viewport(num_columns=10):
+    # Columns of width 0.5 every unit, starting at x=0
+    lefts = np.arange(num_columns, dtype=float)
+    events = []
+    viewport = ColumnViewport(
+            lefts,
+            lefts+0.5,
+            lambda column: events.append(('build', column)) or f'payload_{column}',
+            lambda column, payload: events.append(('evict', column, payload)),
+    )
+    return viewport, events
+
+
+def test_column_viewport_visible_range():
+    viewport, _ = column_viewport()
+    assert len(viewport) == 10
+    assert viewport.visible(2.2, 4.1) == (2, 5)
+    # Gaps between columns and windows past either end
+    assert viewport.visible(2.6, 2.9) == (3, 3)
+    assert viewport.visible(-3, -1) == (0, 0)
+    assert viewport.visible(20, 30) == (10, 10)
+
+
+def test_column_viewport_update_materialises_and_evicts():
+    viewport, events = column_viewport()
+
+    assert viewport.update(0, 2.2)
+    assert events == [('build', 0), ('build', 1), ('build', 2)]
+
+    # Same columns in view: nothing happens
+    events.clear()
+    assert not viewport.update(0.1, 2.3)
+    assert events == []
+
+    # Scrolling keeps the overlap and only touches the edges
+    assert viewport.update(1.2, 3.2)
+    assert events == [('evict', 0, 'payload_0'), ('build', 3)]
+    assert sorted(viewport.columns) == [1, 2, 3]
+
+    events.clear()
+    viewport.clear()
+    assert sorted(events) == [('evict', 1, 'payload_1'), ('evict', 2, 'payload_2'), ('evict', 3, 'payload_3')]
+    assert viewport.columns == {} and viewport.window == (0, 0)
+
+
+def test_column_viewport_extend_streams_columns_in():
+    viewport, events = column_viewport(3)
+    viewport.update(1, 6)
+    assert sorted(viewport.columns) == [1, 2]
+
+    # Appended columns are built once an update covers them
+    viewport.extend([3.0, 4.0], [3.5, 4.5])
+    assert len(viewport) == 5 and sorted(viewport.columns) == [1, 2]
+    events.clear()
+    assert viewport.update(1, 6)
+    assert events == [('build', 3), ('build', 4)]
@@ -1,119 +1,90 @@
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit.circuit import CircuitInstruction, Clbit, Instruction, Qubit
-from random_circuit import random_circuit
-
-import pandas as pd 
-import json
-
-
-qc = random_circuit(5, depth=5, measure=True)
-
-class CircuitUpdate: 
+class InstructionIndex: 
     """ 
-    Class for converting ManiQ circuit back into qiskit QuantumCircuit object.
+    Maps each gate_id to its current position in QuantumCircuit.data 
+    while gates are deleted from it in place. 
 
-    Updated ManiQ Circuit
-            ↓
-    Updated DataFrame
-            ↓
-    Updated QuantumCircuit Instructions
-            ↓
-    Updated QuantumCircuit
+    Positions shift down as earlier instructions are deleted; a Fenwick 
+    tree over the deleted positions translates a gate's original 
+    position to its current one in O(log n). 
 
     """
 
-    def __init__(self, circuit_data): 
+    def __init__(self, gate_ids, data_idxs, num_instructions): 
         """ 
         Args: 
-            circuit_data (pandas DataFrame): contains information for ManiQ Circuit. 
+            gate_ids (array-like): gate_id of each instruction. 
+            data_idxs (array-like): Original QuantumCircuit.data idx of each instruction. 
+            num_instructions (int): Length of QuantumCircuit.data. 
 
         """
-        self.circuit_data = circuit_data 
-    
-    def data_to_instruction(self):
+        self.data_idxs = dict(zip(gate_ids, data_idxs))
+        # Fenwick tree counting deleted positions 
+        self.deleted = [0] * (num_instructions + 1)
+
+    def _deleted_before(self, data_idx): 
+        # Number of deleted positions in [0, data_idx)
+        count = 0
+        while data_idx > 0: 
+            count += self.deleted[data_idx]
+            data_idx -= data_idx & -data_idx
+        return count
+
+    def _mark_deleted(self, data_idx): 
+        data_idx += 1
+        while data_idx < len(self.deleted): 
+            self.deleted[data_idx] += 1
+            data_idx += data_idx & -data_idx
+        return
+
+    def __contains__(self, gate_id): 
+        return gate_id in self.data_idxs
+
+    def extend(self, gate_ids, data_idxs, num_instructions): 
         """ 
-        Converts Circuit DataFrame into pseudo-Qiskit QuantumCircuitData object. 
+        Adds instructions appended to QuantumCircuit.data, i.e. while a 
+        circuit is streamed in. 
+
+        Args: 
+            gate_ids (array-like): gate_id of each new instruction. 
+            data_idxs (array-like): QuantumCircuit.data idx of each new instruction. 
+            num_instructions (int): New length of QuantumCircuit.data. 
 
         """
+        self.data_idxs.update(zip(gate_ids, data_idxs))
 
-        # Get the minimum # of qubits and clbits of circuit
-        num_qbits, num_cbits = 0, 0
-        for qbits in self.circuit_data['qbits']:
-            for qbit in qbits: 
-                if qbit > num_qbits: 
-                    num_qbits = qbit
-        for cbits in self.circuit_data['cbits']: 
-            for cbit in cbits: 
-                if cbit > num_cbits: 
-                    num_cbits = cbit
-
-        self.num_qubits = num_qbits+1
-        self.num_clbits = num_cbits+1
-
-        # Initialize circuit instruction list
-        circuit_instructions = []
-        for _, element in self.circuit_data.iterrows(): 
-            name = element['qiskit_names'] 
-            qbits = element['qbits']
-            cbits = element['cbits']
-            params = element['params']
-
-            operation = Instruction(
-                name=name, 
-                num_qubits=len(qbits), 
-                num_clbits=len(cbits), 
-                params=params, 
+        # Each new tree node counts the deleted positions in its range 
+        for node in range(len(self.deleted), num_instructions + 1): 
+            self.deleted.append(
+                self._deleted_before(node - 1) - self._deleted_before(node - (node & -node))
             )
+        return
 
-
-            qr = QuantumRegister(self.num_qubits, 'q')
-            cr = ClassicalRegister(self.num_clbits, 'c')
-            qubits = tuple(Qubit(qr, qbit) for qbit in qbits)
-            clbits = tuple(Clbit(cr, cbit) for cbit in cbits)
-
-            circuit_instructions.append(
-                CircuitInstruction(
-                    operation=operation,
-                    qubits=qubits, 
-                    clbits=clbits, 
-                ),
-            ) 
-
-        return circuit_instructions 
-    
-    def update_circuit(self):
+    def pop(self, gate_id): 
         """ 
-        Converts a QuantumCircuitData instructions into a QuantumCircuit object. 
+        Marks the gate as deleted. 
 
-        Args: 
-            circuit_instructions (qiskit QuantumCircuitData): set of instructions from 
-            QuantumCircuit().data. 
+        Returns: 
+            The gate's current position in QuantumCircuit.data, 
+            i.e. the idx to delete. 
 
         """
+        data_idx = self.data_idxs.pop(gate_id)
+        position = data_idx - self._deleted_before(data_idx)
+        self._mark_deleted(data_idx)
+        return position
 
-        circuit_instructions = self.data_to_instruction()
-
-        qc = QuantumCircuit(self.num_qubits, self.num_clbits)
-        
-        for instruction in circuit_instructions:
-            gate_name = instruction.operation.name
-            qbits = [qc.find_bit(qubit).index for qubit in instruction.qubits]
-            cbits = [qc.find_bit(clbit).index for clbit in instruction.clbits]
-            params = instruction.operation.params
-            
-            if params:
-                if cbits:
-                    getattr(qc, gate_name)(*params, *qbits, *cbits)
-                else:
-                    getattr(qc, gate_name)(*params, *qbits)
-            else:
-                if cbits:
-                    getattr(qc, gate_name)(*qbits, *cbits)
-                else:
-                    getattr(qc, gate_name)(*qbits)
-        
-        return qc
-
-
+    def pop_many(self, gate_ids): 
+        """ 
+        Marks several gates as deleted at once. 
 
+        Returns: 
+            The gates' current positions in QuantumCircuit.data, descending, 
+            so deleting them in order keeps the remaining ones valid. 
 
+        """
+        data_idxs = [self.data_idxs.pop(gate_id) for gate_id in gate_ids]
+        # Positions are taken before any of the batch is marked deleted 
+        positions = [data_idx - self._deleted_before(data_idx) for data_idx in data_idxs]
+        for data_idx in data_idxs: 
+            self._mark_deleted(data_idx)
+        return sorted(positions, reverse=True) 
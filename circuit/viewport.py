@@ -0,0 +1,138 @@
+import numpy as np
+
+
+def camera_frame(camera):
+    """
+    Region of the scene currently shown by `camera`.
+
+    Works for the Cairo Camera, MovingCamera (whose frame is a mobject)
+    and the OpenGLCamera (which is itself a mobject).
+
+    Returns:
+        (center, width, height) in manim-space.
+
+    """
+    frame = getattr(camera, 'frame', camera)
+    if hasattr(frame, 'get_center'):
+        return frame.get_center(), frame.width, frame.height
+    return np.asarray(camera.frame_center), camera.frame_width, camera.frame_height
+
+
+def event_to_manim(point, camera, reference_height=None):
+    """
+    Maps the `point` of a mouse event, as passed to Scene.on_mouse_press,
+    to manim-space under the camera's current frame.
+
+    The OpenGL renderer converts event pixels relative to the camera
+    center, but always at config.frame_height per window height, so the
+    point is off once the camera zooms. Rescaling its offset from the
+    center by the frame's actual height corrects that. Pure arithmetic
+    on the event: no OS cursor or window queries, so synthetic events
+    map the same headlessly.
+
+    Args:
+        point (np.ndarray): Event point from the renderer.
+        camera: Scene camera, any camera `camera_frame` accepts.
+        reference_height (float): Frame height the renderer mapped pixels
+                                  at, config.frame_height by default.
+
+    Returns:
+        (x_manim, y_manim)
+
+    """
+    if reference_height is None:
+        from manim import config
+        reference_height = config.frame_height
+
+    center, _, height = camera_frame(camera)
+    zoom = height / reference_height
+
+    x_manim = center[0] + (point[0] - center[0]) * zoom
+    y_manim = center[1] + (point[1] - center[1]) * zoom
+    return x_manim, y_manim
+
+
+class ColumnViewport:
+    """
+    Keeps only the layout columns near the camera materialised.
+
+    Columns are given by their horizontal extents, sorted left to right,
+    so the columns overlapping a window are found with two binary
+    searches. Whenever the window changes, columns that scrolled into
+    it are handed to `materialize` and columns that left it to `evict`,
+    together with whatever `materialize` returned for them.
+
+    """
+
+    def __init__(self, lefts, rights, materialize, evict):
+        """
+        Args:
+            lefts, rights (np.ndarray): Left/right x of every column, ascending.
+            materialize (callable): column -> payload, i.e. builds its mobjects.
+            evict (callable): (column, payload) -> None, i.e. removes them.
+
+        """
+        self.lefts = np.asarray(lefts)
+        self.rights = np.asarray(rights)
+        self.materialize = materialize
+        self.evict = evict
+
+        # column -> payload returned by materialize
+        self.columns = {}
+        # [lo, hi) range of materialised columns
+        self.window = (0, 0)
+
+    def __len__(self):
+        return len(self.lefts)
+
+    def extend(self, lefts, rights):
+        """
+        Appends columns to the right, i.e. while a circuit is streamed in.
+        They are materialised on the next `update` that covers them.
+
+        """
+        self.lefts = np.concatenate((self.lefts, lefts))
+        self.rights = np.concatenate((self.rights, rights))
+        return
+
+    def visible(self, x_min, x_max):
+        """
+        [lo, hi) range of columns overlapping [x_min, x_max].
+
+        """
+        lo = int(np.searchsorted(self.rights, x_min, side='left'))
+        hi = int(np.searchsorted(self.lefts, x_max, side='right'))
+        return lo, max(lo, hi)
+
+    def update(self, x_min, x_max):
+        """
+        Materialises the columns overlapping [x_min, x_max] and evicts
+        the rest. Does nothing if the same columns are already shown.
+
+        Returns:
+            True if any column was materialised or evicted.
+
+        """
+        lo, hi = self.visible(x_min, x_max)
+        if (lo, hi) == self.window:
+            return False
+
+        for column in [column for column in self.columns if not lo <= column < hi]:
+            self.evict(column, self.columns.pop(column))
+        for column in range(lo, hi):
+            if column not in self.columns:
+                self.columns[column] = self.materialize(column)
+
+        self.window = (lo, hi)
+        return True
+
+    def clear(self):
+        """
+        Evicts every materialised column.
+
+        """
+        for column, payload in self.columns.items():
+            self.evict(column, payload)
+        self.columns.clear()
+        self.window = (0, 0)
+        return